@@ -216,16 +216,16 @@ class APIStatesView(HomeAssistantView):
         user: User = request[KEY_HASS_USER]
         hass = request.app[KEY_HASS]
         if user.is_admin:
-            states = (state.as_dict_json for state in hass.states.async_all())
+            states = hass.states.async_all_json()
         else:
             entity_perm = user.permissions.check_entity
-            states = (
+            states = b",".join(
                 state.as_dict_json
                 for state in hass.states.async_all()
                 if entity_perm(state.entity_id, "read")
             )
         response = web.Response(
-            body=b"".join((b"[", b",".join(states), b"]")),
+            body=b"".join((b"[", states, b"]")),
             content_type=CONTENT_TYPE_JSON,
             zlib_executor_size=32768,
         )
@@ -157,7 +157,7 @@ async def ws_get_history_during_period(
     minimal_response = msg["minimal_response"]
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -280,7 +280,7 @@ async def _async_send_historical_states(
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
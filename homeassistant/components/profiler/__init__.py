@@ -40,6 +40,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_SET_LOOP_STATS = "set_loop_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,6 +64,7 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_SET_LOOP_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -273,6 +275,13 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_loop_stats(call: ServiceCall) -> None:
+        """Start or stop collecting the loop stats."""
+        if call.data[CONF_ENABLED]:
+            hass.loop_stats.async_start()
+        else:
+            hass.loop_stats.async_stop()
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +391,14 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_SET_LOOP_STATS,
+        _async_loop_stats,
+        schema=vol.Schema({vol.Optional(CONF_ENABLED, default=True): cv.boolean}),
+    )
+
     return True
 
 
@@ -391,6 +408,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    hass.loop_stats.async_stop()
     hass.data.pop(DOMAIN)
     return True
 
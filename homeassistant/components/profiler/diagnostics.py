@@ -0,0 +1,23 @@
+"""Diagnostics support for Profiler."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_polling_scheduler
+from homeassistant.helpers.template import async_get_template_render_stats
+from homeassistant.helpers.update_executor import async_get_update_executor
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    return {
+        "loop_stats": hass.loop_stats.as_dict(),
+        "template_stats": async_get_template_render_stats(hass).as_dict(),
+        "polling_stats": async_get_polling_scheduler(hass).as_dict(),
+        "update_executor_stats": async_get_update_executor(hass).as_dict(),
+    }
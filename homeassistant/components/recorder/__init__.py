@@ -38,6 +38,7 @@ from .const import (  # noqa: F401
     SupportedDialect,
 )
 from .core import Recorder
+from .purge import DEFAULT_PURGE_MAX_DURATION
 from .services import async_register_services
 from .tasks import AddRecorderPlatformTask
 from .util import get_instance
@@ -59,6 +60,7 @@ CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_MAX_DURATION = "purge_max_duration"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
@@ -100,6 +102,9 @@ CONFIG_SCHEMA = vol.Schema(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(
+                        CONF_PURGE_MAX_DURATION, default=DEFAULT_PURGE_MAX_DURATION
+                    ): cv.positive_float,
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
@@ -139,6 +144,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
+    purge_max_duration = conf[CONF_PURGE_MAX_DURATION]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
@@ -157,6 +163,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_purge=auto_purge,
         auto_repack=auto_repack,
         keep_days=keep_days,
+        purge_max_duration=purge_max_duration,
         commit_interval=commit_interval,
         uri=db_url,
         db_max_retries=db_max_retries,
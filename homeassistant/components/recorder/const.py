@@ -45,12 +45,14 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
 ATTR_KEEP_DAYS = "keep_days"
 ATTR_REPACK = "repack"
 ATTR_APPLY_FILTER = "apply_filter"
+ATTR_MAX_DURATION = "max_duration"
 
 KEEPALIVE_TIME = 30
 
@@ -59,6 +61,7 @@ CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
 LAST_REPORTED_SCHEMA_VERSION = 43
+STATISTICS_ROLLUPS_SCHEMA_VERSION = 45
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
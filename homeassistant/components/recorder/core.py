@@ -29,7 +29,6 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_CLOSE,
     EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_STATE_CHANGED,
-    MATCH_ALL,
 )
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -51,6 +50,7 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -79,18 +79,22 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.hot_cache import HotHistoryCache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
     EventsContextIDMigration,
     EventTypeIDMigration,
     StatesContextIDMigration,
+    StatisticsRollupsMigration,
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
+from .table_managers.events import EventsManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
 from .table_managers.states import StatesManager
@@ -108,6 +112,7 @@ from .tasks import (
     KeepAliveTask,
     PerodicCleanupTask,
     PurgeTask,
+    RebuildStatisticsRollupsTask,
     RecorderTask,
     StatisticsTask,
     StopTask,
@@ -121,6 +126,7 @@ from .util import (
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
+    execute_on_connection,
     execute_stmt_lambda_element,
     is_second_sunday,
     move_away_broken_database,
@@ -153,8 +159,12 @@ QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
+# History, logbook and statistics queries run on their own read executor
+# so they do not have to wait behind other database jobs
+MAX_DB_READ_EXECUTOR_WORKERS = 4
+
 # Pool size must accommodate Recorder thread + All db executors
-MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1 - MAX_DB_READ_EXECUTOR_WORKERS
 
 
 class Recorder(threading.Thread):
@@ -168,6 +178,7 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         auto_repack: bool,
         keep_days: int,
+        purge_max_duration: float,
         commit_interval: int,
         uri: str,
         db_max_retries: int,
@@ -184,10 +195,13 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_max_duration = purge_max_duration
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
-        self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
+        self._queue: queue.SimpleQueue[RecorderTask | Event | list[Event]] = (
+            queue.SimpleQueue()
+        )
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
@@ -218,6 +232,8 @@ class Recorder(threading.Thread):
         self.states_manager = StatesManager()
         self.event_data_manager = EventDataManager(self)
         self.event_type_manager = EventTypeManager(self)
+        self.events_manager = EventsManager()
+        self.hot_history_cache = HotHistoryCache()
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
@@ -229,8 +245,11 @@ class Recorder(threading.Thread):
         self.migration_in_progress = False
         self.migration_is_live = False
         self.use_legacy_events_index = False
+        self.statistics_rollups_active = False
+        self.purge_progress: PurgeProgress | None = None
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -293,6 +312,12 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_READ_WORKER_PREFIX,
+            max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -306,37 +331,43 @@ class Recorder(threading.Thread):
         exclude_event_types = self.exclude_event_types
         queue_put = self._queue.put_nowait
 
-        @callback
-        def _event_listener(event: Event) -> None:
-            """Listen for new events and put them in the process queue."""
+        def _should_record(event: Event) -> bool:
+            """Return if an event should be recorded."""
             if event.event_type in exclude_event_types:
-                return
+                return False
 
             if entity_filter is None or not (
                 entity_id := event.data.get(ATTR_ENTITY_ID)
             ):
-                queue_put(event)
-                return
+                return True
 
             if isinstance(entity_id, str):
-                if entity_filter(entity_id):
-                    queue_put(event)
-                return
+                return entity_filter(entity_id)
 
             if isinstance(entity_id, list):
-                for eid in entity_id:
-                    if entity_filter(eid):
-                        queue_put(event)
-                        return
-                return
+                return any(entity_filter(eid) for eid in entity_id)
 
             # Unknown what it is.
-            queue_put(event)
+            return True
 
-        self._event_listener = self.hass.bus.async_listen(
-            MATCH_ALL,
-            _event_listener,
-        )
+        @callback
+        def _event_listener(events: list[Event]) -> None:
+            """Listen for new events and put them in the process queue.
+
+            A batch of events, like the state changes of a state machine
+            batch, is queued as one list.
+            """
+            if len(events) == 1:
+                if _should_record(event := events[0]):
+                    queue_put(event)
+                return
+            recorded = [event for event in events if _should_record(event)]
+            if len(recorded) > 1:
+                queue_put(recorded)
+            elif recorded:
+                queue_put(recorded[0])
+
+        self._event_listener = self.hass.bus.async_listen_batch(_event_listener)
         self._queue_watcher = async_track_time_interval(
             self.hass,
             self._async_check_queue,
@@ -367,8 +398,23 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    @callback
+    def async_add_read_executor_job[_T](
+        self, target: Callable[..., _T], *args: Any
+    ) -> asyncio.Future[_T]:
+        """Add a read only executor job from within the event loop.
+
+        Used for history, logbook and statistics queries. When the
+        database is a SQLite file the connections of the read workers
+        are opened with query_only so they can never take the write lock.
+        """
+        return self.hass.loop.run_in_executor(self._db_read_executor, target, *args)
+
     def _stop_executor(self) -> None:
-        """Stop the executor."""
+        """Stop the executors."""
+        if self._db_read_executor is not None:
+            self._db_read_executor.shutdown()
+            self._db_read_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -533,7 +579,14 @@ class Recorder(threading.Thread):
             # until after the database is vacuumed
             repack = self.auto_repack and is_second_sunday(now)
             purge_before = dt_util.utcnow() - timedelta(days=self.keep_days)
-            self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
+            self.queue_task(
+                PurgeTask(
+                    purge_before,
+                    repack=repack,
+                    apply_filter=False,
+                    max_duration=self.purge_max_duration,
+                )
+            )
         else:
             self.queue_task(PerodicCleanupTask())
 
@@ -632,6 +685,13 @@ class Recorder(threading.Thread):
         """Schedule import of statistics."""
         self.queue_task(ImportStatisticsTask(metadata, stats, table))
 
+    def queue_statistics_rollups_rebuild(self, metadata_ids: set[int]) -> None:
+        """Schedule a rebuild of the statistics rollups for metadata_ids.
+
+        This method is thread-safe.
+        """
+        self.queue_task(RebuildStatisticsRollupsTask(metadata_ids))
+
     @callback
     def _async_setup_periodic_tasks(self) -> None:
         """Prepare periodic tasks."""
@@ -705,6 +765,16 @@ class Recorder(threading.Thread):
         self._event_session_has_pending_writes = True
         session.add(obj)
 
+    def _add_pending_event(self, dbevent: Events) -> None:
+        """Add an event to be inserted when the session is committed."""
+        self._event_session_has_pending_writes = True
+        self.events_manager.add_pending(dbevent)
+
+    def _add_pending_state(self, dbstate: States) -> None:
+        """Add a state to be inserted when the session is committed."""
+        self._event_session_has_pending_writes = True
+        self.states_manager.add_pending_insert(dbstate)
+
     def _notify_migration_failed(self) -> None:
         """Notify the user schema migration failed."""
         persistent_notification.create(
@@ -820,6 +890,7 @@ class Recorder(threading.Thread):
                 EventTypeIDMigration,
                 EntityIDMigration,
                 EventIDPostMigration,
+                StatisticsRollupsMigration,
             ):
                 migrator = migrator_cls(schema_status.start_version, migration_changes)
                 migrator.do_migrate(self, session)
@@ -837,7 +908,7 @@ class Recorder(threading.Thread):
         # with a commit every time the event time
         # has changed. This reduces the disk io.
         queue_ = self._queue
-        startup_task_or_events: list[RecorderTask | Event] = []
+        startup_task_or_events: list[RecorderTask | Event | list[Event]] = []
         while not queue_.empty() and (task_or_event := queue_.get_nowait()):
             startup_task_or_events.append(task_or_event)
         self._pre_process_startup_events(startup_task_or_events)
@@ -853,7 +924,7 @@ class Recorder(threading.Thread):
             self._guarded_process_one_task_or_event_or_recover(queue_.get())
 
     def _pre_process_startup_events(
-        self, startup_task_or_events: list[RecorderTask | Event[Any]]
+        self, startup_task_or_events: list[RecorderTask | Event[Any] | list[Event[Any]]]
     ) -> None:
         """Pre process startup events."""
         # Prime all the state_attributes and event_data caches
@@ -865,7 +936,12 @@ class Recorder(threading.Thread):
             # Event is never subclassed so we can
             # use a fast type check
             if type(task_or_event) is Event:
-                event_ = task_or_event
+                events: list[Event] = [task_or_event]
+            elif type(task_or_event) is list:
+                events = task_or_event
+            else:
+                continue
+            for event_ in events:
                 if event_.event_type == EVENT_STATE_CHANGED:
                     state_change_events.append(event_)
                 else:
@@ -879,9 +955,17 @@ class Recorder(threading.Thread):
         self.state_attributes_manager.load(state_change_events, session)
 
     def _guarded_process_one_task_or_event_or_recover(
-        self, task: RecorderTask | Event
+        self, task: RecorderTask | Event | list[Event]
     ) -> None:
         """Process a task, guarding against exceptions to ensure the loop does not collapse."""
+        if type(task) is list:
+            # A batch of events is processed one event at a time
+            # so an error only drops the event that caused it
+            for event in task:
+                self._guarded_process_one_task_or_event_or_recover(event)
+            return
+        if TYPE_CHECKING:
+            assert not isinstance(task, list)
         _LOGGER.debug("Processing task: %s", task)
         try:
             self._process_one_task_or_event_or_recover(task)
@@ -1066,7 +1150,7 @@ class Recorder(threading.Thread):
             dbevent.event_type_rel = event_types
 
         if not event.data:
-            self._add_to_session(session, dbevent)
+            self._add_pending_event(dbevent)
             return
 
         event_data_manager = self.event_data_manager
@@ -1091,7 +1175,7 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbevent_data)
             dbevent.event_data_rel = dbevent_data
 
-        self._add_to_session(session, dbevent)
+        self._add_pending_event(dbevent)
 
     def _process_state_changed_event_into_session(
         self, event: Event[EventStateChangedData]
@@ -1146,7 +1230,6 @@ class Recorder(threading.Thread):
         else:
             states_meta = StatesMeta(entity_id=entity_id)
             states_meta_manager.add_pending(states_meta)
-            self._add_to_session(session, states_meta)
             dbstate.states_meta_rel = states_meta
 
         # Map the event data to the StateAttributes table
@@ -1171,10 +1254,10 @@ class Recorder(threading.Thread):
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
             state_attributes_manager.add_pending(dbstate_attributes)
-            self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        self._add_pending_state(dbstate)
+        self.hot_history_cache.add(entity_id, dbstate)
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1237,6 +1320,10 @@ class Recorder(threading.Thread):
                         for state_id, last_reported_timestamp in pending_last_reported.items()
                     ],
                 )
+        self.states_meta_manager.insert_pending(session)
+        self.state_attributes_manager.insert_pending(session)
+        self.states_manager.insert_pending(session)
+        self.events_manager.insert_pending(session)
         session.commit()
 
         self._event_session_has_pending_writes = False
@@ -1245,6 +1332,7 @@ class Recorder(threading.Thread):
         # many selects for matching attributes by loading them
         # into the LRU or committed now.
         self.states_manager.post_commit_pending()
+        self.events_manager.post_commit_pending()
         self.state_attributes_manager.post_commit_pending()
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
@@ -1272,11 +1360,13 @@ class Recorder(threading.Thread):
     def _close_event_session(self) -> None:
         """Close the event session."""
         self.states_manager.reset()
+        self.events_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.hot_history_cache.clear()
 
         if not self.event_session:
             return
@@ -1398,6 +1488,10 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if self._using_file_sqlite and threading.current_thread().name.startswith(
+            DB_READ_WORKER_PREFIX
+        ):
+            execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
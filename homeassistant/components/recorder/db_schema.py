@@ -77,7 +77,7 @@ class LegacyBase(DeclarativeBase):
     """Base class for tables, used for schema migration."""
 
 
-SCHEMA_VERSION = 44
+SCHEMA_VERSION = 45
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -93,6 +93,8 @@ TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATISTICS_DAILY = "statistics_daily"
+TABLE_STATISTICS_MONTHLY = "statistics_monthly"
 TABLE_MIGRATION_CHANGES = "migration_changes"
 
 STATISTICS_TABLES = ("statistics", "statistics_short_term")
@@ -116,6 +118,8 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATISTICS_DAILY,
+    TABLE_STATISTICS_MONTHLY,
 ]
 
 TABLES_TO_CHECK = [
@@ -769,6 +773,53 @@ class StatisticsShortTerm(Base, _StatisticsShortTerm):
     )
 
 
+class StatisticsRollupBase(StatisticsBase):
+    """Statistics rollup base class.
+
+    Rollups are long term statistics combined per day or month in the
+    configured time zone, the mean weight is the number of hourly means
+    the mean was computed from.
+    """
+
+    mean_weight: Mapped[int | None] = mapped_column(Integer)
+
+
+class StatisticsDaily(Base, StatisticsRollupBase):
+    """Long term statistics rolled up per day."""
+
+    duration = timedelta(days=1)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_daily_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_DAILY
+
+
+class StatisticsMonthly(Base, StatisticsRollupBase):
+    """Long term statistics rolled up per month."""
+
+    duration = timedelta(days=31)
+
+    __table_args__ = (
+        # Used for fetching statistics for a certain entity at a specific time
+        Index(
+            "ix_statistics_monthly_statistic_id_start_ts",
+            "metadata_id",
+            "start_ts",
+            unique=True,
+        ),
+        _DEFAULT_TABLE_ARGS,
+    )
+    __tablename__ = TABLE_STATISTICS_MONTHLY
+
+
 class LegacyStatisticsShortTerm(LegacyBase, _StatisticsShortTerm):
     """Short term statistics with 32-bit index, used for schema migration."""
 
@@ -0,0 +1,244 @@
+"""In-memory cache of recently recorded states for history queries."""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from datetime import timedelta
+import math
+import threading
+from typing import Any, NamedTuple
+
+from homeassistant.core import split_entity_id
+
+from ..db_schema import States
+from .const import SIGNIFICANT_DOMAINS
+
+# How far back the cache keeps states for each entity
+HOT_HISTORY_WINDOW = timedelta(hours=24)
+
+# Memory budget of the cache in rows. Each row costs three 8 byte
+# columns plus a reference to the (usually shared) state string.
+HOT_HISTORY_MAX_ROWS = 250_000
+
+_NO_LAST_CHANGED = math.nan
+
+
+class _StateRow(NamedTuple):
+    """A cached state row shaped like a states query row."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+
+
+class _StateRowWithLastChanged(NamedTuple):
+    """A cached state row shaped like a states query row with last_changed_ts."""
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+
+
+class _EntityColumns:
+    """Columns of recorded states for a single entity."""
+
+    __slots__ = ("last_updated_ts", "last_changed_ts", "states")
+
+    def __init__(self) -> None:
+        """Initialize the columns."""
+        self.last_updated_ts = array("d")
+        self.last_changed_ts = array("d")
+        self.states: list[str | None] = []
+
+    def append(
+        self, state: str | None, last_updated_ts: float, last_changed_ts: float | None
+    ) -> None:
+        """Append a state."""
+        self.last_updated_ts.append(last_updated_ts)
+        self.last_changed_ts.append(
+            _NO_LAST_CHANGED if last_changed_ts is None else last_changed_ts
+        )
+        self.states.append(state)
+
+    def trim(self, count: int) -> None:
+        """Drop the oldest count states."""
+        del self.last_updated_ts[:count]
+        del self.last_changed_ts[:count]
+        del self.states[:count]
+
+
+class HotHistoryCache:
+    """Cache the states the recorder writes so recent history can skip the database.
+
+    The recorder thread appends every state it adds to the session, so for
+    each entity the cache holds every recorded state since its oldest row.
+    A query can be answered from the cache when it starts after the oldest
+    row of an entity, which also provides the state at the start time.
+
+    Rows older than the window are dropped, keeping the newest of them as
+    the start state. When the cache is over its row budget the oldest half
+    of the largest entity is evicted.
+    """
+
+    def __init__(
+        self,
+        window: timedelta = HOT_HISTORY_WINDOW,
+        max_rows: int = HOT_HISTORY_MAX_ROWS,
+    ) -> None:
+        """Initialize the hot history cache."""
+        self._window = window.total_seconds()
+        self._max_rows = max_rows
+        self._rows = 0
+        self._entities: dict[str, _EntityColumns] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def rows(self) -> int:
+        """Return the number of cached rows."""
+        return self._rows
+
+    def add(self, entity_id: str, dbstate: States) -> None:
+        """Add a state that was added to the session.
+
+        This call must be called from the recorder thread.
+        """
+        last_updated_ts = dbstate.last_updated_ts
+        if last_updated_ts is None:
+            return
+        with self._lock:
+            if (columns := self._entities.get(entity_id)) is None:
+                columns = self._entities[entity_id] = _EntityColumns()
+            elif columns.last_updated_ts[-1] > last_updated_ts:
+                # States must stay in order, start over for this entity
+                self._rows -= len(columns.states)
+                columns = self._entities[entity_id] = _EntityColumns()
+            columns.append(dbstate.state, last_updated_ts, dbstate.last_changed_ts)
+            self._rows += 1
+            # Keep the newest state before the window as the start state
+            cutoff = last_updated_ts - self._window
+            if (expired := bisect_left(columns.last_updated_ts, cutoff) - 1) > 0:
+                columns.trim(expired)
+                self._rows -= expired
+            if self._rows > self._max_rows:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Evict rows until the cache is within its budget."""
+        entities = self._entities
+        while self._rows > self._max_rows:
+            entity_id = max(entities, key=lambda key: len(entities[key].states))
+            columns = entities[entity_id]
+            if (count := len(columns.states)) <= 1:
+                del entities[entity_id]
+                self._rows -= count
+                continue
+            columns.trim(count // 2)
+            self._rows -= count // 2
+
+    def evict_before(self, timestamp: float) -> None:
+        """Evict all states before a timestamp after they have been purged."""
+        with self._lock:
+            for entity_id, columns in list(self._entities.items()):
+                if not (expired := bisect_left(columns.last_updated_ts, timestamp)):
+                    continue
+                self._rows -= expired
+                if expired == len(columns.states):
+                    del self._entities[entity_id]
+                else:
+                    columns.trim(expired)
+
+    def evict_entities(self, entity_filter: Callable[[str], bool]) -> None:
+        """Evict all states of the entities matching the filter."""
+        with self._lock:
+            for entity_id in [
+                entity_id for entity_id in self._entities if entity_filter(entity_id)
+            ]:
+                self._rows -= len(self._entities.pop(entity_id).states)
+
+    def clear(self) -> None:
+        """Clear the cache after pending states may have been lost."""
+        with self._lock:
+            self._entities.clear()
+            self._rows = 0
+
+    def get_significant_states_rows(
+        self,
+        entity_id_to_metadata_id: dict[str, int | None],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        significant_changes_only: bool,
+        include_start_time_state: bool,
+    ) -> tuple[list[int], list[_StateRow] | list[_StateRowWithLastChanged]]:
+        """Return the rows for the entities the cache covers.
+
+        The rows match what the significant states query selects when
+        attributes are not requested, sorted by metadata_id and
+        last_updated_ts. The metadata_ids of the entities that are not
+        covered are returned so they can be fetched from the database.
+        """
+        include_last_changed = not significant_changes_only
+        uncached_metadata_ids: list[int] = []
+        rows: list[Any] = []
+        with self._lock:
+            for entity_id, metadata_id in sorted(
+                entity_id_to_metadata_id.items(),
+                key=lambda item: item[1] or 0,
+            ):
+                if metadata_id is None:
+                    continue
+                if (
+                    columns := self._entities.get(entity_id)
+                ) is None or columns.last_updated_ts[0] >= start_time_ts:
+                    uncached_metadata_ids.append(metadata_id)
+                    continue
+                last_updated = columns.last_updated_ts
+                states = columns.states
+                start = bisect_right(last_updated, start_time_ts)
+                end = (
+                    bisect_left(last_updated, end_time_ts, start)
+                    if end_time_ts
+                    else len(states)
+                )
+                if include_start_time_state:
+                    # Same as the start time state query which uses 0 as
+                    # the timestamp so the start time is used instead
+                    start_state = states[bisect_left(last_updated, start_time_ts) - 1]
+                    rows.append(
+                        _StateRowWithLastChanged(metadata_id, start_state, 0, 0)
+                        if include_last_changed
+                        else _StateRow(metadata_id, start_state, 0)
+                    )
+                if include_last_changed:
+                    last_changed = columns.last_changed_ts
+                    rows.extend(
+                        _StateRowWithLastChanged(
+                            metadata_id,
+                            states[idx],
+                            last_updated[idx],
+                            None
+                            if math.isnan(last_changed[idx])
+                            else last_changed[idx],
+                        )
+                        for idx in range(start, end)
+                    )
+                    continue
+                if split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS:
+                    rows.extend(
+                        _StateRow(metadata_id, states[idx], last_updated[idx])
+                        for idx in range(start, end)
+                    )
+                    continue
+                # Only state changes are significant which are the rows
+                # where last_changed_ts is stored as NULL or equals
+                # last_updated_ts
+                last_changed = columns.last_changed_ts
+                rows.extend(
+                    _StateRow(metadata_id, states[idx], last_updated[idx])
+                    for idx in range(start, end)
+                    if math.isnan(last_changed[idx])
+                    or last_changed[idx] == last_updated[idx]
+                )
+        return uncached_metadata_ids, rows
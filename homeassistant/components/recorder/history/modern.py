@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator
 from datetime import datetime
+from heapq import merge
 from itertools import groupby
 from operator import itemgetter
 from typing import Any, cast
@@ -253,30 +254,49 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
-    single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
-        lambda: _significant_states_stmt(
+    states: Iterable[Any] = ()
+    if no_attributes:
+        # The hot history cache does not keep attributes
+        metadata_ids, states = instance.hot_history_cache.get_significant_states_rows(
+            entity_id_to_metadata_id,
             start_time_ts,
             end_time_ts,
-            single_metadata_id,
-            metadata_ids,
-            metadata_ids_in_significant_domains,
             significant_changes_only,
-            no_attributes,
-            include_start_time_state,
-            run_start_ts,
-        ),
-        track_on=[
-            bool(single_metadata_id),
-            bool(metadata_ids_in_significant_domains),
-            bool(end_time_ts),
-            significant_changes_only,
-            no_attributes,
             include_start_time_state,
-        ],
-    )
+        )
+    if metadata_ids:
+        single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+        stmt = lambda_stmt(
+            lambda: _significant_states_stmt(
+                start_time_ts,
+                end_time_ts,
+                single_metadata_id,
+                metadata_ids,
+                metadata_ids_in_significant_domains,
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+                run_start_ts,
+            ),
+            track_on=[
+                bool(single_metadata_id),
+                bool(metadata_ids_in_significant_domains),
+                bool(end_time_ts),
+                significant_changes_only,
+                no_attributes,
+                include_start_time_state,
+            ],
+        )
+        db_states = execute_stmt_lambda_element(
+            session, stmt, None, end_time, orm_rows=False
+        )
+        states = (
+            merge(db_states, states, key=itemgetter(_FIELD_MAP["metadata_id"]))
+            if states
+            else db_states
+        )
     return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
+        states,
         start_time_ts if include_start_time_state else None,
         entity_ids,
         entity_id_to_metadata_id,
@@ -54,6 +54,7 @@ from .const import (
     EVENT_TYPE_IDS_SCHEMA_VERSION,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     STATES_META_SCHEMA_VERSION,
+    STATISTICS_ROLLUPS_SCHEMA_VERSION,
     SupportedDialect,
 )
 from .db_schema import (
@@ -76,7 +77,9 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
     StatisticsMeta,
+    StatisticsMonthly,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -90,17 +93,19 @@ from .queries import (
     find_event_type_to_migrate,
     find_events_context_ids_to_migrate,
     find_states_context_ids_to_migrate,
+    find_statistics_rollups_to_build,
     find_unmigrated_short_term_statistics_rows,
     find_unmigrated_statistics_rows,
     has_entity_ids_to_migrate,
     has_event_type_to_migrate,
     has_events_context_ids_to_migrate,
     has_states_context_ids_to_migrate,
+    has_statistics_rollups_to_build,
     has_used_states_event_ids,
     migrate_single_short_term_statistics_row_to_timestamp,
     migrate_single_statistics_row_to_timestamp,
 )
-from .statistics import get_start_time
+from .statistics import get_start_time, rebuild_statistics_rollups
 from .tasks import (
     CommitTask,
     EntityIDPostMigrationTask,
@@ -124,6 +129,10 @@ if TYPE_CHECKING:
 # Schema version 42 was introduced in HA Core 2023.11
 LIVE_MIGRATION_MIN_SCHEMA_VERSION = 42
 
+# Number of statistics to build the rollups for in each migration task,
+# each statistic can have years of hourly statistics.
+STATISTICS_ROLLUPS_BUILD_BATCH_SIZE = 10
+
 MIGRATION_NOTE_OFFLINE = (
     "Note: this may take several hours on large databases and slow machines. "
     "Home Assistant will not start until the upgrade is completed. Please be patient "
@@ -1524,6 +1533,18 @@ class _SchemaVersion44Migrator(_SchemaVersionMigrator, target_version=44):
         )
 
 
+class _SchemaVersion45Migrator(_SchemaVersionMigrator, target_version=45):
+    def _apply_update(self) -> None:
+        """Version specific update method."""
+        # Create the statistics rollup tables, they are filled by
+        # the StatisticsRollupsMigration once the schema is migrated.
+        #
+        # We need to cast __table__ to Table, explanation in
+        # https://github.com/sqlalchemy/sqlalchemy/issues/9130
+        cast(Table, StatisticsDaily.__table__).create(self.engine, checkfirst=True)
+        cast(Table, StatisticsMonthly.__table__).create(self.engine, checkfirst=True)
+
+
 def _migrate_statistics_columns_to_timestamp_removing_duplicates(
     hass: HomeAssistant,
     instance: Recorder,
@@ -2460,6 +2481,46 @@ class EventIDPostMigration(BaseRunTimeMigration):
         return NeedsMigrateResult(needs_migrate=False, migration_done=True)
 
 
+class StatisticsRollupsMigration(BaseRunTimeMigrationWithQuery):
+    """Migration to build the daily and monthly statistics rollups."""
+
+    required_schema_version = STATISTICS_ROLLUPS_SCHEMA_VERSION
+    migration_id = "statistics_rollups"
+
+    @staticmethod
+    @retryable_database_job("build statistics rollups")
+    def migrate_data(instance: Recorder) -> bool:
+        """Build the statistics rollups, return True if completed."""
+        _LOGGER.debug("Building statistics rollups")
+        with session_scope(session=instance.get_session()) as session:
+            if metadata_ids := [
+                metadata_id
+                for (metadata_id,) in session.execute(
+                    find_statistics_rollups_to_build(
+                        STATISTICS_ROLLUPS_BUILD_BATCH_SIZE
+                    )
+                )
+            ]:
+                rebuild_statistics_rollups(session, metadata_ids)
+
+            # If there is more work to do return False
+            # so that we can be called again
+            if is_done := not metadata_ids:
+                _mark_migration_done(session, StatisticsRollupsMigration)
+
+        _LOGGER.debug("Building statistics rollups done=%s", is_done)
+        return is_done
+
+    def migration_done(self, instance: Recorder, session: Session | None) -> None:
+        """Will be called after migrate returns True."""
+        _LOGGER.debug("Activating statistics rollups as all data is migrated")
+        instance.statistics_rollups_active = True
+
+    def needs_migrate_query(self) -> StatementLambdaElement:
+        """Check if the data is migrated."""
+        return has_statistics_rollups_to_build()
+
+
 def _mark_migration_done(
     session: Session, migration: type[BaseRunTimeMigration]
 ) -> None:
@@ -89,6 +89,13 @@ class LazyState(State):
             self._last_reported_ts or self._last_updated_ts  # type: ignore[arg-type]
         )
 
+    @property
+    def last_updated_timestamp(self) -> float:  # type: ignore[override]
+        """Last updated timestamp."""
+        if TYPE_CHECKING:
+            assert self._last_updated_ts is not None
+        return self._last_updated_ts
+
     @cached_property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Last updated datetime."""
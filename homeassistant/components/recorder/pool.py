@@ -25,7 +25,7 @@ _LOGGER = logging.getLogger(__name__)
 DEBUG_MUTEX_POOL = True
 DEBUG_MUTEX_POOL_TRACE = False
 
-POOL_SIZE = 5
+POOL_SIZE = 9
 
 ADVISE_MSG = (
     "Use homeassistant.components.recorder.get_instance(hass).async_add_executor_job()"
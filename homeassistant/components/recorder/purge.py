@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from itertools import zip_longest
 import logging
@@ -37,6 +38,10 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_min_event_id,
+    find_min_state_id,
+    find_newest_event_id_to_purge,
+    find_newest_state_id_to_purge,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -52,6 +57,31 @@ _LOGGER = logging.getLogger(__name__)
 
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
+# Seconds a purge keeps deleting batches in one transaction before it
+# commits and requeues itself behind the pending writes
+DEFAULT_PURGE_MAX_DURATION = 2
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of purging the states and events before a point in time."""
+
+    purge_before: datetime
+    rows_to_purge: int
+    rows_purged: int = 0
+    started: float = field(default_factory=time.monotonic)
+    finished: float | None = None
+
+    @property
+    def rows_remaining(self) -> int:
+        """Return the estimated number of rows remaining."""
+        return max(self.rows_to_purge - self.rows_purged, 0)
+
+    @property
+    def rate(self) -> float:
+        """Return the rows purged per second."""
+        elapsed = (self.finished or time.monotonic()) - self.started
+        return self.rows_purged / elapsed if elapsed > 0 else 0.0
 
 
 @retryable_database_job("purge")
@@ -62,15 +92,63 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    max_duration: float = DEFAULT_PURGE_MAX_DURATION,
 ) -> bool:
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    The states and events are deleted oldest first in batches. Once
+    max_duration has passed no new batch is started so the transaction
+    is committed and the pending writes can be recorded before the
+    purge continues.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    progress = instance.purge_progress
+    if (
+        progress is None
+        or progress.finished is not None
+        or progress.purge_before != purge_before
+    ):
+        with session_scope(session=instance.get_session(), read_only=True) as session:
+            progress = instance.purge_progress = _start_purge_progress(
+                session, purge_before
+            )
+    requeue = False
+    try:
+        requeue = not _purge_old_data(
+            instance,
+            purge_before,
+            apply_filter,
+            events_batch_size,
+            states_batch_size,
+            time.monotonic() + max_duration,
+            progress,
+        )
+    finally:
+        # A failed purge is finished too, the next one starts over
+        if not requeue:
+            progress.finished = time.monotonic()
+    if requeue:
+        return False
+    if repack:
+        repack_database(instance)
+    return True
+
+
+def _purge_old_data(
+    instance: Recorder,
+    purge_before: datetime,
+    apply_filter: bool,
+    events_batch_size: int,
+    states_batch_size: int,
+    deadline: float,
+    progress: PurgeProgress,
+) -> bool:
+    """Purge events and states older than purge_before in one transaction."""
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -79,7 +157,9 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, purge_before, progress
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,10 +167,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress, deadline
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress, deadline
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -123,18 +203,44 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
-    if repack:
-        repack_database(instance)
     return True
 
 
+def _start_purge_progress(session: Session, purge_before: datetime) -> PurgeProgress:
+    """Start tracking a purge with an estimate of the rows it will delete.
+
+    Counting the rows would scan all of them, instead the rows are
+    estimated from the range of ids between the oldest row and the
+    newest row to purge. Rows already deleted in that range make the
+    estimate too high.
+    """
+    purge_before_ts = purge_before.timestamp()
+    rows_to_purge = 0
+    for find_min_id, find_newest_id_to_purge in (
+        (find_min_state_id, find_newest_state_id_to_purge),
+        (find_min_event_id, find_newest_event_id_to_purge),
+    ):
+        if (
+            newest_id := session.execute(
+                find_newest_id_to_purge(purge_before_ts)
+            ).scalar()
+        ) is not None and (
+            min_id := session.execute(find_min_id()).scalar()
+        ) is not None:
+            rows_to_purge += newest_id - min_id + 1
+    return PurgeProgress(purge_before, rows_to_purge)
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress,
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -163,6 +269,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    progress.rows_purged += len(event_ids) + len(state_ids) + len(detached_state_ids)
     return bool(
         event_ids
         or state_ids
@@ -178,6 +285,8 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -192,7 +301,9 @@ def _purge_states_and_attributes_ids(
     # max_bind_vars
     attributes_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
-    for _ in range(states_batch_size):
+    for batch in range(states_batch_size):
+        if batch and time.monotonic() > deadline:
+            break
         state_ids, attributes_ids = _select_state_attributes_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -200,6 +311,7 @@ def _purge_states_and_attributes_ids(
             has_remaining_state_ids_to_purge = False
             break
         _purge_state_ids(instance, session, state_ids)
+        progress.rows_purged += len(state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
@@ -215,6 +327,8 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress,
+    deadline: float,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -227,7 +341,9 @@ def _purge_events_and_data_ids(
     # max_bind_vars
     data_ids_batch: set[int] = set()
     max_bind_vars = instance.max_bind_vars
-    for _ in range(events_batch_size):
+    for batch in range(events_batch_size):
+        if batch and time.monotonic() > deadline:
+            break
         event_ids, data_ids = _select_event_data_ids_to_purge(
             session, purge_before, max_bind_vars
         )
@@ -235,6 +351,7 @@ def _purge_events_and_data_ids(
             has_remaining_event_ids_to_purge = False
             break
         _purge_event_ids(session, event_ids)
+        progress.rows_purged += len(event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
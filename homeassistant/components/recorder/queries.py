@@ -19,6 +19,8 @@ from .db_schema import (
     States,
     StatesMeta,
     Statistics,
+    StatisticsDaily,
+    StatisticsMeta,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -621,10 +623,26 @@ def find_events_to_purge(
     return lambda_stmt(
         lambda: select(Events.event_id, Events.data_id)
         .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts)
         .limit(max_bind_vars)
     )
 
 
+def find_min_event_id() -> StatementLambdaElement:
+    """Find the lowest event_id."""
+    return lambda_stmt(lambda: select(func.min(Events.event_id)))
+
+
+def find_newest_event_id_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the event_id of the newest event to purge."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.time_fired_ts < purge_before)
+        .order_by(Events.time_fired_ts.desc())
+        .limit(1)
+    )
+
+
 def find_states_to_purge(
     purge_before: float, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -632,10 +650,26 @@ def find_states_to_purge(
     return lambda_stmt(
         lambda: select(States.state_id, States.attributes_id)
         .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts)
         .limit(max_bind_vars)
     )
 
 
+def find_min_state_id() -> StatementLambdaElement:
+    """Find the lowest state_id."""
+    return lambda_stmt(lambda: select(func.min(States.state_id)))
+
+
+def find_newest_state_id_to_purge(purge_before: float) -> StatementLambdaElement:
+    """Find the state_id of the newest state to purge."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts.desc())
+        .limit(1)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -963,3 +997,40 @@ def delete_duplicate_statistics_row(statistic_id: int) -> StatementLambdaElement
         .where(Statistics.id == statistic_id)
         .execution_options(synchronize_session=False)
     )
+
+
+def has_statistics_rollups_to_build() -> StatementLambdaElement:
+    """Check if there are statistics without rollups."""
+    return lambda_stmt(
+        lambda: select(StatisticsMeta.id)
+        .where(
+            select(Statistics.id)
+            .where(Statistics.metadata_id == StatisticsMeta.id)
+            .exists()
+        )
+        .where(
+            ~select(StatisticsDaily.id)
+            .where(StatisticsDaily.metadata_id == StatisticsMeta.id)
+            .exists()
+        )
+        .limit(1)
+    )
+
+
+def find_statistics_rollups_to_build(limit: int) -> StatementLambdaElement:
+    """Find the metadata_ids of statistics without rollups."""
+    return lambda_stmt(
+        lambda: select(StatisticsMeta.id)
+        .where(
+            select(Statistics.id)
+            .where(Statistics.metadata_id == StatisticsMeta.id)
+            .exists()
+        )
+        .where(
+            ~select(StatisticsDaily.id)
+            .where(StatisticsDaily.metadata_id == StatisticsMeta.id)
+            .exists()
+        )
+        .order_by(StatisticsMeta.id)
+        .limit(limit)
+    )
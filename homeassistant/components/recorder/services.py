@@ -17,7 +17,13 @@ from homeassistant.helpers.service import (
 )
 import homeassistant.util.dt as dt_util
 
-from .const import ATTR_APPLY_FILTER, ATTR_KEEP_DAYS, ATTR_REPACK, DOMAIN
+from .const import (
+    ATTR_APPLY_FILTER,
+    ATTR_KEEP_DAYS,
+    ATTR_MAX_DURATION,
+    ATTR_REPACK,
+    DOMAIN,
+)
 from .core import Recorder
 from .tasks import PurgeEntitiesTask, PurgeTask
 
@@ -31,6 +37,7 @@ SERVICE_PURGE_SCHEMA = vol.Schema(
         vol.Optional(ATTR_KEEP_DAYS): cv.positive_int,
         vol.Optional(ATTR_REPACK, default=False): cv.boolean,
         vol.Optional(ATTR_APPLY_FILTER, default=False): cv.boolean,
+        vol.Optional(ATTR_MAX_DURATION): cv.positive_float,
     }
 )
 
@@ -72,8 +79,9 @@ def _async_register_purge_service(hass: HomeAssistant, instance: Recorder) -> No
         keep_days = kwargs.get(ATTR_KEEP_DAYS, instance.keep_days)
         repack = cast(bool, kwargs[ATTR_REPACK])
         apply_filter = cast(bool, kwargs[ATTR_APPLY_FILTER])
+        max_duration = kwargs.get(ATTR_MAX_DURATION, instance.purge_max_duration)
         purge_before = dt_util.utcnow() - timedelta(days=keep_days)
-        instance.queue_task(PurgeTask(purge_before, repack, apply_filter))
+        instance.queue_task(PurgeTask(purge_before, repack, apply_filter, max_duration))
 
     async_register_admin_service(
         hass,
@@ -11,9 +11,19 @@ from itertools import chain, groupby
 import logging
 from operator import itemgetter
 import re
-from typing import TYPE_CHECKING, Any, Literal, TypedDict, cast
-
-from sqlalchemy import Select, and_, bindparam, func, lambda_stmt, select, text
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, TypedDict, cast
+
+from sqlalchemy import (
+    Select,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    lambda_stmt,
+    select,
+    text,
+)
 from sqlalchemy.engine.row import Row
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm.session import Session
@@ -59,6 +69,9 @@ from .db_schema import (
     STATISTICS_TABLES,
     Statistics,
     StatisticsBase,
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsRollupBase,
     StatisticsRuns,
     StatisticsShortTerm,
 )
@@ -590,6 +603,14 @@ def _compile_statistics(
     if start.minute == 55:
         # A full hour is ready, summarize it
         _compile_hourly_statistics(session, start)
+        # and fold it into the rollups of its day and month
+        hour_start_ts = start.replace(minute=0).timestamp()
+        _update_statistics_rollups(
+            session,
+            hour_start_ts,
+            hour_start_ts,
+            existing_only=not instance.statistics_rollups_active,
+        )
 
     session.add(StatisticsRuns(start=start))
 
@@ -785,7 +806,7 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -1102,6 +1123,207 @@ def _reduce_statistics_per_month(
     )
 
 
+class _StatisticsRollupRow(NamedTuple):
+    """Statistics rolled up for a day, week or month."""
+
+    metadata_id: int
+    start_ts: float
+    mean: float | None
+    mean_weight: int | None
+    min: float | None
+    max: float | None
+    last_reset_ts: float | None
+    state: float | None
+    sum: float | None
+
+
+def _rollup_statistics_rows(
+    rows: Iterable[Row | _StatisticsRollupRow],
+    period_start_end: Callable[[float], tuple[float, float]],
+    weighted: bool,
+) -> list[_StatisticsRollupRow]:
+    """Roll up statistics rows sorted by metadata_id and start_ts per period.
+
+    The means of hourly statistics are averaged the same way _reduce_statistics
+    does, the means of rollups are weighted with their mean_weight.
+    """
+    rollups: list[_StatisticsRollupRow] = []
+    for (metadata_id, start_ts), group in groupby(
+        rows, lambda row: (row.metadata_id, period_start_end(row.start_ts)[0])
+    ):
+        period_rows = list(group)
+        period_mean: float | None = None
+        mean_weight: int | None = None
+        if weighted:
+            if weighted_means := [
+                (row.mean, row.mean_weight)
+                for row in period_rows
+                if row.mean is not None and row.mean_weight
+            ]:
+                mean_weight = sum(weight for _, weight in weighted_means)
+                period_mean = (
+                    sum(value * weight for value, weight in weighted_means)
+                    / mean_weight
+                )
+        elif mean_values := [row.mean for row in period_rows if row.mean is not None]:
+            mean_weight = len(mean_values)
+            period_mean = mean(mean_values)
+        min_values = [row.min for row in period_rows if row.min is not None]
+        max_values = [row.max for row in period_rows if row.max is not None]
+        last_row = period_rows[-1]
+        rollups.append(
+            _StatisticsRollupRow(
+                metadata_id,
+                start_ts,
+                period_mean,
+                mean_weight,
+                min(min_values) if min_values else None,
+                max(max_values) if max_values else None,
+                last_row.last_reset_ts,
+                last_row.state,
+                last_row.sum,
+            )
+        )
+    return rollups
+
+
+def _update_statistics_rollup(
+    session: Session,
+    source_table: type[Statistics | StatisticsDaily],
+    rollup_table: type[StatisticsDaily | StatisticsMonthly],
+    period_start_end: Callable[[float], tuple[float, float]],
+    first_start_ts: float,
+    last_start_ts: float,
+    metadata_id: int | None,
+    existing_only: bool,
+) -> None:
+    """Recompute the rollups of the periods from first_start_ts to last_start_ts."""
+    start_ts = period_start_end(first_start_ts)[0]
+    end_ts = period_start_end(last_start_ts)[1]
+    columns = [
+        source_table.metadata_id,
+        source_table.start_ts,
+        source_table.mean,
+        source_table.min,
+        source_table.max,
+        source_table.last_reset_ts,
+        source_table.state,
+        source_table.sum,
+    ]
+    if weighted := issubclass(source_table, StatisticsRollupBase):
+        columns.append(source_table.mean_weight)
+    stmt = (
+        select(*columns)
+        .where(source_table.start_ts >= start_ts)
+        .where(source_table.start_ts < end_ts)
+    )
+    delete_stmt = (
+        delete(rollup_table)
+        .where(rollup_table.start_ts >= start_ts)
+        .where(rollup_table.start_ts < end_ts)
+    )
+    if metadata_id is not None:
+        stmt = stmt.where(source_table.metadata_id == metadata_id)
+        delete_stmt = delete_stmt.where(rollup_table.metadata_id == metadata_id)
+    if existing_only:
+        # The statistics rollups migration has not finished yet, only
+        # update the statistics it already built the rollups for
+        stmt = stmt.where(
+            select(rollup_table.id)
+            .where(rollup_table.metadata_id == source_table.metadata_id)
+            .exists()
+        )
+    rollups = _rollup_statistics_rows(
+        session.execute(stmt.order_by(source_table.metadata_id, source_table.start_ts)),
+        period_start_end,
+        weighted,
+    )
+    session.execute(delete_stmt.execution_options(synchronize_session=False))
+    if rollups:
+        session.execute(insert(rollup_table), [rollup._asdict() for rollup in rollups])
+
+
+def _update_statistics_rollups(
+    session: Session,
+    first_start_ts: float,
+    last_start_ts: float,
+    metadata_id: int | None = None,
+    existing_only: bool = False,
+) -> None:
+    """Update the daily and monthly rollups after hourly statistics changed.
+
+    The days from first_start_ts to last_start_ts are recomputed from the
+    hourly statistics and their months from the daily rollups.
+    """
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    _update_statistics_rollup(
+        session,
+        Statistics,
+        StatisticsDaily,
+        day_start_end,
+        first_start_ts,
+        last_start_ts,
+        metadata_id,
+        existing_only,
+    )
+    _update_statistics_rollup(
+        session,
+        StatisticsDaily,
+        StatisticsMonthly,
+        month_start_end,
+        first_start_ts,
+        last_start_ts,
+        metadata_id,
+        False,
+    )
+
+
+def rebuild_statistics_rollups(session: Session, metadata_ids: Iterable[int]) -> None:
+    """Rebuild the daily and monthly rollups from the hourly statistics."""
+    for metadata_id in metadata_ids:
+        for table in (StatisticsDaily, StatisticsMonthly):
+            session.execute(
+                delete(table)
+                .where(table.metadata_id == metadata_id)
+                .execution_options(synchronize_session=False)
+            )
+        first_start_ts, last_start_ts = session.execute(
+            select(func.min(Statistics.start_ts), func.max(Statistics.start_ts)).where(
+                Statistics.metadata_id == metadata_id
+            )
+        ).one()
+        if first_start_ts is not None:
+            _update_statistics_rollups(
+                session, first_start_ts, last_start_ts, metadata_id
+            )
+
+
+@retryable_database_job("realign statistics rollups")
+def realign_statistics_rollups(instance: Recorder, metadata_ids: set[int]) -> bool:
+    """Rebuild the rollups which do not line up with the configured time zone."""
+    _, day_start_end = reduce_day_ts_factory()
+    _, month_start_end = reduce_month_ts_factory()
+    misaligned: set[int] = set()
+    with session_scope(session=instance.get_session()) as session:
+        for table, period_start_end in (
+            (StatisticsDaily, day_start_end),
+            (StatisticsMonthly, month_start_end),
+        ):
+            misaligned.update(
+                metadata_id
+                for metadata_id, start_ts in session.execute(
+                    select(table.metadata_id, table.start_ts).where(
+                        table.metadata_id.in_(metadata_ids)
+                    )
+                )
+                if period_start_end(start_ts)[0] != start_ts
+            )
+        _LOGGER.debug("Rebuilding misaligned statistics rollups: %s", misaligned)
+        rebuild_statistics_rollups(session, misaligned)
+    return True
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1687,6 +1909,74 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
+def _statistics_rollups_during_period_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    metadata_ids: list[int] | None,
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    period: Literal["day", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]] | None:
+    """Return day, week or month statistics from the rollups.
+
+    Weeks are rolled up from the daily rollups. If the rollups do not line up
+    with the periods of the configured time zone a rebuild is scheduled and
+    None is returned, the hourly statistics must then be reduced instead.
+    """
+    table: type[StatisticsDaily | StatisticsMonthly]
+    if period == "month":
+        table = StatisticsMonthly
+        _, table_start_end = reduce_month_ts_factory()
+    else:
+        table = StatisticsDaily
+        _, table_start_end = reduce_day_ts_factory()
+    stmt = select(
+        *(getattr(table, column) for column in _StatisticsRollupRow._fields)
+    ).where(table.start_ts >= start_time.timestamp())
+    if end_time is not None:
+        stmt = stmt.where(table.start_ts < end_time.timestamp())
+    if metadata_ids:
+        stmt = stmt.where(table.metadata_id.in_(metadata_ids))
+    rows: Sequence[Row | _StatisticsRollupRow] = session.execute(
+        stmt.order_by(table.metadata_id, table.start_ts)
+    ).all()
+    if misaligned := {
+        row.metadata_id
+        for row in rows
+        if table_start_end(row.start_ts)[0] != row.start_ts
+    }:
+        _LOGGER.debug("Statistics rollups of %s are misaligned", misaligned)
+        get_instance(hass).queue_statistics_rollups_rebuild(misaligned)
+        return None
+    if not rows:
+        return {}
+
+    period_start_end = table_start_end
+    if period == "week":
+        _, period_start_end = reduce_week_ts_factory()
+        rows = _rollup_statistics_rows(rows, period_start_end, True)
+
+    result = _sorted_statistics_to_dict(
+        hass,
+        cast(Sequence[Row], rows),
+        statistic_ids,
+        metadata,
+        True,
+        table,
+        units,
+        types,
+    )
+    # The rollup periods do not have a fixed duration
+    for stats in result.values():
+        for row in stats:
+            row["end"] = period_start_end(row["start"])[1]
+    return result
+
+
 def _statistics_during_period_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -1706,8 +1996,9 @@ def _statistics_during_period_with_session(
         # This is for backwards compatibility to avoid a breaking change
         # for custom integrations that call this method.
         statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+    instance = get_instance(hass)
     # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
+    metadata = instance.statistics_meta_manager.get_many(
         session, statistic_ids=statistic_ids
     )
     if not metadata:
@@ -1757,35 +2048,56 @@ def _statistics_during_period_with_session(
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
     )
-    stmt = _generate_statistics_during_period_stmt(
-        start_time, end_time, metadata_ids, table, types
-    )
-    stats = cast(
-        Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
-    )
+    if (
+        period in ("day", "week", "month")
+        and instance.statistics_rollups_active
+        and (
+            rollups := _statistics_rollups_during_period_with_session(
+                hass,
+                session,
+                start_time,
+                end_time,
+                statistic_ids,
+                metadata_ids,
+                metadata,
+                period,
+                units,
+                types,
+            )
+        )
+        is not None
+    ):
+        result = rollups
+    else:
+        stmt = _generate_statistics_during_period_stmt(
+            start_time, end_time, metadata_ids, table, types
+        )
+        stats = cast(
+            Sequence[Row], execute_stmt_lambda_element(session, stmt, orm_rows=False)
+        )
 
-    if not stats:
-        return {}
+        if not stats:
+            return {}
 
-    result = _sorted_statistics_to_dict(
-        hass,
-        stats,
-        statistic_ids,
-        metadata,
-        True,
-        table,
-        units,
-        types,
-    )
+        result = _sorted_statistics_to_dict(
+            hass,
+            stats,
+            statistic_ids,
+            metadata,
+            True,
+            table,
+            units,
+            types,
+        )
 
-    if period == "day":
-        result = _reduce_statistics_per_day(result, types)
+        if period == "day":
+            result = _reduce_statistics_per_day(result, types)
 
-    if period == "week":
-        result = _reduce_statistics_per_week(result, types)
+        if period == "week":
+            result = _reduce_statistics_per_week(result, types)
 
-    if period == "month":
-        result = _reduce_statistics_per_month(result, types)
+        if period == "month":
+            result = _reduce_statistics_per_month(result, types)
 
     if "change" in _types:
         _augment_result_with_change(
@@ -2355,13 +2667,23 @@ def _import_statistics_with_session(
     _, metadata_id = statistics_meta_manager.update_or_add(
         session, metadata, old_metadata_dict
     )
+    starts: list[datetime] = []
     for stat in statistics:
+        starts.append(stat["start"])
         if stat_id := _statistics_exists(session, table, metadata_id, stat["start"]):
             _update_statistics(session, table, stat_id, stat)
         else:
             _insert_statistics(session, table, metadata_id, stat)
 
     if table != StatisticsShortTerm:
+        if starts:
+            _update_statistics_rollups(
+                session,
+                min(starts).timestamp(),
+                max(starts).timestamp(),
+                metadata_id,
+                existing_only=not instance.statistics_rollups_active,
+            )
         return True
 
     # We just inserted new short term statistics, so we need to update the
@@ -2491,6 +2813,23 @@ def adjust_statistics(
             sum_adjustment,
         )
 
+        # The sums of the rollups are taken from the last hour of their period
+        first_start_ts = start_time.replace(minute=0).timestamp()
+        if (
+            last_start_ts := session.execute(
+                select(func.max(Statistics.start_ts)).where(
+                    Statistics.metadata_id == metadata[statistic_id][0]
+                )
+            ).scalar()
+        ) is not None and last_start_ts >= first_start_ts:
+            _update_statistics_rollups(
+                session,
+                first_start_ts,
+                last_start_ts,
+                metadata[statistic_id][0],
+                existing_only=not instance.statistics_rollups_active,
+            )
+
     return True
 
 
@@ -2551,6 +2890,8 @@ def change_statistics_unit(
         tables: tuple[type[StatisticsBase], ...] = (
             Statistics,
             StatisticsShortTerm,
+            StatisticsDaily,
+            StatisticsMonthly,
         )
         for table in tables:
             _change_statistics_unit_for_table(session, table, metadata_id, convert)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from lru import LRU
+from sqlalchemy.orm.session import Session
 
 from homeassistant.util.event_type import EventType
 
@@ -12,6 +13,15 @@ if TYPE_CHECKING:
     from ..core import Recorder
 
 
+def supports_insert_many_returning(session: Session) -> bool:
+    """Return if the ids of rows inserted with executemany can be returned.
+
+    When the database does not support it the pending rows are added
+    to the session instead and the ORM assigns the ids when flushing.
+    """
+    return session.get_bind().dialect.insert_executemany_returning
+
+
 class BaseTableManager[_DataT]:
     """Base class for table managers."""
 
@@ -0,0 +1,86 @@
+"""Support managing Events."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from ..db_schema import Events
+
+
+class EventsManager:
+    """Manage the events table.
+
+    Unlike states, the event_id of a new row is never needed after it has
+    been written so events are not added to the session. Instead they are
+    kept pending and inserted with a single executemany when the session
+    is committed, which avoids the unit of work emitting one INSERT with
+    RETURNING per event.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the events manager."""
+        self._pending: list[Events] = []
+
+    def add_pending(self, event: Events) -> None:
+        """Add a pending event.
+
+        Pending events are events that have not been inserted yet.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.append(event)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the pending events into the session's transaction.
+
+        The session is flushed first so the EventTypes and EventData
+        rows the pending events refer to are assigned their ids.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending:
+            return
+        session.flush()
+        session.execute(
+            insert(Events), [_event_to_row(event) for event in self._pending]
+        )
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to clear the inserted events.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending.clear()
+
+
+def _event_to_row(event: Events) -> dict[str, Any]:
+    """Convert a pending Events object to the parameters for the insert."""
+    event_type_id = event.event_type_id
+    if (event_type_rel := event.event_type_rel) is not None:
+        event_type_id = event_type_rel.event_type_id
+    data_id = event.data_id
+    if (event_data_rel := event.event_data_rel) is not None:
+        data_id = event_data_rel.data_id
+    return {
+        "origin_idx": event.origin_idx,
+        "time_fired_ts": event.time_fired_ts,
+        "context_id_bin": event.context_id_bin,
+        "context_user_id_bin": event.context_user_id_bin,
+        "context_parent_id_bin": event.context_parent_id_bin,
+        "event_type_id": event_type_id,
+        "data_id": data_id,
+    }
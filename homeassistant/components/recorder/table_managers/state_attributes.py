@@ -6,6 +6,7 @@ from collections.abc import Collection, Iterable
 import logging
 from typing import TYPE_CHECKING, cast
 
+from sqlalchemy import insert
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -15,7 +16,7 @@ from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 from ..db_schema import StateAttributes
 from ..queries import get_shared_attributes
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseLRUTableManager, supports_insert_many_returning
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -126,6 +127,31 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         shared_attrs: str = db_state_attributes.shared_attrs
         self._pending[shared_attrs] = db_state_attributes
 
+    def insert_pending(self, session: Session) -> None:
+        """Insert the pending StateAttributes and assign their attributes_ids.
+
+        The rows are inserted with a single executemany and the returned
+        attributes_ids are matched to the pending StateAttributes by
+        shared_attrs.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending := self._pending):
+            return
+        if not supports_insert_many_returning(session):
+            session.add_all(pending.values())
+            return
+        table = type(next(iter(pending.values())))
+        for attributes_id, shared_attrs in session.execute(
+            insert(table).returning(table.attributes_id, table.shared_attrs),
+            [
+                {"hash": db_state_attributes.hash, "shared_attrs": shared_attrs}
+                for shared_attrs, db_state_attributes in pending.items()
+            ],
+        ):
+            pending[shared_attrs].attributes_id = attributes_id
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the attributes_ids of the new StateAttributes into the LRU.
 
@@ -2,15 +2,28 @@
 
 from __future__ import annotations
 
+from functools import cache
+from typing import Any
+
+from sqlalchemy import insert, inspect
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
+from . import supports_insert_many_returning
 
 
 class StatesManager:
-    """Manage the states table."""
+    """Manage the states table.
+
+    New states are not added to the session. They are kept pending and
+    inserted with an executemany when the session is committed, after
+    the StatesMeta and StateAttributes they refer to have been inserted.
+    """
 
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
@@ -45,6 +58,52 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to be inserted when the session is committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the pending states and assign their state_ids.
+
+        The ids returned by an executemany are matched to the states by
+        entity, so the states are inserted in rounds that each hold at
+        most one state of an entity. A state is always in a later round
+        than the earlier state of its entity it links old_state_id to.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending_inserts := self._pending_inserts):
+            return
+        if not supports_insert_many_returning(session):
+            session.add_all(pending_inserts)
+            return
+        table = type(pending_inserts[0])
+        columns = _insert_columns(table)
+        rounds: list[dict[tuple[str | None, int | None], States]] = []
+        next_round: dict[tuple[str | None, int | None], int] = {}
+        for state in pending_inserts:
+            if (states_meta := state.states_meta_rel) is not None:
+                state.metadata_id = states_meta.metadata_id
+            key = (state.entity_id, state.metadata_id)
+            round_idx = next_round.get(key, 0)
+            next_round[key] = round_idx + 1
+            if round_idx == len(rounds):
+                rounds.append({})
+            rounds[round_idx][key] = state
+        for states in rounds:
+            for state_id, entity_id, metadata_id in session.execute(
+                insert(table).returning(
+                    table.state_id, table.entity_id, table.metadata_id
+                ),
+                [_state_to_row(state, columns) for state in states.values()],
+            ):
+                states[(entity_id, metadata_id)].state_id = state_id
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -64,6 +123,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +134,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -102,3 +163,26 @@ class StatesManager:
         last_committed_ids = self._last_committed_id
         for entity_id in purged_entity_ids:
             last_committed_ids.pop(entity_id, None)
+
+
+@cache
+def _insert_columns(table: type[States]) -> tuple[str, ...]:
+    """Return the columns a new state is inserted with.
+
+    The columns are taken from the mapped class of the pending states,
+    which is an older States class when the database has an old schema.
+    """
+    return tuple(
+        column_attr.key
+        for column_attr in inspect(table).column_attrs
+        if not column_attr.columns[0].primary_key
+    )
+
+
+def _state_to_row(state: States, columns: tuple[str, ...]) -> dict[str, Any]:
+    """Convert a pending States object to the parameters for the insert."""
+    if (old_state := state.old_state) is not None:
+        state.old_state_id = old_state.state_id
+    if (state_attributes := state.state_attributes) is not None:
+        state.attributes_id = state_attributes.attributes_id
+    return {column: getattr(state, column) for column in columns}
@@ -5,6 +5,7 @@ from __future__ import annotations
 from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, cast
 
+from sqlalchemy import insert
 from sqlalchemy.orm.session import Session
 
 from homeassistant.core import Event, EventStateChangedData
@@ -13,7 +14,7 @@ from homeassistant.util.collection import chunked_or_all
 from ..db_schema import StatesMeta
 from ..queries import find_all_states_metadata_ids, find_states_metadata_ids
 from ..util import execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseLRUTableManager, supports_insert_many_returning
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -131,6 +132,27 @@ class StatesMetaManager(BaseLRUTableManager[StatesMeta]):
         entity_id: str = db_states_meta.entity_id
         self._pending[entity_id] = db_states_meta
 
+    def insert_pending(self, session: Session) -> None:
+        """Insert the pending StatesMeta and assign their metadata_ids.
+
+        The rows are inserted with a single executemany and the returned
+        metadata_ids are matched to the pending StatesMeta by entity_id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not (pending := self._pending):
+            return
+        if not supports_insert_many_returning(session):
+            session.add_all(pending.values())
+            return
+        table = type(next(iter(pending.values())))
+        for metadata_id, entity_id in session.execute(
+            insert(table).returning(table.metadata_id, table.entity_id),
+            [{"entity_id": entity_id} for entity_id in pending],
+        ):
+            pending[entity_id].metadata_id = metadata_id
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the metadata_ids of the new StatesMeta into the LRU.
 
@@ -94,6 +94,9 @@ class UpdateStatesMetadataTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Handle the task."""
+        instance.hot_history_cache.evict_entities(
+            lambda entity_id: entity_id in (self.entity_id, self.new_entity_id)
+        )
         entity_registry.update_states_metadata(
             instance,
             self.entity_id,
@@ -108,11 +111,21 @@ class PurgeTask(RecorderTask):
     purge_before: datetime
     repack: bool
     apply_filter: bool
+    max_duration: float
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
+        instance.hot_history_cache.evict_before(self.purge_before.timestamp())
+        if self.apply_filter and (entity_filter := instance.entity_filter):
+            instance.hot_history_cache.evict_entities(
+                lambda entity_id: not entity_filter(entity_id)
+            )
         if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            max_duration=self.max_duration,
         ):
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
@@ -123,7 +136,9 @@ class PurgeTask(RecorderTask):
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(
-            PurgeTask(self.purge_before, self.repack, self.apply_filter)
+            PurgeTask(
+                self.purge_before, self.repack, self.apply_filter, self.max_duration
+            )
         )
 
 
@@ -136,6 +151,7 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
+        instance.hot_history_cache.evict_entities(self.entity_filter)
         if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
             return
         # Schedule a new purge task if this one didn't finish
@@ -201,6 +217,21 @@ class ImportStatisticsTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class RebuildStatisticsRollupsTask(RecorderTask):
+    """An object to insert into the recorder queue to rebuild statistics rollups.
+
+    The rollups are rebuilt when they do not line up with the days and
+    months of the configured time zone, which happens after it changed.
+    """
+
+    metadata_ids: set[int]
+
+    def run(self, instance: Recorder) -> None:
+        """Run statistics task."""
+        statistics.realign_statistics_rollups(instance, self.metadata_ids)
+
+
 @dataclass(slots=True)
 class AdjustStatisticsTask(RecorderTask):
     """An object to insert into the recorder queue to run an adjust statistics task."""
@@ -127,7 +127,7 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -195,7 +195,7 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -250,7 +250,7 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_read_executor_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -404,7 +404,7 @@ async def ws_adjust_sum_statistics(
         return
 
     instance = get_instance(hass)
-    metadatas = await instance.async_add_executor_job(
+    metadatas = await instance.async_add_read_executor_job(
         list_statistic_ids, hass, {msg["statistic_id"]}
     )
     if not metadatas:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextlib import suppress
 from functools import lru_cache, partial
 import json
 import logging
@@ -60,10 +61,18 @@ from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
 from .connection import ActiveConnection
+from .entity_subscriptions import (
+    CoalescingEntitySubscription,
+    EntitySubscription,
+    async_get_entity_subscriptions,
+)
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
 
+# Longest window in seconds subscribe_entities can coalesce state changes over
+MAX_COALESCE_WINDOW = 60
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -82,9 +91,11 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_loop_stats)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -305,12 +316,18 @@ async def handle_call_service(
         connection.send_error(msg["id"], const.ERR_UNKNOWN_ERROR, str(err))
 
 
+@callback
+def _async_reads_all_states(connection: ActiveConnection) -> bool:
+    """Return if the user of the connection may read the states of all entities."""
+    user = connection.user
+    return user.is_admin or user.permissions.access_all_entities(POLICY_READ)
+
+
 @callback
 def _async_get_allowed_states(
     hass: HomeAssistant, connection: ActiveConnection
 ) -> list[State]:
-    user = connection.user
-    if user.is_admin or user.permissions.access_all_entities(POLICY_READ):
+    if _async_reads_all_states(connection):
         return hass.states.async_all()
     entity_perm = connection.user.permissions.check_entity
     return [
@@ -326,6 +343,16 @@ def handle_get_states(
     hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
     """Handle get states command."""
+    if _async_reads_all_states(connection):
+        # The joined states are shared with the other connections
+        with suppress(ValueError, TypeError):
+            connection.send_message(
+                construct_result_message(
+                    msg["id"], b"".join((b"[", hass.states.async_all_json(), b"]"))
+                )
+            )
+            return
+
     states = _async_get_allowed_states(hass, connection)
 
     try:
@@ -363,35 +390,14 @@ def _send_handle_get_states_response(
     )
 
 
-@callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str],
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
-) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if entity_ids and entity_id not in entity_ids:
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
-
-
 @callback
 @decorators.websocket_command(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("coalesce_window"): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=MAX_COALESCE_WINDOW)
+        ),
     }
 )
 def handle_subscribe_entities(
@@ -402,23 +408,33 @@ def handle_subscribe_entities(
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
-    states = _async_get_allowed_states(hass, connection)
     message_id_as_bytes = str(msg["id"]).encode()
-    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
-            connection.send_message,
-            entity_ids,
-            connection.user,
-            message_id_as_bytes,
-        ),
-    )
+    subscription: EntitySubscription
+    if window := msg.get("coalesce_window"):
+        subscription = CoalescingEntitySubscription(
+            hass, connection.send_message, connection.user, message_id_as_bytes, window
+        )
+    else:
+        subscription = EntitySubscription(
+            connection.send_message, connection.user, message_id_as_bytes
+        )
+    connection.subscriptions[msg["id"]] = async_get_entity_subscriptions(
+        hass
+    ).async_subscribe(subscription, entity_ids)
     connection.send_result(msg["id"])
 
     # JSON serialize here so we can recover if it blows up due to the
     # state machine containing unserializable data. This command is required
     # to succeed for the UI to show.
+    if not entity_ids and _async_reads_all_states(connection):
+        # The joined states are shared with the other connections
+        with suppress(ValueError, TypeError):
+            _send_handle_entities_init_response(
+                connection, msg["id"], [hass.states.async_all_json(compressed=True)]
+            )
+            return
+
+    states = _async_get_allowed_states(hass, connection)
     try:
         serialized_states = [
             state.as_compressed_state_json
@@ -547,6 +563,41 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "loop_stats",
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@decorators.require_admin
+def handle_loop_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle loop stats command."""
+    connection.send_result(msg["id"], hass.loop_stats.as_dict())
+    if msg["reset"]:
+        hass.loop_stats.async_reset()
+
+
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "template_stats",
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@decorators.require_admin
+def handle_template_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template stats command."""
+    render_stats = template.async_get_template_render_stats(hass)
+    connection.send_result(msg["id"], render_stats.as_dict())
+    if msg["reset"]:
+        render_stats.async_reset()
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
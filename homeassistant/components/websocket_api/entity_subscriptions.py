@@ -0,0 +1,231 @@
+"""Fan out state changes to the subscribe_entities subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions import AbstractPermissions
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.singleton import singleton
+from homeassistant.util.hass_dict import HassKey
+
+from .messages import cached_state_diff_message
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_ENTITY_SUBSCRIPTIONS: HassKey[EntitySubscriptions] = HassKey(
+    "websocket_api_entity_subscriptions"
+)
+
+
+class EntitySubscription:
+    """A subscribe_entities subscription of a connection."""
+
+    __slots__ = (
+        "_permissions",
+        "_read_all_entities",
+        "message_id_as_bytes",
+        "send_message",
+        "user",
+    )
+
+    def __init__(
+        self,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.user = user
+        self.message_id_as_bytes = message_id_as_bytes
+        self._permissions: AbstractPermissions | None = None
+        self._read_all_entities = False
+
+    def can_read(self, entity_id: str) -> bool:
+        """Return if the user may read the state of the entity."""
+        user = self.user
+        if user.is_admin:
+            return True
+        # The permissions of the user are replaced when the user changes
+        # so the result of access_all_entities is only kept as long as
+        # the permissions it was computed from
+        permissions = user.permissions
+        if permissions is not self._permissions:
+            self._permissions = permissions
+            self._read_all_entities = permissions.access_all_entities(POLICY_READ)
+        return self._read_all_entities or permissions.check_entity(
+            entity_id, POLICY_READ
+        )
+
+    @callback
+    def async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Send the state change."""
+        self.send_message(cached_state_diff_message(self.message_id_as_bytes, event))
+
+    @callback
+    def async_close(self) -> None:
+        """Close the subscription."""
+
+
+class CoalescingEntitySubscription(EntitySubscription):
+    """A subscription that only sends the latest state of each entity.
+
+    State changes are collected for a window after the first one. The
+    latest state of each entity that changed in the window is then sent
+    as an add, or as a remove if the entity was removed, so intermediate
+    states are skipped.
+    """
+
+    __slots__ = ("_flush_timer", "_loop", "_pending", "_window")
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        user: User,
+        message_id_as_bytes: bytes,
+        window: float,
+    ) -> None:
+        """Initialize the subscription."""
+        super().__init__(send_message, user, message_id_as_bytes)
+        self._loop = hass.loop
+        self._window = window
+        self._pending: dict[str, State | None] = {}
+        self._flush_timer: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_forward(self, event: Event[EventStateChangedData]) -> None:
+        """Collect the state change until the window ends."""
+        self._pending[event.data["entity_id"]] = event.data["new_state"]
+        if self._flush_timer is None:
+            self._flush_timer = self._loop.call_later(self._window, self._async_flush)
+
+    @callback
+    def async_close(self) -> None:
+        """Drop the collected state changes."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        self._pending.clear()
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the latest states collected in the window."""
+        self._flush_timer = None
+        pending = self._pending
+        self._pending = {}
+        added: list[bytes] = []
+        removed: list[str] = []
+        for entity_id, state in pending.items():
+            if state is None:
+                removed.append(entity_id)
+                continue
+            try:
+                added.append(state.as_compressed_state_json)
+            except (ValueError, TypeError):
+                _LOGGER.error("Unable to serialize to JSON the state of %s", entity_id)
+        event: list[bytes] = []
+        if added:
+            event.append(b"".join((b'"a":{', b",".join(added), b"}")))
+        if removed:
+            event.append(b"".join((b'"r":', json_bytes(removed))))
+        if not event:
+            return
+        self.send_message(
+            b"".join(
+                (
+                    b'{"id":',
+                    self.message_id_as_bytes,
+                    b',"type":"event","event":{',
+                    b",".join(event),
+                    b"}}",
+                )
+            )
+        )
+
+
+class EntitySubscriptions:
+    """Forward state changes to the subscriptions of the changed entity.
+
+    A single state changed listener is shared by all subscriptions. The
+    subscriptions are indexed by the entity ids they are interested in so
+    each state change only reaches the connections that subscribed to it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the entity subscriptions."""
+        self._hass = hass
+        self._all_entities: dict[EntitySubscription, None] = {}
+        self._by_entity_id: dict[str, dict[EntitySubscription, None]] = {}
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(
+        self, subscription: EntitySubscription, entity_ids: set[str]
+    ) -> CALLBACK_TYPE:
+        """Subscribe to state changes of entity_ids or all entities if empty."""
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self._hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_forward_state_changed
+            )
+        if not entity_ids:
+            self._all_entities[subscription] = None
+        for entity_id in entity_ids:
+            self._by_entity_id.setdefault(entity_id, {})[subscription] = None
+        return lambda: self._async_unsubscribe(subscription, entity_ids)
+
+    @callback
+    def _async_unsubscribe(
+        self, subscription: EntitySubscription, entity_ids: set[str]
+    ) -> None:
+        """Remove a subscription."""
+        subscription.async_close()
+        if not entity_ids:
+            del self._all_entities[subscription]
+        for entity_id in entity_ids:
+            subscriptions = self._by_entity_id[entity_id]
+            del subscriptions[subscription]
+            if not subscriptions:
+                del self._by_entity_id[entity_id]
+        if (
+            not self._all_entities
+            and not self._by_entity_id
+            and self._unsub_state_changed
+        ):
+            self._unsub_state_changed()
+            self._unsub_state_changed = None
+
+    @callback
+    def _async_forward_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Forward a state change to the interested subscriptions."""
+        entity_id = event.data["entity_id"]
+        subscriptions = self._by_entity_id.get(entity_id)
+        if not subscriptions and not self._all_entities:
+            return
+        # Sending a message can close the connection which
+        # unsubscribes, so iterate over a copy
+        for subscription in (*self._all_entities, *(subscriptions or ())):
+            if subscription.can_read(entity_id):
+                subscription.async_forward(event)
+
+
+@callback
+@singleton(DATA_ENTITY_SUBSCRIPTIONS)
+def async_get_entity_subscriptions(hass: HomeAssistant) -> EntitySubscriptions:
+    """Return the entity subscriptions."""
+    return EntitySubscriptions(hass)
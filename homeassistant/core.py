@@ -7,18 +7,20 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
+from bisect import bisect_left
 from collections import UserDict, defaultdict
 from collections.abc import (
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     KeysView,
     Mapping,
     ValuesView,
 )
 import concurrent.futures
-from contextlib import suppress
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
 import datetime
 import enum
@@ -31,7 +33,7 @@ import pathlib
 import re
 import threading
 import time
-from time import monotonic
+from time import monotonic, perf_counter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -146,6 +148,12 @@ DOMAIN = "homeassistant"
 # How long to wait to log tasks that are blocking
 BLOCK_LOG_TIMEOUT = 60
 
+# Upper bounds in seconds of the buckets the loop stats count durations
+# in, the last bucket counts everything slower
+LOOP_STATS_BUCKETS = (0.0001, 0.001, 0.01, 0.1, 1.0)
+# How often the event loop lag is sampled in seconds
+LOOP_LAG_SAMPLE_INTERVAL = 1
+
 type ServiceResponse = JsonObjectType | None
 type EntityServiceResponse = dict[str, ServiceResponse]
 
@@ -362,6 +370,16 @@ class HassJob[**_P, _R_co]:
         """Return if the job should be cancelled on shutdown."""
         return self._cancel_on_shutdown
 
+    @cached_property
+    def stats_name(self) -> str:
+        """Return the name the job is tracked as in the loop stats."""
+        target: Any = self.target
+        while isinstance(target, functools.partial):
+            target = target.func
+        module = getattr(target, "__module__", None) or type(target).__module__
+        name = getattr(target, "__qualname__", None) or type(target).__qualname__
+        return f"{module}.{name}"
+
     def __repr__(self) -> str:
         """Return the job."""
         return f"<Job {self.name} {self.job_type} {self.target}>"
@@ -391,6 +409,120 @@ def get_hassjob_callable_job_type(target: Callable[..., Any]) -> HassJobType:
     return HassJobType.Executor
 
 
+class LatencyHistogram:
+    """Count durations in the loop stats buckets."""
+
+    __slots__ = ("buckets", "count", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize the histogram."""
+        self.buckets = [0] * (len(LOOP_STATS_BUCKETS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, duration: float) -> None:
+        """Record a duration in seconds."""
+        self.buckets[bisect_left(LOOP_STATS_BUCKETS, duration)] += 1
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "buckets": dict(
+                zip((*map(str, LOOP_STATS_BUCKETS), "inf"), self.buckets, strict=True)
+            ),
+        }
+
+
+class LoopStats:
+    """Track how long the event loop is kept busy.
+
+    The time callback jobs and the eager start of coroutine jobs run by
+    async_run_hass_job take is tracked per job, the time firing an event
+    takes is tracked per event type. The loop lag is the delay of a timer
+    that is sampled every LOOP_LAG_SAMPLE_INTERVAL seconds.
+
+    Nothing is tracked until the loop stats are started, which is done
+    from the profiler integration.
+    """
+
+    __slots__ = ("_hass", "_lag_timer", "active", "events", "jobs", "loop_lag")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the loop stats."""
+        self._hass = hass
+        self.active = False
+        self._lag_timer: asyncio.TimerHandle | None = None
+        self.jobs: defaultdict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self.events: defaultdict[EventType[Any] | str, LatencyHistogram] = defaultdict(
+            LatencyHistogram
+        )
+        self.loop_lag = LatencyHistogram()
+
+    @callback
+    def async_start(self) -> None:
+        """Start tracking jobs and events and sampling the loop lag."""
+        self.active = True
+        if self._lag_timer is None:
+            self._async_schedule_lag_sample()
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop tracking, the stats collected so far are kept."""
+        self.active = False
+        if self._lag_timer is not None:
+            self._lag_timer.cancel()
+            self._lag_timer = None
+
+    @callback
+    def _async_schedule_lag_sample(self) -> None:
+        """Schedule the next loop lag sample."""
+        loop = self._hass.loop
+        when = loop.time() + LOOP_LAG_SAMPLE_INTERVAL
+        self._lag_timer = loop.call_at(when, self._async_sample_lag, when)
+
+    @callback
+    def _async_sample_lag(self, scheduled: float) -> None:
+        """Record how late the timer ran."""
+        self.loop_lag.record(max(self._hass.loop.time() - scheduled, 0))
+        self._async_schedule_lag_sample()
+
+    @callback
+    def async_reset(self) -> None:
+        """Reset the loop stats."""
+        self.jobs.clear()
+        self.events.clear()
+        self.loop_lag = LatencyHistogram()
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the loop stats with the busiest jobs and events first."""
+        return {
+            "active": self.active,
+            "buckets": LOOP_STATS_BUCKETS,
+            "loop_lag": self.loop_lag.as_dict(),
+            "jobs": {
+                name: histogram.as_dict()
+                for name, histogram in sorted(
+                    self.jobs.items(), key=lambda item: item[1].total, reverse=True
+                )
+            },
+            "events": {
+                str(event_type): histogram.as_dict()
+                for event_type, histogram in sorted(
+                    self.events.items(), key=lambda item: item[1].total, reverse=True
+                )
+            },
+        }
+
+
 class CoreState(enum.Enum):
     """Represent the current state of Home Assistant."""
 
@@ -433,6 +565,7 @@ class HomeAssistant:
         self.loop = asyncio.get_running_loop()
         self._tasks: set[asyncio.Future[Any]] = set()
         self._background_tasks: set[asyncio.Future[Any]] = set()
+        self.loop_stats = LoopStats(self)
         self.bus = EventBus(self)
         self.services = ServiceRegistry(self)
         self.states = StateMachine(self.bus, self.loop)
@@ -933,6 +1066,8 @@ class HomeAssistant:
         # if TYPE_CHECKING to avoid the overhead of constructing
         # the type used for the cast. For history see:
         # https://github.com/home-assistant/core/pull/71960
+        if self.loop_stats.active:
+            return self._async_run_timed_hass_job(hassjob, args, background)
         if hassjob.job_type is HassJobType.Callback:
             if TYPE_CHECKING:
                 hassjob = cast(HassJob[..., _R], hassjob)
@@ -941,6 +1076,25 @@ class HomeAssistant:
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def _async_run_timed_hass_job[_R](
+        self,
+        hassjob: HassJob[..., Coroutine[Any, Any, _R] | _R],
+        args: tuple[Any, ...],
+        background: bool,
+    ) -> asyncio.Future[_R] | None:
+        """Run a HassJob and record how long it kept the loop busy."""
+        start = perf_counter()
+        task: asyncio.Future[_R] | None = None
+        if hassjob.job_type is HassJobType.Callback:
+            if TYPE_CHECKING:
+                hassjob = cast(HassJob[..., _R], hassjob)
+            hassjob.target(*args)
+        else:
+            task = self._async_add_hass_job(hassjob, *args, background=background)
+        self.loop_stats.jobs[hassjob.stats_name].record(perf_counter() - start)
+        return task
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1142,6 +1296,7 @@ class HomeAssistant:
             task.add_done_callback(self._tasks.remove)
             task.cancel("Home Assistant is stopping")
         self._cancel_cancellable_timers()
+        self.loop_stats.async_stop()
 
         self.exit_code = exit_code
 
@@ -1435,6 +1590,10 @@ class _OneTimeListener(Generic[_DataT]):
 # Empty list, used by EventBus.async_fire_internal
 EMPTY_LIST: list[Any] = []
 
+# Keyed listeners for an event type, indexed by event data key and then
+# by the value of that key in the event data
+_KeyedListenersType = dict[str, dict[Any, list[_FilterableJobType[Any]]]]
+
 
 @functools.lru_cache
 def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> None:
@@ -1446,15 +1605,24 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._keyed_listeners: dict[EventType[Any] | str, _KeyedListenersType] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        self._batch_listeners: list[HassJob[[list[Event[Any]]], None]] = []
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1470,7 +1638,13 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts = {key: len(listeners) for key, listeners in self._listeners.items()}
+        counts[MATCH_ALL] += len(self._batch_listeners)
+        for event_type, keyed in self._keyed_listeners.items():
+            counts[event_type] = counts.get(event_type, 0) + sum(
+                len(jobs) for index in keyed.values() for jobs in index.values()
+            )
+        return counts
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1538,10 +1712,16 @@ class EventBus:
         listeners = self._listeners.get(event_type, EMPTY_LIST)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
             match_all_listeners = self._match_all_listeners
+            batch_listeners = self._batch_listeners
         else:
             match_all_listeners = EMPTY_LIST
+            batch_listeners = EMPTY_LIST
+
+        if event_data is not None and (keyed := self._keyed_listeners.get(event_type)):
+            listeners = listeners + _async_keyed_jobs(keyed, event_data)
 
         event: Event[_DataT] | None = None
+        start = perf_counter() if self._hass.loop_stats.active else None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
                 try:
@@ -1565,6 +1745,96 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if batch_listeners:
+            if not event:
+                event = Event(event_type, event_data, origin, time_fired, context)
+            self._async_run_batch_listeners(batch_listeners, [event])
+
+        if event and start is not None:
+            self._hass.loop_stats.events[event_type].record(perf_counter() - start)
+
+    @callback
+    def async_fire_batch_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        events_data: Iterable[tuple[_DataT, Context]],
+        time_fired: float,
+        origin: EventOrigin = EventOrigin.local,
+    ) -> None:
+        """Fire a batch of events of the same type, for internal use only.
+
+        Listeners and MATCH_ALL listeners run for every event of the batch,
+        batch listeners run once with all events of the batch.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API. We will make
+        breaking changes to this function in the future and it
+        should not be used in integrations.
+
+        This method must be run in the event loop.
+        """
+        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            match_all_listeners = self._match_all_listeners
+            batch_listeners = self._batch_listeners
+        else:
+            match_all_listeners = EMPTY_LIST
+            batch_listeners = EMPTY_LIST
+        keyed = self._keyed_listeners.get(event_type)
+
+        events: list[Event[_DataT]] = []
+        start = perf_counter() if self._hass.loop_stats.active else None
+        for event_data, context in events_data:
+            if self._debug:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+            jobs = listeners
+            if keyed:
+                jobs = jobs + _async_keyed_jobs(keyed, event_data)
+
+            event: Event[_DataT] | None = None
+            for job, event_filter in jobs + match_all_listeners:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event_data):
+                            continue
+                    except Exception:
+                        _LOGGER.exception("Error in event filter")
+                        continue
+
+                if not event:
+                    event = Event(event_type, event_data, origin, time_fired, context)
+
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+            if batch_listeners:
+                events.append(
+                    event or Event(event_type, event_data, origin, time_fired, context)
+                )
+
+        if events:
+            self._async_run_batch_listeners(batch_listeners, events)
+
+        if start is not None:
+            self._hass.loop_stats.events[event_type].record(perf_counter() - start)
+
+    @callback
+    def _async_run_batch_listeners(
+        self,
+        batch_listeners: list[HassJob[[list[Event[Any]]], None]],
+        events: list[Event[Any]],
+    ) -> None:
+        """Run the batch listeners with a list of events."""
+        for job in batch_listeners:
+            try:
+                self._hass.async_run_hass_job(job, events)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1640,6 +1910,82 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        keys: str | Iterable[str],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type matching one of the keys.
+
+        The listener only runs when the value of data_key in the event data
+        is one of the passed keys, for example when the entity_id of a
+        state_changed event is one of the tracked entities.
+
+        Matching is done with a dict lookup when the event is fired,
+        unlike an event_filter which must be called for every event.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require a specific event type")
+        if isinstance(keys, str):
+            keys = [keys]
+        filterable_job: _FilterableJobType[_DataT] = (
+            HassJob(listener, f"listen {event_type} by {data_key}"),
+            None,
+        )
+        index = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        keys = set(keys)
+        for key in keys:
+            index.setdefault(key, []).append(filterable_job)
+        return functools.partial(
+            self._async_remove_keyed_listener,
+            event_type,
+            data_key,
+            keys,
+            filterable_job,
+        )
+
+    @callback
+    def async_listen_batch(
+        self, listener: Callable[[list[Event[Any]]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for all events, delivered in lists.
+
+        The events of a batch fired with async_fire_batch_internal, like the
+        state changes of a state machine batch, are delivered in one list.
+        Other events are delivered in a list of one event. Like MATCH_ALL
+        listeners, batch listeners do not get the events excluded from
+        MATCH_ALL. The listener must be a callback.
+
+        This method must be run in the event loop.
+        """
+        if not is_callback_check_partial(listener):
+            raise HomeAssistantError(f"Batch listener {listener} is not a callback")
+        job: HassJob[[list[Event[Any]]], None] = HassJob(
+            listener, "listen batch", job_type=HassJobType.Callback
+        )
+        self._batch_listeners.append(job)
+        return functools.partial(self._async_remove_batch_listener, job)
+
+    @callback
+    def _async_remove_batch_listener(
+        self, job: HassJob[[list[Event[Any]]], None]
+    ) -> None:
+        """Remove a batch listener.
+
+        This method must be run in the event loop.
+        """
+        try:
+            self._batch_listeners.remove(job)
+        except ValueError:
+            _LOGGER.exception("Unable to remove unknown batch listener %s", job)
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1728,6 +2074,60 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        keys: set[str],
+        filterable_job: _FilterableJobType[_DataT],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed = self._keyed_listeners[event_type]
+            index = keyed[data_key]
+            for key in keys:
+                jobs = index[key]
+                jobs.remove(filterable_job)
+                if not jobs:
+                    del index[key]
+        except (KeyError, ValueError):
+            # KeyError if the event_type, data_key or key did not exist
+            # ValueError if listener did not exist for the key
+            _LOGGER.exception(
+                "Unable to remove unknown keyed job listener %s", filterable_job
+            )
+            return
+
+        # delete the indexes once they are empty
+        if not index:
+            del keyed[data_key]
+            if not keyed:
+                del self._keyed_listeners[event_type]
+
+
+def _async_keyed_jobs(
+    keyed: _KeyedListenersType, event_data: Mapping[str, Any]
+) -> list[_FilterableJobType[Any]]:
+    """Return the keyed listener jobs matching the event data."""
+    if len(keyed) == 1:
+        data_key, index = next(iter(keyed.items()))
+        try:
+            return index.get(event_data.get(data_key), EMPTY_LIST)
+        except TypeError:
+            # The value in the event data is not hashable
+            return EMPTY_LIST
+    jobs: list[_FilterableJobType[Any]] = []
+    for data_key, index in keyed.items():
+        try:
+            jobs.extend(index.get(event_data.get(data_key), EMPTY_LIST))
+        except TypeError:
+            continue
+    return jobs
+
 
 class CompressedState(TypedDict):
     """Compressed dict of a state."""
@@ -2034,10 +2434,31 @@ class States(UserDict[str, State]):
         return self._domain_index[key].values()
 
 
+class _StateBatch:
+    """State changes written in a state machine batch."""
+
+    __slots__ = ("timestamp", "context", "changed", "reported")
+
+    def __init__(self, timestamp: float, context: Context) -> None:
+        """Initialize a state batch."""
+        self.timestamp = timestamp
+        self.context = context
+        self.changed: list[tuple[EventStateChangedData, Context]] = []
+        self.reported: list[tuple[EventStateReportedData, Context]] = []
+
+
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_all_json",
+        "_batch",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2046,8 +2467,11 @@ class StateMachine:
         # up read operations
         self._states_data = self._states.data
         self._reservations: set[str] = set()
+        # The joined JSON of all states by compressed, cleared when a state changes
+        self._all_json: dict[bool, bytes] = {}
         self._bus = bus
         self._loop = loop
+        self._batch: _StateBatch | None = None
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2118,6 +2542,34 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_json(self, compressed: bool = False) -> bytes:
+        """Return the JSON of all states joined by commas.
+
+        The states are serialized with State.as_dict_json, or with
+        State.as_compressed_state_json when compressed, in the order of
+        async_all. The result is kept until a state changes so every client
+        fetching all states shares it.
+
+        Raises ValueError or TypeError if a state can not be serialized.
+
+        This method must be run in the event loop.
+        """
+        if (joined := self._all_json.get(compressed)) is None:
+            if compressed:
+                joined = b",".join(
+                    [
+                        state.as_compressed_state_json
+                        for state in self._states_data.values()
+                    ]
+                )
+            else:
+                joined = b",".join(
+                    [state.as_dict_json for state in self._states_data.values()]
+                )
+            self._all_json[compressed] = joined
+        return joined
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2159,12 +2611,18 @@ class StateMachine:
         if old_state is None:
             return False
 
+        if self._all_json:
+            self._all_json.clear()
+
         old_state.expire()
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
             "new_state": None,
         }
+        if (batch := self._batch) is not None:
+            batch.changed.append((state_changed_data, context or batch.context))
+            return True
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -2253,6 +2711,54 @@ class StateMachine:
             timestamp or time.time(),
         )
 
+    @contextmanager
+    def async_batch(self, context: Context | None = None) -> Generator[None]:
+        """Write the state changes made in the block as one batch.
+
+        All states written in the batch share one timestamp and, unless
+        a context is passed when writing them, one context. The
+        state_changed and state_reported events are fired per entity when
+        the block exits and batch listeners get all events of a type in
+        one list. A batch started inside a batch joins the outer batch.
+
+        This method must be run in the event loop.
+        """
+        if self._batch is not None:
+            yield
+            return
+        timestamp = time.time()
+        batch = _StateBatch(timestamp, context or Context(id=ulid_at_time(timestamp)))
+        self._batch = batch
+        try:
+            yield
+        finally:
+            self._batch = None
+            if batch.changed:
+                self._bus.async_fire_batch_internal(
+                    EVENT_STATE_CHANGED, batch.changed, timestamp
+                )
+            if batch.reported:
+                self._bus.async_fire_batch_internal(
+                    EVENT_STATE_REPORTED, batch.reported, timestamp
+                )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the states of several entities in one batch.
+
+        States is an iterable of entity_id, state and attributes tuples.
+
+        This method must be run in the event loop.
+        """
+        with self.async_batch(context):
+            for entity_id, new_state, attributes in states:
+                self.async_set(entity_id, new_state, attributes, force_update, context)
+
     @callback
     def async_set_internal(
         self,
@@ -2287,7 +2793,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities pass the attributes of the last write again
+            # when they did not change
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2301,6 +2811,10 @@ class StateMachine:
         # timestamp implementation:
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
         # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+        if (batch := self._batch) is not None:
+            timestamp = batch.timestamp
+            if context is None:
+                context = batch.context
         now = dt_util.utc_from_timestamp(timestamp)
 
         if context is None:
@@ -2311,14 +2825,17 @@ class StateMachine:
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
             old_state.last_reported = now  # type: ignore[union-attr]
             old_state.last_reported_timestamp = timestamp  # type: ignore[union-attr]
-            # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
+            state_reported_data: EventStateReportedData = {
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
+            if batch is not None:
+                batch.reported.append((state_reported_data, context))
+                return
+            self._bus.async_fire_internal(
                 EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
+                state_reported_data,
                 context=context,
                 time_fired=timestamp,
             )
@@ -2346,11 +2863,16 @@ class StateMachine:
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
+        if self._all_json:
+            self._all_json.clear()
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
             "new_state": state,
         }
+        if batch is not None:
+            batch.changed.append((state_changed_data, context))
+            return
         self._bus.async_fire_internal(
             EVENT_STATE_CHANGED,
             state_changed_data,
@@ -57,6 +57,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -66,6 +67,7 @@ from .event import (
 )
 from .frame import report_non_thread_safe_operation
 from .typing import UNDEFINED, StateType, UndefinedType
+from .update_executor import async_get_update_executor
 
 timer = time.time
 
@@ -231,6 +233,42 @@ class EntityPlatformState(Enum):
 
 _SENTINEL = object()
 
+# The attributes set from entity properties, in the order of the values
+# returned in static_attr by Entity.__async_calculate_state
+_STATIC_ATTRIBUTES = (
+    ATTR_UNIT_OF_MEASUREMENT,
+    ATTR_ASSUMED_STATE,
+    ATTR_ATTRIBUTION,
+    ATTR_DEVICE_CLASS,
+    ATTR_ENTITY_PICTURE,
+    ATTR_ICON,
+    ATTR_FRIENDLY_NAME,
+    ATTR_SUPPORTED_FEATURES,
+)
+
+
+def _build_attributes(
+    capability_attr: Mapping[str, Any] | None,
+    state_attr: Mapping[str, Any] | None,
+    extra_state_attr: Mapping[str, Any] | None,
+    static_attr: tuple[Any, ...],
+) -> dict[str, Any]:
+    """Build the attribute dictionary of an entity."""
+    attr = dict(capability_attr) if capability_attr else {}
+    if state_attr:
+        attr.update(state_attr)
+    if extra_state_attr:
+        attr.update(extra_state_attr)
+    for key, value in zip(_STATIC_ATTRIBUTES, static_attr, strict=True):
+        if value is not None:
+            attr[key] = value
+    return attr
+
+
+def _copy_mapping(mapping: Mapping[str, Any] | None) -> dict[str, Any] | None:
+    """Return a copy of a mapping to compare it with later."""
+    return None if mapping is None else dict(mapping)
+
 
 class EntityDescription(metaclass=FrozenOrThawed, frozen_or_thawed=True):
     """A class that describes Home Assistant entities."""
@@ -519,6 +557,9 @@ class Entity(
 
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
+    # The attributes written last and the values they were built from
+    __attributes: ReadOnlyDict[str, Any] | None = None
+    __attributes_inputs: tuple[Any, ...] | None = None
     __remove_future: asyncio.Future[None] | None = None
 
     # Entity Properties
@@ -1040,18 +1081,43 @@ class Entity(
     @callback
     def _async_calculate_state(self) -> CalculatedState:
         """Calculate state string and attribute mapping."""
-        state, attr, capabilities, _, _ = self.__async_calculate_state()
-        return CalculatedState(state, attr, capabilities)
+        (
+            state,
+            capability_attr,
+            state_attr,
+            extra_state_attr,
+            static_attr,
+            _,
+            _,
+        ) = self.__async_calculate_state()
+        return CalculatedState(
+            state,
+            _build_attributes(
+                capability_attr, state_attr, extra_state_attr, static_attr
+            ),
+            capability_attr,
+        )
 
     def __async_calculate_state(
         self,
-    ) -> tuple[str, dict[str, Any], Mapping[str, Any] | None, str | None, int | None]:
-        """Calculate state string and attribute mapping.
+    ) -> tuple[
+        str,
+        Mapping[str, Any] | None,
+        Mapping[str, Any] | None,
+        Mapping[str, Any] | None,
+        tuple[Any, ...],
+        str | None,
+        int | None,
+    ]:
+        """Calculate state string and the values the attributes are built from.
 
         Returns a tuple:
         state - the stringified state
-        attr - the attribute dictionary
         capability_attr - a mapping with capability attributes
+        state_attr - the state attributes, None if the entity is unavailable
+        extra_state_attr - the extra state attributes, None if the entity is
+            unavailable
+        static_attr - the values of the _STATIC_ATTRIBUTES, None if not set
         original_device_class - the device class which may be overridden
         supported_features - the supported features
 
@@ -1061,46 +1127,39 @@ class Entity(
         entry = self.registry_entry
 
         capability_attr = self.capability_attributes
-        attr = capability_attr.copy() if capability_attr else {}
 
         available = self.available  # only call self.available once per update cycle
         state = self._stringify_state(available)
         if available:
-            if state_attributes := self.state_attributes:
-                attr.update(state_attributes)
-            if extra_state_attributes := self.extra_state_attributes:
-                attr.update(extra_state_attributes)
-
-        if (unit_of_measurement := self.unit_of_measurement) is not None:
-            attr[ATTR_UNIT_OF_MEASUREMENT] = unit_of_measurement
-
-        if assumed_state := self.assumed_state:
-            attr[ATTR_ASSUMED_STATE] = assumed_state
-
-        if (attribution := self.attribution) is not None:
-            attr[ATTR_ATTRIBUTION] = attribution
+            state_attr = self.state_attributes
+            extra_state_attr = self.extra_state_attributes
+        else:
+            state_attr = extra_state_attr = None
 
         original_device_class = self.device_class
-        if (
-            device_class := (entry and entry.device_class) or original_device_class
-        ) is not None:
-            attr[ATTR_DEVICE_CLASS] = str(device_class)
-
-        if (entity_picture := self.entity_picture) is not None:
-            attr[ATTR_ENTITY_PICTURE] = entity_picture
-
-        if (icon := (entry and entry.icon) or self.icon) is not None:
-            attr[ATTR_ICON] = icon
-
-        if (
-            name := (entry and entry.name) or self._friendly_name_internal()
-        ) is not None:
-            attr[ATTR_FRIENDLY_NAME] = name
-
-        if (supported_features := self.supported_features) is not None:
-            attr[ATTR_SUPPORTED_FEATURES] = supported_features
+        device_class = (entry and entry.device_class) or original_device_class
+        supported_features = self.supported_features
+
+        static_attr = (
+            self.unit_of_measurement,
+            self.assumed_state or None,
+            self.attribution,
+            None if device_class is None else str(device_class),
+            self.entity_picture,
+            (entry and entry.icon) or self.icon,
+            (entry and entry.name) or self._friendly_name_internal(),
+            supported_features,
+        )
 
-        return (state, attr, capability_attr, original_device_class, supported_features)
+        return (
+            state,
+            capability_attr,
+            state_attr,
+            extra_state_attr,
+            static_attr,
+            original_device_class,
+            supported_features,
+        )
 
     @callback
     def _async_write_ha_state(self) -> None:
@@ -1126,9 +1185,15 @@ class Entity(
             return
 
         state_calculate_start = timer()
-        state, attr, capabilities, original_device_class, supported_features = (
-            self.__async_calculate_state()
-        )
+        (
+            state,
+            capabilities,
+            state_attr,
+            extra_state_attr,
+            static_attr,
+            original_device_class,
+            supported_features,
+        ) = self.__async_calculate_state()
         time_now = timer()
 
         if entry:
@@ -1192,11 +1257,38 @@ class Entity(
             # set and catch the exception if it is not.
             customize = hass.data[DATA_CUSTOMIZE]
         except KeyError:
-            pass
+            custom = None
         else:
-            # Overwrite properties that have been set in the config file.
-            if custom := customize.get(entity_id):
-                attr.update(custom)
+            custom = customize.get(entity_id)
+
+        # Most writes only change the state, so the attributes written last
+        # time are reused when the values they were built from are equal.
+        # Passing the same object lets the state machine skip comparing them.
+        attributes_inputs = (
+            static_attr,
+            custom,
+            capabilities,
+            state_attr,
+            extra_state_attr,
+        )
+        if (attr := self.__attributes) is None or (
+            attributes_inputs != self.__attributes_inputs
+        ):
+            attr_dict = _build_attributes(
+                capabilities, state_attr, extra_state_attr, static_attr
+            )
+            if custom:
+                # Overwrite properties that have been set in the config file.
+                attr_dict.update(custom)
+            attr = self.__attributes = ReadOnlyDict(attr_dict)
+            # The mappings are copied as entities may modify them in place
+            self.__attributes_inputs = (
+                static_attr,
+                custom,
+                _copy_mapping(capabilities),
+                _copy_mapping(state_attr),
+                _copy_mapping(extra_state_attr),
+            )
 
         if (
             self._context_set is not None
@@ -1299,7 +1391,12 @@ class Entity(
             if hasattr(self, "async_update"):
                 await self.async_update()
             elif hasattr(self, "update"):
-                await hass.async_add_executor_job(self.update)
+                if self.platform:
+                    await async_get_update_executor(hass).async_run(
+                        self.platform.platform_name, self.update
+                    )
+                else:
+                    await hass.async_add_executor_job(self.update)
             else:
                 return
         finally:
@@ -8,6 +8,7 @@ from contextvars import ContextVar
 from datetime import timedelta
 from functools import partial
 from logging import Logger, getLogger
+import time
 from typing import TYPE_CHECKING, Any, Protocol
 
 from homeassistant import config_entries
@@ -50,7 +51,9 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .singleton import singleton
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
+from .update_executor import async_get_update_executor
 
 if TYPE_CHECKING:
     from .entity import Entity
@@ -71,6 +74,12 @@ DATA_DOMAIN_PLATFORM_ENTITIES: HassKey[dict[tuple[str, str], dict[str, Entity]]]
 )
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+DATA_POLLING_SCHEDULER: HassKey[PollingScheduler] = HassKey("polling_scheduler")
+# Platforms with the same scan interval are spread over slots of at least
+# this many seconds, with at most POLLING_MAX_SLOTS slots per interval
+POLLING_MIN_SLOT_SECONDS = 1
+POLLING_MAX_SLOTS = 60
+
 _LOGGER = getLogger(__name__)
 
 
@@ -147,8 +156,8 @@ class EntityPlatform:
         self._tasks: list[asyncio.Task[None]] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
-        # Method to cancel the state change listener
-        self._async_polling_timer: asyncio.TimerHandle | None = None
+        # Method to stop polling with the polling scheduler
+        self._async_unsub_polling: CALLBACK_TYPE | None = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -202,6 +211,9 @@ class EntityPlatform:
         The default value for parallel requests is decided based on the first
         entity of the platform which is added to Home Assistant. It's 1 if the
         entity implements the update method, else it's 0.
+
+        An explicit parallel updates of a platform with sync updates also
+        raises the number of update executor workers the integration may use.
         """
         if self.parallel_updates_created:
             return self.parallel_updates
@@ -210,6 +222,11 @@ class EntityPlatform:
 
         parallel_updates = getattr(self.platform, "PARALLEL_UPDATES", None)
 
+        if parallel_updates is not None and entity_has_sync_update:
+            async_get_update_executor(self.hass).async_set_parallel_updates(
+                self.platform_name, parallel_updates
+            )
+
         if parallel_updates is None and entity_has_sync_update:
             parallel_updates = 1
 
@@ -648,7 +665,7 @@ class EntityPlatform:
 
         if (
             (self.config_entry and self.config_entry.pref_disable_polling)
-            or self._async_polling_timer is not None
+            or self._async_unsub_polling is not None
             or not any(
                 # Entity may have failed to add or called `add_to_platform_abort`
                 # so we check if the entity is in self.entities before
@@ -662,18 +679,13 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
+        self._async_unsub_polling = async_get_polling_scheduler(
+            self.hass
+        ).async_register(self)
 
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
-            self._async_handle_interval_callback,
-        )
         if self.config_entry:
             self.config_entry.async_create_background_task(
                 self.hass,
@@ -939,9 +951,9 @@ class EntityPlatform:
     @callback
     def async_unsub_polling(self) -> None:
         """Stop polling."""
-        if self._async_polling_timer is not None:
-            self._async_polling_timer.cancel()
-            self._async_polling_timer = None
+        if self._async_unsub_polling is not None:
+            self._async_unsub_polling()
+            self._async_unsub_polling = None
 
     @callback
     def async_prepare(self) -> None:
@@ -963,7 +975,7 @@ class EntityPlatform:
         await self.entities[entity_id].async_remove()
 
         # Clean up polling job if no longer needed
-        if self._async_polling_timer is not None and not any(
+        if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
             self.async_unsub_polling()
@@ -1025,6 +1037,7 @@ class EntityPlatform:
 
         This method must be run in the event loop.
         """
+        scheduler = async_get_polling_scheduler(self.hass)
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
         if self._process_updates.locked():
@@ -1034,28 +1047,233 @@ class EntityPlatform:
                 self.domain,
                 self.scan_interval,
             )
+            scheduler.record_overrun(self)
             return
 
         async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
-                return
+            start = time.perf_counter()
+            try:
+                await self._async_poll_entities()
+            finally:
+                scheduler.record_poll(self, time.perf_counter() - start)
+
+    async def _async_poll_entities(self) -> None:
+        """Update the states of all the polling entities."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
+
+        if tasks := [
+            create_eager_task(entity.async_update_ha_state(True), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
+
+
+class PollingStats:
+    """Poll counters of a platform."""
+
+    __slots__ = ("last", "max", "overruns", "polls", "total")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.polls = 0
+        self.overruns = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "polls": self.polls,
+            "overruns": self.overruns,
+            "total": self.total,
+            "last": self.last,
+            "max": self.max,
+        }
+
+
+class _PollingGroup:
+    """Poll the platforms that share a scan interval.
+
+    The interval is divided in slots and each platform is polled in one of
+    them, so platforms in the same slot are polled by the same timer. A
+    platform is added to the least used slot whose next occurrence comes
+    first, skipping only the occurrences due within the next slot length.
+    The first poll is therefore at most one scan interval and one slot
+    after the platform was added.
+    """
+
+    __slots__ = ("_loop", "_slot_seconds", "_timers", "epoch", "interval", "slots")
+
+    def __init__(self, scheduler: PollingScheduler, interval: float) -> None:
+        """Initialize the polling group."""
+        self._loop = scheduler.hass.loop
+        self.interval = interval
+        num_slots = max(
+            1, min(POLLING_MAX_SLOTS, int(interval // POLLING_MIN_SLOT_SECONDS))
+        )
+        self._slot_seconds = interval / num_slots
+        # The platforms of each slot with the number, counted from epoch,
+        # of the slot they are first polled in
+        self.slots: list[dict[EntityPlatform, int]] = [{} for _ in range(num_slots)]
+        self._timers: list[asyncio.TimerHandle | None] = [None] * num_slots
+        self.epoch = self._loop.time()
+
+    def _next_slot_after(self, now: float, slot: int) -> int:
+        """Return the number, counted from epoch, of the next occurrence of a slot."""
+        num_slots = len(self.slots)
+        current = int((now - self.epoch) // self._slot_seconds)
+        next_slot = current - current % num_slots + slot
+        if next_slot <= current:
+            next_slot += num_slots
+        return next_slot
+
+    @callback
+    def async_add(self, platform: EntityPlatform) -> None:
+        """Add a platform to the least used slot."""
+        num_slots = len(self.slots)
+        # The first slot that is not due within the next slot length
+        earliest = int((self._loop.time() - self.epoch) // self._slot_seconds) + 2
+        least_used = min(map(len, self.slots))
+        # The first occurrence of the least used slots that is not too soon
+        first_slot = min(
+            earliest + (slot - earliest) % num_slots
+            for slot, platforms in enumerate(self.slots)
+            if len(platforms) == least_used
+        )
+        slot = first_slot % num_slots
+        self.slots[slot][platform] = first_slot
+        if self._timers[slot] is None:
+            self._async_schedule(first_slot)
+
+    @callback
+    def async_remove(self, platform: EntityPlatform) -> bool:
+        """Remove a platform and return if the group is empty."""
+        for slot, platforms in enumerate(self.slots):
+            if platform not in platforms:
+                continue
+            del platforms[platform]
+            if not platforms and (timer := self._timers[slot]) is not None:
+                timer.cancel()
+                self._timers[slot] = None
+        return not any(self.slots)
+
+    @callback
+    def _async_schedule(self, next_slot: int) -> None:
+        """Schedule the timer of a slot.
+
+        Each used slot has a timer of its own so all the slots that are due
+        are polled when the loop wakes up late.
+        """
+        self._timers[next_slot % len(self.slots)] = self._loop.call_at(
+            self.epoch + next_slot * self._slot_seconds, self._async_poll, next_slot
+        )
+
+    @callback
+    def _async_poll(self, slot_number: int) -> None:
+        """Poll the platforms of a slot and schedule its next occurrence."""
+        slot = slot_number % len(self.slots)
+        # Occurrences missed while the loop was blocked are skipped
+        self._async_schedule(
+            max(
+                slot_number + len(self.slots),
+                self._next_slot_after(self._loop.time(), slot),
+            )
+        )
+        # Polling may add or remove platforms, iterate over a copy
+        for platform, first_slot in list(self.slots[slot].items()):
+            if first_slot <= slot_number:
+                platform._async_handle_interval_callback()  # noqa: SLF001
+
+
+class PollingScheduler:
+    """Schedule the polling of all entity platforms.
+
+    Platforms are grouped by scan interval and spread over the interval so
+    polls do not line up.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the polling scheduler."""
+        self.hass = hass
+        self._groups: dict[float, _PollingGroup] = {}
+        self.stats: dict[str, PollingStats] = {}
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
+    @callback
+    def async_register(self, platform: EntityPlatform) -> CALLBACK_TYPE:
+        """Start polling a platform at its scan interval."""
+        interval = platform.scan_interval_seconds
+        if (group := self._groups.get(interval)) is None:
+            group = self._groups[interval] = _PollingGroup(self, interval)
+        group.async_add(platform)
+
+        @callback
+        def _async_unregister() -> None:
+            if group.async_remove(platform) and self._groups.get(interval) is group:
+                del self._groups[interval]
+
+        return _async_unregister
+
+    def _platform_stats(self, platform: EntityPlatform) -> PollingStats:
+        """Return the stats of a platform."""
+        key = f"{platform.domain}.{platform.platform_name}"
+        if (stats := self.stats.get(key)) is None:
+            stats = self.stats[key] = PollingStats()
+        return stats
+
+    def record_poll(self, platform: EntityPlatform, duration: float) -> None:
+        """Record the duration of a poll of a platform."""
+        stats = self._platform_stats(platform)
+        stats.polls += 1
+        stats.total += duration
+        stats.last = duration
+        if duration > stats.max:
+            stats.max = duration
+
+    def record_overrun(self, platform: EntityPlatform) -> None:
+        """Record a poll skipped because the previous one was still running."""
+        self._platform_stats(platform).overruns += 1
+
+    @callback
+    def async_reset(self) -> None:
+        """Reset the poll stats."""
+        self.stats.clear()
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the polling groups and the platforms that poll longest first."""
+        return {
+            "groups": [
+                {
+                    "interval": interval,
+                    "slots": [len(platforms) for platforms in group.slots],
+                }
+                for interval, group in sorted(self._groups.items())
+            ],
+            "platforms": [
+                {"platform": platform, **stats.as_dict()}
+                for platform, stats in sorted(
+                    self.stats.items(), key=lambda item: item[1].total, reverse=True
                 )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+            ],
+        }
+
+
+@callback
+@singleton(DATA_POLLING_SCHEDULER)
+def async_get_polling_scheduler(hass: HomeAssistant) -> PollingScheduler:
+    """Return the polling scheduler."""
+    return PollingScheduler(hass)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -54,7 +54,12 @@ from .entity_registry import (
 )
 from .ratelimit import KeyedRateLimit
 from .sun import get_astral_event_next
-from .template import RenderInfo, Template, result_as_boolean
+from .template import (
+    RenderInfo,
+    Template,
+    async_get_template_render_stats,
+    result_as_boolean,
+)
 from .typing import TemplateVarsType
 
 _TRACK_STATE_CHANGE_DATA: HassKey[_KeyedEventData[EventStateChangedData]] = HassKey(
@@ -107,14 +112,20 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    filter_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                _TypedDictT,
+            ],
+            bool,
+        ]
+        | None
+    ) = None
+    # Key of the event data the callbacks are keyed by, when set the
+    # bus matches the events with a keyed listener instead of the filter
+    data_key: str | None = None
 
 
 @dataclass(slots=True, frozen=True)
@@ -123,6 +134,7 @@ class _KeyedEventData(Generic[_TypedDictT]):
 
     listener: CALLBACK_TYPE
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    key_listeners: dict[str, CALLBACK_TYPE]
 
 
 @dataclass(slots=True)
@@ -358,21 +370,11 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    data_key="entity_id",
 )
 
 
@@ -393,7 +395,7 @@ _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
     key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    data_key="entity_id",
 )
 
 
@@ -423,10 +425,13 @@ def _remove_listener(
     callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
 ) -> None:
     """Remove listener."""
+    key_listeners = hass.data[tracker.key].key_listeners
     for key in keys:
         callbacks[key].remove(job)
         if not callbacks[key]:
             del callbacks[key]
+            if key in key_listeners:
+                key_listeners.pop(key)()
 
     if not callbacks:
         hass.data.pop(tracker.key).listener()
@@ -455,12 +460,16 @@ def _async_track_event(
         callbacks = event_data.callbacks
     else:
         callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
+        if tracker.filter_callable is None:
+            # The keys are listened to one by one below
+            listener = _remove_empty_listener
+        else:
+            listener = hass.bus.async_listen(
+                tracker.event_type,
+                partial(tracker.dispatcher_callable, hass, callbacks),
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
+        event_data = _KeyedEventData(listener, callbacks, {})
         hass_data[tracker_key] = event_data
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
@@ -477,6 +486,17 @@ def _async_track_event(
         for key in keys:
             callbacks[key].append(job)
 
+    if (data_key := tracker.data_key) is not None:
+        # Let the bus match the events to the keys with a dict lookup
+        # instead of calling a filter for every event of the type
+        key_listeners = event_data.key_listeners
+        if new_keys := [key for key in keys if key not in key_listeners]:
+            dispatcher = partial(tracker.dispatcher_callable, hass, callbacks)
+            for key in new_keys:
+                key_listeners[key] = hass.bus.async_listen_keyed(
+                    tracker.event_type, data_key, key, dispatcher
+                )
+
     return partial(_remove_listener, hass, tracker, keys, job, callbacks)
 
 
@@ -541,16 +561,6 @@ def async_track_entity_registry_updated_event(
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
@@ -575,7 +585,7 @@ _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
     key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
     dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    data_key="device_id",
 )
 
 
@@ -982,6 +992,7 @@ class TrackTemplateResultInfo:
         self._last_result: dict[Template, bool | str | TemplateError] = {}
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_stats = async_get_template_render_stats(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1129,6 +1140,7 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            self._render_stats.record_trigger(template.template)
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1950,7 +1962,18 @@ def _event_triggers_rerender(
     entity_id = event.data["entity_id"]
 
     if info.filter(entity_id):
-        return True
+        if (
+            (attributes := info.entity_attributes.get(entity_id)) is None
+            or (old_state := event.data["old_state"]) is None
+            or (new_state := event.data["new_state"]) is None
+        ):
+            return True
+        # Only the state and some attributes of the entity were read
+        # so changes to anything else can not change the result
+        return old_state.state != new_state.state or any(
+            old_state.attributes.get(name) != new_state.attributes.get(name)
+            for name in attributes
+        )
 
     if event.data["new_state"] is not None and event.data["old_state"] is not None:
         return False
@@ -138,6 +138,8 @@ class RestoreStateData:
             hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
         )
         self.last_states: dict[str, StoredState] = {}
+        # Stored states of the previous run that have not been decoded yet
+        self._stored_items: dict[str, dict[str, Any]] = {}
         self.entities: dict[str, RestoreEntity] = {}
 
     async def async_setup(self) -> None:
@@ -159,16 +161,30 @@ class RestoreStateData:
             _LOGGER.error("Error loading last states", exc_info=exc)
             stored_states = None
 
+        self.last_states = {}
         if stored_states is None:
             _LOGGER.debug("Not creating cache - no saved states found")
-            self.last_states = {}
+            self._stored_items = {}
         else:
-            self.last_states = {
-                item["state"]["entity_id"]: StoredState.from_dict(item)
+            # Decoding the states is deferred until an entity restores its
+            # state, so startup does not have to build a State object for
+            # every entity that was ever stored
+            self._stored_items = {
+                item["state"]["entity_id"]: item
                 for item in stored_states
                 if valid_entity_id(item["state"]["entity_id"])
             }
-            _LOGGER.debug("Created cache with %s", list(self.last_states))
+            _LOGGER.debug("Created cache with %s", list(self._stored_items))
+
+    @callback
+    def async_get_stored_state(self, entity_id: str) -> StoredState | None:
+        """Return the stored state of an entity from the previous run."""
+        if (stored_state := self.last_states.get(entity_id)) is not None:
+            return stored_state
+        if (item := self._stored_items.pop(entity_id, None)) is None:
+            return None
+        stored_state = self.last_states[entity_id] = StoredState.from_dict(item)
+        return stored_state
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -178,6 +194,19 @@ class RestoreStateData:
         stored states from the previous run, which have not been created as
         entities on this run, and have not expired.
         """
+        stored_states, stored_items = self._async_get_stored_states_and_items()
+        stored_states.extend(StoredState.from_dict(item) for item in stored_items)
+        return stored_states
+
+    @callback
+    def _async_get_stored_states_and_items(
+        self,
+    ) -> tuple[list[StoredState], list[dict[str, Any]]]:
+        """Get the states and the undecoded items which should be stored.
+
+        The items of the previous run that no entity restored are returned
+        in their stored form, so a dump does not have to decode them.
+        """
         now = dt_util.utcnow()
         all_states = self.hass.states.async_all()
         # Entities currently backed by an entity object
@@ -212,17 +241,29 @@ class RestoreStateData:
 
             stored_states.append(stored_state)
 
-        return stored_states
+        stored_items: list[dict[str, Any]] = []
+        for entity_id, item in self._stored_items.items():
+            if entity_id in current_states_by_entity_id:
+                continue
+
+            last_seen = item["last_seen"]
+            if isinstance(last_seen, str):
+                last_seen = dt_util.parse_datetime(last_seen)
+            if last_seen is None or last_seen < expiration_time:
+                continue
+
+            stored_items.append(item)
+
+        return stored_states, stored_items
 
     async def async_dump_states(self) -> None:
         """Save the current state machine to storage."""
         _LOGGER.debug("Dumping states")
+        stored_states, stored_items = self._async_get_stored_states_and_items()
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                [stored_state.as_dict() for stored_state in stored_states]
+                + stored_items
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
@@ -277,6 +318,7 @@ class RestoreStateData:
         if state is not None:
             state = State.from_dict(json_loads(state.as_dict_json))  # type: ignore[arg-type]
         if state is not None:
+            self._stored_items.pop(entity_id, None)
             self.last_states[entity_id] = StoredState(
                 state, extra_data, dt_util.utcnow()
             )
@@ -308,7 +350,7 @@ class RestoreEntity(Entity):
                 "Cannot get last state. Entity not added to hass"
             )
             return None
-        return async_get(self.hass).last_states.get(self.entity_id)
+        return async_get(self.hass).async_get_stored_state(self.entity_id)
 
     async def async_get_last_state(self) -> State | None:
         """Get the entity state from the previous run."""
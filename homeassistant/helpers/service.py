@@ -893,14 +893,13 @@ def _get_permissible_entity_candidates(
     # entities so we do not need to check again.
     if TYPE_CHECKING:
         assert all_referenced is not None
-    if (
-        len(all_referenced) == 1
-        and (single_entity := list(all_referenced)[0])
-        and (entity := entities.get(single_entity)) is not None
-    ):
-        return [entity]
-
-    return [entities[entity_id] for entity_id in all_referenced.intersection(entities)]
+    # Look up the referenced entities instead of intersecting them with
+    # the registered entities which would iterate over all of them
+    return [
+        entity
+        for entity_id in all_referenced
+        if (entity := entities.get(entity_id)) is not None
+    ]
 
 
 @bind_hass
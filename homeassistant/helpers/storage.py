@@ -13,6 +13,7 @@ import logging
 import os
 from pathlib import Path
 from typing import Any
+from uuid import uuid4
 
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_FINAL_WRITE,
@@ -48,6 +49,13 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the storage file when it has grown
+# to this fraction of the size of the storage file or has this many
+# records
+JOURNAL_COMPACT_RATIO = 0.5
+JOURNAL_MAX_RECORDS = 1000
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -241,8 +249,19 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        journal: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        When journal is set, saves only append the changes since the last
+        write to a journal file next to the storage file, which is
+        compacted into the storage file once it grows too large and on
+        shutdown. Only opt in for data that is not read by other tools,
+        a version of Home Assistant without journal support ignores the
+        changes that were not compacted yet.
+        """
+        if journal and encoder is not None:
+            raise ValueError("A journal can not be used with a custom encoder")
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -258,12 +277,20 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        self._journal_state: _JournalState | None = None
+        self._journal_compact = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -325,6 +352,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -387,6 +416,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -517,6 +549,10 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if self._journal:
+            # Fold the journal into the storage file so the next start
+            # does not have to replay it
+            self._journal_compact = True
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -526,6 +562,24 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             self._async_cleanup_delay_listener()
             self._async_cleanup_final_write_listener()
 
+            if (
+                self._data is None
+                and self._journal_compact
+                and (state := self._journal_state) is not None
+                and state.records
+            ):
+                # Rebuild the data once a running write has appended
+                # its changes, so the compaction includes them
+                self._data = {
+                    "version": state.version,
+                    "minor_version": state.minor_version,
+                    "key": self.key,
+                    "data": {
+                        key: _journal_fragment(value)
+                        for key, value in state.values.items()
+                    },
+                }
+
             if self._data is None:
                 # Another write already consumed the data
                 return
@@ -536,11 +590,23 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if self._read_only:
                 return
 
+            if self._journal and not self._journal_compact:
+                # Compact the journal on shutdown, also when the final
+                # write happens while this write is running
+                self._async_ensure_final_write_listener()
+
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+            if (
+                self._journal
+                and self._data is None
+                and (self._journal_state is None or not self._journal_state.records)
+            ):
+                self._async_cleanup_final_write_listener()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
 
@@ -551,14 +617,107 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
+        if not self._journal or not isinstance(data["data"], Mapping):
+            _LOGGER.debug("Writing data for %s to %s", self.key, path)
+            json_helper.save_json(
+                path,
+                data,
+                self._private,
+                encoder=self._encoder,
+                atomic_writes=self._atomic_writes,
+            )
+            return
+
+        values = _journal_values(data["data"])
+        if not self._journal_compact and self._append_journal(data, values):
+            return
+
+        # Records of the previous journal are ignored when it has a different
+        # token than the storage file, in case removing it fails
+        self._journal_state = None
+        token = data["journal"] = uuid4().hex
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
         json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+            path, data, self._private, atomic_writes=self._atomic_writes
         )
+        with suppress(FileNotFoundError):
+            os.unlink(self.journal_path)
+        self._journal_state = _JournalState(
+            token,
+            data["version"],
+            data["minor_version"],
+            values,
+            os.path.getsize(path),
+        )
+
+    def _append_journal(
+        self, data: dict[str, Any], values: dict[str, bytes | list[bytes]]
+    ) -> bool:
+        """Append the changes since the last write to the journal.
+
+        Returns False if the data needs to be written in full instead.
+        """
+        if (
+            (state := self._journal_state) is None
+            or state.version != data["version"]
+            or state.minor_version != data["minor_version"]
+        ):
+            return False
+        if not (changes := _journal_changes(state.values, values)):
+            return True
+        line = json_helper.json_bytes({"journal": state.token, **changes}) + b"\n"
+        if (
+            state.records >= JOURNAL_MAX_RECORDS
+            or state.size + len(line) > state.snapshot_size * JOURNAL_COMPACT_RATIO
+        ):
+            return False
+        _LOGGER.debug("Appending changes for %s to %s", self.key, self.journal_path)
+        try:
+            fd = os.open(
+                self.journal_path,
+                os.O_WRONLY | os.O_APPEND | os.O_CREAT,
+                0o600 if self._private else 0o644,
+            )
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        except OSError as err:
+            _LOGGER.warning(
+                "Error appending to the journal of %s, writing in full: %s",
+                self.key,
+                err,
+            )
+            return False
+        state.values = values
+        state.records += 1
+        state.size += len(line)
+        return True
+
+    def _replay_journal(self, data: dict[str, Any]) -> None:
+        """Apply the changes recorded in the journal to the loaded data."""
+        try:
+            with open(self.journal_path, "rb") as fp:
+                lines = fp.readlines()
+        except FileNotFoundError:
+            return
+        token = data.get("journal")
+        values = data["data"]
+        for line in lines:
+            try:
+                record = json_util.json_loads_object(line)
+            except json_util.JSON_DECODE_EXCEPTIONS:
+                # The last record is incomplete if writing it was interrupted
+                _LOGGER.warning("Ignoring incomplete journal record of %s", self.key)
+                break
+            if record["journal"] != token:
+                continue
+            for key in record.get("remove", ()):
+                values.pop(key, None)
+            values.update(record.get("set", {}))
+            for key, (start, end, items) in record.get("lists", {}).items():
+                values[key][start:end] = items
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -572,3 +731,103 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            self._journal_state = None
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+class _JournalState:
+    """The data a store has written, to find the changes to journal."""
+
+    __slots__ = (
+        "minor_version",
+        "records",
+        "size",
+        "snapshot_size",
+        "token",
+        "values",
+        "version",
+    )
+
+    def __init__(
+        self,
+        token: str,
+        version: int,
+        minor_version: int,
+        values: dict[str, bytes | list[bytes]],
+        snapshot_size: int,
+    ) -> None:
+        """Initialize the state after the storage file was written."""
+        self.token = token
+        self.version = version
+        self.minor_version = minor_version
+        self.values = values
+        self.snapshot_size = snapshot_size
+        self.records = 0
+        self.size = 0
+
+
+def _journal_values(data: Mapping[str, Any]) -> dict[str, bytes | list[bytes]]:
+    """Serialize the values of the data, lists by item."""
+    json_bytes = json_helper.json_bytes
+    return {
+        key: [json_bytes(item) for item in value]
+        if isinstance(value, list)
+        else json_bytes(value)
+        for key, value in data.items()
+    }
+
+
+def _journal_fragment(value: bytes | list[bytes]) -> json_helper.json_fragment:
+    """Return a serialized value as a JSON fragment."""
+    return json_helper.json_fragment(
+        b"[" + b",".join(value) + b"]" if isinstance(value, list) else value
+    )
+
+
+def _journal_changes(
+    old: dict[str, bytes | list[bytes]], new: dict[str, bytes | list[bytes]]
+) -> dict[str, Any]:
+    """Return the changes between two serialized versions of the data.
+
+    Registries update their items in place and add items at the end, so
+    the changes of a list are recorded as the range between the common
+    prefix and suffix of the old and new items.
+    """
+    changes: dict[str, Any] = {}
+    if removed := [key for key in old if key not in new]:
+        changes["remove"] = removed
+    values: dict[str, json_helper.json_fragment] = {}
+    lists: dict[str, list[Any]] = {}
+    for key, value in new.items():
+        old_value = old.get(key)
+        if not isinstance(value, list) or not isinstance(old_value, list):
+            if value != old_value:
+                values[key] = _journal_fragment(value)
+            continue
+        if value == old_value:
+            continue
+        max_prefix = min(len(value), len(old_value))
+        prefix = 0
+        while prefix < max_prefix and value[prefix] == old_value[prefix]:
+            prefix += 1
+        suffix = 0
+        while (
+            suffix < max_prefix - prefix
+            and value[-suffix - 1] == old_value[-suffix - 1]
+        ):
+            suffix += 1
+        lists[key] = [
+            prefix,
+            len(old_value) - suffix,
+            [
+                json_helper.json_fragment(item)
+                for item in value[prefix : len(value) - suffix]
+            ],
+        ]
+    if values:
+        changes["set"] = values
+    if lists:
+        changes["lists"] = lists
+    return changes
@@ -11,8 +11,11 @@ from contextlib import AbstractContextManager
 from contextvars import ContextVar
 from datetime import date, datetime, time, timedelta
 from functools import cache, cached_property, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
 from operator import contains
 import pathlib
@@ -21,8 +24,18 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+from time import perf_counter
 from types import CodeType, TracebackType
-from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Concatenate,
+    Literal,
+    NoReturn,
+    Self,
+    cast,
+    overload,
+)
 from urllib.parse import urlencode as urllib_urlencode
 import weakref
 
@@ -47,6 +60,7 @@ from homeassistant.const import (
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__ as HA_VERSION,
 )
 from homeassistant.core import (
     Context,
@@ -81,9 +95,13 @@ from . import (
     location as loc_helper,
 )
 from .singleton import singleton
+from .start import async_at_started
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
+if TYPE_CHECKING:
+    from .storage import Store
+
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
 _LOGGER = logging.getLogger(__name__)
@@ -98,6 +116,21 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_TEMPLATE_CODE_CACHE: HassKey[TemplateCodeCache] = HassKey("template.code_cache")
+
+TEMPLATE_CODE_STORAGE_KEY = "core.template_code"
+TEMPLATE_CODE_STORAGE_VERSION = 1
+TEMPLATE_CODE_SAVE_DELAY = 60
+# Most templates compiled at startup that are saved
+TEMPLATE_CODE_MAX_TEMPLATES = 10000
+
+_TEMPLATE_RENDER_STATS: HassKey[TemplateRenderStats] = HassKey("template.render_stats")
+
+# Renders taking longer than this are counted as over budget
+TEMPLATE_RENDER_TIME_BUDGET = 0.01  # seconds
+# Most templates the render stats are kept for, the least recently
+# rendered templates are dropped first
+TEMPLATE_RENDER_STATS_MAX_TEMPLATES = 1000
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -371,6 +404,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
         "rate_limit",
         "has_time",
     )
@@ -389,6 +423,11 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The attributes read of entities of which only the state and
+        # named attributes were read, None if anything else was read.
+        # Once frozen, entities that are not included need a re-render
+        # on any change.
+        self.entity_attributes: dict[str, collections.abc.Set[str] | None] = {}
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -441,14 +480,28 @@ class RenderInfo:
         self.is_static = True
         self._freeze_sets()
         self.all_states = False
+        self.entity_attributes = {}
 
     def _freeze_sets(self) -> None:
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _freeze_entity_attributes(self) -> None:
+        if self.all_states or self.exception:
+            self.entity_attributes = {}
+            return
+        # Iterating a domain reads every state of it without collecting
+        domains = self.domains
+        self.entity_attributes = {
+            entity_id: frozenset(attributes)
+            for entity_id, attributes in self.entity_attributes.items()
+            if attributes is not None and split_entity_id(entity_id)[0] not in domains
+        }
+
     def _freeze(self) -> None:
         self._freeze_sets()
+        self._freeze_entity_attributes()
 
         if self.rate_limit is None:
             if self.all_states or self.exception:
@@ -711,7 +764,12 @@ class Template:
             return render_info
 
         token = _render_info.set(render_info)
+        start: float | None = None
         try:
+            # Compile first so only the render is timed
+            if self._compiled is None:
+                self._ensure_compiled(kwargs.get("limited", False), strict, log_fn)
+            start = perf_counter()
             render_info._result = self.async_render(  # noqa: SLF001
                 variables, strict=strict, log_fn=log_fn, **kwargs
             )
@@ -719,6 +777,10 @@ class Template:
             render_info.exception = ex
         finally:
             _render_info.reset(token)
+            if start is not None:
+                async_get_template_render_stats(self.hass).record_render(
+                    self.template, perf_counter() - start
+                )
 
         render_info._freeze()  # noqa: SLF001
         return render_info
@@ -1006,15 +1068,26 @@ class TemplateStateBase(State):
     def _collect_state(self) -> None:
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.entity_attributes[self._entity_id] = None
+
+    def _collect_state_value(self) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info.entity_attributes.setdefault(self._entity_id, set())
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
-            # _collect_state inlined here for performance
+            # _collect_state and _collect_state_value inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                entity_id = self._entity_id
+                render_info.entities.add(entity_id)  # type: ignore[attr-defined]
+                if item == "state":
+                    render_info.entity_attributes.setdefault(entity_id, set())
+                else:
+                    render_info.entity_attributes[entity_id] = None
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1033,7 +1106,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1156,6 +1229,16 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
         entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect.entity_attributes[entity_id] = None
+
+
+def _collect_state_attribute(entity_id: str, name: str) -> None:
+    if (entity_collect := _render_info.get()) is not None:
+        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        if (
+            attributes := entity_collect.entity_attributes.setdefault(entity_id, set())
+        ) is not None:
+            attributes.add(name)  # type: ignore[attr-defined]
 
 
 def _state_generator(
@@ -1836,7 +1919,9 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        state = state_obj._state  # noqa: SLF001
+        _collect_state_attribute(state.entity_id, name)
+        return state.attributes.get(name)
     return None
 
 
@@ -2711,6 +2796,199 @@ def _load_custom_templates(hass: HomeAssistant) -> dict[str, str]:
     return result
 
 
+async def async_load_template_code_cache(hass: HomeAssistant) -> None:
+    """Load the compiled template code of the previous run."""
+    # pylint: disable-next=import-outside-toplevel
+    from .storage import Store
+
+    store = Store[dict[str, Any]](
+        hass,
+        TEMPLATE_CODE_STORAGE_VERSION,
+        TEMPLATE_CODE_STORAGE_KEY,
+        private=True,
+        atomic_writes=True,
+    )
+    code: dict[str, str] = {}
+    if (data := await store.async_load()) and data[
+        "version"
+    ] == _template_code_version():
+        code = data["code"]
+    code_cache = hass.data[_TEMPLATE_CODE_CACHE] = TemplateCodeCache(hass, store, code)
+    async_at_started(hass, code_cache.async_startup_finished)
+
+
+def _template_code_version() -> str:
+    """Return the versions compiled template code depends on."""
+    return f"{HA_VERSION}-{jinja2.__version__}-{MAGIC_NUMBER.hex()}"
+
+
+class TemplateCodeCache:
+    """Keep the compiled code of the templates compiled at startup.
+
+    The code is marshalled and keyed by a hash of the template source and
+    the environment it was compiled for. It is only unmarshalled when the
+    template is compiled again, and dropped from memory once used. When
+    startup has finished the code that was not used is dropped, and the
+    code of the templates compiled during startup is saved once. Templates
+    compiled later, like the ones rendered from the websocket API, are not
+    saved.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, store: Store[dict[str, Any]], code: dict[str, str]
+    ) -> None:
+        """Initialize the cache with the code of the previous run."""
+        self._hass = hass
+        self._store = store
+        self._stored = code
+        self._used: dict[str, str] = {}
+        self._starting = True
+
+    @staticmethod
+    def key(source: str, limited: bool, strict: bool) -> str:
+        """Return the key of the code of a template."""
+        return hashlib.sha256(
+            f"{int(limited)}{int(strict)}{source}".encode()
+        ).hexdigest()
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the code stored for a key."""
+        if (data := self._stored.pop(key, None)) is None:
+            return None
+        try:
+            code = marshal.loads(base64.b64decode(data))
+        except (EOFError, TypeError, ValueError):
+            code = None
+        if not isinstance(code, CodeType):
+            return None
+        if self._keeps_code():
+            self._used[key] = data
+        return code
+
+    def add(self, key: str, code: CodeType) -> None:
+        """Add the code of a template that was compiled."""
+        if self._keeps_code():
+            self._used[key] = base64.b64encode(marshal.dumps(code)).decode()
+
+    def _keeps_code(self) -> bool:
+        """Return if the code of another template is kept to be saved."""
+        return self._starting and len(self._used) < TEMPLATE_CODE_MAX_TEMPLATES
+
+    @callback
+    def async_startup_finished(self, hass: HomeAssistant) -> None:
+        """Drop the code that was not used and save the code that was."""
+        self._starting = False
+        self._stored = {}
+        self._store.async_delay_save(self._data_to_save, TEMPLATE_CODE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to save."""
+        code, self._used = self._used, {}
+        return {"version": _template_code_version(), "code": code}
+
+
+class TemplateStats:
+    """Render counters of a template."""
+
+    __slots__ = ("last", "max", "over_budget", "renders", "total", "triggers")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.renders = 0
+        self.triggers = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+        self.over_budget = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "renders": self.renders,
+            "triggers": self.triggers,
+            "total": self.total,
+            "last": self.last,
+            "max": self.max,
+            "over_budget": self.over_budget,
+        }
+
+
+class TemplateRenderStats:
+    """Track how much time rendering each template takes.
+
+    Renders with async_render_to_info are timed per template source.
+    Template trackers count the state changes that trigger a re-render,
+    including the ones that are delayed by a rate limit. A warning is
+    logged the first time a template takes longer than the budget.
+    Only the TEMPLATE_RENDER_STATS_MAX_TEMPLATES most recently rendered
+    templates are kept.
+    """
+
+    __slots__ = ("budget", "templates")
+
+    def __init__(self, budget: float = TEMPLATE_RENDER_TIME_BUDGET) -> None:
+        """Initialize the render stats."""
+        self.budget = budget
+        self.templates: LRU[str, TemplateStats] = LRU(
+            TEMPLATE_RENDER_STATS_MAX_TEMPLATES
+        )
+
+    def _get_stats(self, template: str) -> TemplateStats:
+        """Return the stats of a template."""
+        if (stats := self.templates.get(template)) is None:
+            stats = self.templates[template] = TemplateStats()
+        return stats
+
+    def record_render(self, template: str, duration: float) -> None:
+        """Record the duration of a render."""
+        stats = self._get_stats(template)
+        stats.renders += 1
+        stats.total += duration
+        stats.last = duration
+        if duration > stats.max:
+            stats.max = duration
+        if duration > self.budget:
+            if not stats.over_budget:
+                _LOGGER.warning(
+                    "Rendering template took %.3f seconds which is longer than"
+                    " the budget of %.3f seconds: %s",
+                    duration,
+                    self.budget,
+                    template,
+                )
+            stats.over_budget += 1
+
+    def record_trigger(self, template: str) -> None:
+        """Record a state change that triggers a re-render."""
+        self._get_stats(template).triggers += 1
+
+    @callback
+    def async_reset(self) -> None:
+        """Reset the render stats."""
+        self.templates.clear()
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the render stats with the most expensive templates first."""
+        return {
+            "budget": self.budget,
+            "templates": [
+                {"template": template, **stats.as_dict()}
+                for template, stats in sorted(
+                    self.templates.items(), key=lambda item: item[1].total, reverse=True
+                )
+            ],
+        }
+
+
+@callback
+@singleton(_TEMPLATE_RENDER_STATS)
+def async_get_template_render_stats(hass: HomeAssistant) -> TemplateRenderStats:
+    """Return the template render stats."""
+    return TemplateRenderStats()
+
+
 @singleton(_HASS_LOADER)
 def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
@@ -2757,6 +3035,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self._limited = bool(limited)
+        self._strict = bool(strict)
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3110,7 +3390,19 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (
+            self.hass is None
+            or not isinstance(source, str)
+            or (code_cache := self.hass.data.get(_TEMPLATE_CODE_CACHE)) is None
+        ):
+            compiled = super().compile(source)
+            self.template_cache[source] = compiled
+            return compiled
+
+        key = code_cache.key(source, self._limited, self._strict)
+        if (compiled := code_cache.get(key)) is None:
+            compiled = super().compile(source)
+            code_cache.add(key, compiled)
         self.template_cache[source] = compiled
         return compiled
 
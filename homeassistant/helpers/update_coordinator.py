@@ -4,13 +4,13 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Mapping
 from datetime import datetime, timedelta
 from functools import cached_property
 import logging
 from random import randint
 from time import monotonic
-from typing import Any, Generic, Protocol
+from typing import Any, Generic, Protocol, cast
 import urllib.error
 
 import aiohttp
@@ -61,6 +61,14 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Setting :attr:`keyed_data` to ``True`` requires the data to be a mapping
+    and the listeners to use a key of the data as their context. After an
+    update only the listeners of the keys whose value changed, and the
+    listeners without a context when any key changed, are called back. All
+    listeners are called back when the update succeeds or fails after the
+    previous one did not. The values must not be changed in place as they
+    are compared with the values of the previous data.
     """
 
     def __init__(
@@ -74,6 +82,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         setup_method: Callable[[], Awaitable[None]] | None = None,
         request_refresh_debouncer: Debouncer[Coroutine[Any, Any, None]] | None = None,
         always_update: bool = True,
+        keyed_data: bool = False,
     ) -> None:
         """Initialize global data updater."""
         self.hass = hass
@@ -86,6 +95,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._shutdown_requested = False
         self.config_entry = config_entries.current_entry.get()
         self.always_update = always_update
+        self.keyed_data = keyed_data
 
         # It's None before the first successful update.
         # Components should call async_config_entry_first_refresh
@@ -163,9 +173,31 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
     @callback
     def async_update_listeners(self) -> None:
-        """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        """Update all registered listeners.
+
+        The states written by the listeners are written as one batch.
+        """
+        with self.hass.states.async_batch():
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+
+    @callback
+    def _async_update_changed_listeners(self, previous_data: _DataT) -> None:
+        """Update the listeners of the keys that changed since the previous data."""
+        previous = cast(Mapping[Any, Any], previous_data)
+        data = cast(Mapping[Any, Any], self.data)
+        changed = {
+            key
+            for key, value in data.items()
+            if key not in previous or previous[key] != value
+        }
+        changed.update(key for key in previous if key not in data)
+        if not changed:
+            return
+        with self.hass.states.async_batch():
+            for update_callback, context in list(self._listeners.values()):
+                if context is None or context in changed:
+                    update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -445,6 +477,15 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if not self.last_update_success and not previous_update_success:
             return
 
+        if (
+            self.keyed_data
+            and self.last_update_success
+            and previous_update_success
+            and previous_data is not None
+        ):
+            self._async_update_changed_listeners(previous_data)
+            return
+
         if (
             self.always_update
             or self.last_update_success != previous_update_success
@@ -476,6 +517,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._async_unsub_refresh()
         self._debounced_refresh.async_cancel()
 
+        previous_data = self.data
+        previous_update_success = self.last_update_success
         self.data = data
         self.last_update_success = True
         self.logger.debug(
@@ -486,6 +529,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._listeners:
             self._schedule_refresh()
 
+        if self.keyed_data and previous_update_success and previous_data is not None:
+            self._async_update_changed_listeners(previous_data)
+            return
+
         self.async_update_listeners()
 
 
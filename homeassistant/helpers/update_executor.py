@@ -0,0 +1,255 @@
+"""Run the sync update methods of entities in a dedicated executor."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Callable
+import logging
+import time
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.util.executor import InterruptibleThreadPoolExecutor
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_UPDATE_EXECUTOR: HassKey[UpdateExecutor] = HassKey("update_executor")
+
+# Number of workers that run sync entity updates, they are separate
+# from the default executor so updates can not delay file I/O and imports
+UPDATE_EXECUTOR_MAX_WORKERS = 16
+# Number of workers a single integration may use at the same time, unless
+# a platform of the integration sets a higher PARALLEL_UPDATES
+UPDATE_EXECUTOR_INTEGRATION_LIMIT = 4
+# Warn when an update waited this many seconds for a worker
+SLOW_QUEUE_WARNING = 10
+
+
+class UpdateJobStats:
+    """Counters of the update jobs of an integration."""
+
+    __slots__ = (
+        "jobs",
+        "max_run",
+        "max_wait",
+        "max_waiting",
+        "running",
+        "total_run",
+        "total_wait",
+        "waiting",
+    )
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.jobs = 0
+        self.running = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_run = 0.0
+        self.max_run = 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters as a dictionary."""
+        return {
+            "jobs": self.jobs,
+            "running": self.running,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "total_wait": self.total_wait,
+            "max_wait": self.max_wait,
+            "total_run": self.total_run,
+            "max_run": self.max_run,
+        }
+
+
+class UpdateExecutor:
+    """Run sync entity updates with a fair share of workers per integration.
+
+    Each integration may use up to its limit of workers. Updates over the
+    limit, or that arrive when all workers are busy, wait in a queue per
+    integration. When a worker becomes free the queues are served round
+    robin, so an integration with slow updates only delays its own updates.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        max_workers: int = UPDATE_EXECUTOR_MAX_WORKERS,
+        integration_limit: int = UPDATE_EXECUTOR_INTEGRATION_LIMIT,
+    ) -> None:
+        """Initialize the update executor."""
+        self.hass = hass
+        self.max_workers = max_workers
+        self.integration_limit = integration_limit
+        self._limits: dict[str, int] = {}
+        self._available = max_workers
+        self._executor: InterruptibleThreadPoolExecutor | None = None
+        # Integrations with waiting updates, in the order they are served
+        self._queues: dict[str, deque[asyncio.Future[None]]] = {}
+        self.stats: dict[str, UpdateJobStats] = {}
+
+    @callback
+    def async_set_integration_limit(self, integration: str, limit: int) -> None:
+        """Set the number of workers an integration may use."""
+        self._limits[integration] = limit
+        self._async_dispatch()
+
+    @callback
+    def async_set_parallel_updates(
+        self, integration: str, parallel_updates: int
+    ) -> None:
+        """Let an integration run as many updates as a platform allows in parallel.
+
+        The limit of the integration is only raised, zero parallel updates
+        lets the integration use all workers.
+        """
+        limit = parallel_updates or self.max_workers
+        if limit > self._limits.get(integration, self.integration_limit):
+            self.async_set_integration_limit(integration, limit)
+
+    def _get_executor(self) -> InterruptibleThreadPoolExecutor:
+        """Return the executor, starting it on first use."""
+        if self._executor is None:
+            executor = self._executor = InterruptibleThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="UpdateWorker"
+            )
+
+            async def _async_shutdown_executor(event: Event) -> None:
+                self._executor = None
+                await self.hass.async_add_executor_job(executor.shutdown)
+
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE, _async_shutdown_executor
+            )
+        return self._executor
+
+    def _get_stats(self, integration: str) -> UpdateJobStats:
+        """Return the stats of an integration."""
+        if (stats := self.stats.get(integration)) is None:
+            stats = self.stats[integration] = UpdateJobStats()
+        return stats
+
+    def _can_start(self, integration: str, stats: UpdateJobStats) -> bool:
+        """Return if an update of an integration can start now."""
+        return bool(self._available) and stats.running < self._limits.get(
+            integration, self.integration_limit
+        )
+
+    async def async_run[_T](self, integration: str, target: Callable[[], _T]) -> _T:
+        """Run a sync update of an integration in the executor."""
+        stats = self._get_stats(integration)
+        stats.jobs += 1
+        if self._queues.get(integration) or not self._can_start(integration, stats):
+            await self._async_wait(integration, stats)
+        else:
+            self._available -= 1
+            stats.running += 1
+        start = time.monotonic()
+        try:
+            return await self.hass.loop.run_in_executor(self._get_executor(), target)
+        finally:
+            run_time = time.monotonic() - start
+            stats.total_run += run_time
+            stats.max_run = max(stats.max_run, run_time)
+            self._available += 1
+            stats.running -= 1
+            self._async_dispatch()
+
+    async def _async_wait(self, integration: str, stats: UpdateJobStats) -> None:
+        """Wait until the executor hands a worker to an update."""
+        waiter: asyncio.Future[None] = self.hass.loop.create_future()
+        self._queues.setdefault(integration, deque()).append(waiter)
+        stats.waiting += 1
+        stats.max_waiting = max(stats.max_waiting, stats.waiting)
+        start = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The worker was handed over just before the cancellation
+                self._available += 1
+                stats.running -= 1
+                self._async_dispatch()
+            elif (queue := self._queues.get(integration)) and waiter in queue:
+                queue.remove(waiter)
+                if not queue:
+                    del self._queues[integration]
+            raise
+        finally:
+            stats.waiting -= 1
+        wait_time = time.monotonic() - start
+        stats.total_wait += wait_time
+        stats.max_wait = max(stats.max_wait, wait_time)
+        if wait_time > SLOW_QUEUE_WARNING:
+            _LOGGER.warning(
+                "Update of %s waited %.1f seconds for an executor worker with %s"
+                " updates running and %s waiting",
+                integration,
+                wait_time,
+                stats.running,
+                stats.waiting,
+            )
+
+    @callback
+    def _async_dispatch(self) -> None:
+        """Hand free workers to the waiting updates, round robin per integration."""
+        queues = self._queues
+        while self._available and queues:
+            for integration in queues:
+                stats = self.stats[integration]
+                if self._can_start(integration, stats):
+                    break
+            else:
+                return
+            # Move the integration to the end so the others are served first
+            queue = queues.pop(integration)
+            waiter = queue.popleft()
+            if queue:
+                queues[integration] = queue
+            if waiter.done():
+                continue
+            self._available -= 1
+            stats.running += 1
+            waiter.set_result(None)
+
+    @callback
+    def async_reset(self) -> None:
+        """Reset the stats of the integrations without running updates."""
+        for integration, stats in list(self.stats.items()):
+            if stats.running or stats.waiting:
+                continue
+            del self.stats[integration]
+
+    @callback
+    def as_dict(self) -> dict[str, Any]:
+        """Return the stats with the integrations that run longest first."""
+        return {
+            "max_workers": self.max_workers,
+            "integration_limit": self.integration_limit,
+            "running": self.max_workers - self._available,
+            "waiting": sum(len(queue) for queue in self._queues.values()),
+            "integrations": [
+                {
+                    "integration": integration,
+                    "limit": self._limits.get(integration, self.integration_limit),
+                    **stats.as_dict(),
+                }
+                for integration, stats in sorted(
+                    self.stats.items(), key=lambda item: item[1].total_run, reverse=True
+                )
+            ],
+        }
+
+
+@callback
+@singleton(DATA_UPDATE_EXECUTOR)
+def async_get_update_executor(hass: HomeAssistant) -> UpdateExecutor:
+    """Return the update executor."""
+    return UpdateExecutor(hass)
@@ -6,10 +6,32 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from dataclasses import dataclass
+from datetime import timedelta
 import logging
+import resource
+from statistics import quantiles
+from tempfile import TemporaryDirectory
+import threading
 from timeit import default_timer as timer
-
-from homeassistant import core
+from typing import Any
+
+from aiohttp import ClientSession, ClientWebSocketResponse, WSMsgType
+
+from homeassistant import core, loader
+from homeassistant.auth import auth_manager_from_config
+from homeassistant.auth.const import GROUP_ID_ADMIN
+from homeassistant.bootstrap import async_load_base_functionality
+from homeassistant.components import recorder
+from homeassistant.components.recorder import purge, statistics
+from homeassistant.components.recorder.tasks import RecorderTask
+from homeassistant.components.websocket_api.const import (
+    MAX_PENDING_MSG,
+    PENDING_MSG_PEAK,
+    URL,
+)
+from homeassistant.components.websocket_api.http import WebSocketHandler
+from homeassistant.config_entries import ConfigEntries
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -17,6 +39,10 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.recorder import async_initialize_recorder
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -24,6 +50,34 @@ from homeassistant.helpers.json import JSON_DUMP
 BENCHMARKS: dict[str, Callable] = {}
 
 
+@dataclass(slots=True)
+class RecorderBenchmarkOptions:
+    """Options for the recorder benchmarks."""
+
+    db_url: str | None = None
+    entities: int = 1000
+    events: int = 50000
+    attributes: int = 10
+    rate: int = 0
+
+
+RECORDER_OPTIONS = RecorderBenchmarkOptions()
+
+
+@dataclass(slots=True)
+class WebsocketBenchmarkOptions:
+    """Options for the websocket benchmarks."""
+
+    clients: int = 50
+    entities: int = 1000
+    rate: int = 100
+    duration: int = 60
+    port: int = 18123
+
+
+WEBSOCKET_OPTIONS = WebsocketBenchmarkOptions()
+
+
 def run(args):
     """Handle benchmark commandline script."""
     # Disable logging
@@ -32,8 +86,75 @@ def run(args):
     parser = argparse.ArgumentParser(description="Run a Home Assistant benchmark.")
     parser.add_argument("name", choices=BENCHMARKS)
     parser.add_argument("--script", choices=["benchmark"])
+    parser.add_argument(
+        "--db-url",
+        default=RECORDER_OPTIONS.db_url,
+        help=(
+            "Database used by the recorder benchmarks, defaults to a SQLite"
+            " database in a temporary config directory"
+        ),
+    )
+    parser.add_argument(
+        "--entities",
+        type=int,
+        default=RECORDER_OPTIONS.entities,
+        help="Number of entities used by the recorder and websocket benchmarks",
+    )
+    parser.add_argument(
+        "--events",
+        type=int,
+        default=RECORDER_OPTIONS.events,
+        help="Number of events or state changes fired by the recorder benchmarks",
+    )
+    parser.add_argument(
+        "--attributes",
+        type=int,
+        default=RECORDER_OPTIONS.attributes,
+        help="Number of attributes per state or event data keys",
+    )
+    parser.add_argument(
+        "--rate",
+        type=int,
+        default=RECORDER_OPTIONS.rate,
+        help="Events or state changes fired per second, 0 fires them all at once",
+    )
+
+    parser.add_argument(
+        "--clients",
+        type=int,
+        default=WEBSOCKET_OPTIONS.clients,
+        help="Number of websocket connections opened by the websocket benchmarks",
+    )
+    parser.add_argument(
+        "--state-rate",
+        type=int,
+        default=WEBSOCKET_OPTIONS.rate,
+        help="State changes per second written by the websocket benchmarks",
+    )
+    parser.add_argument(
+        "--duration",
+        type=int,
+        default=WEBSOCKET_OPTIONS.duration,
+        help="Seconds to run the websocket benchmarks for, use a long one to soak",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=WEBSOCKET_OPTIONS.port,
+        help="Local port the websocket benchmarks serve the API on",
+    )
 
     args = parser.parse_args()
+    RECORDER_OPTIONS.db_url = args.db_url
+    RECORDER_OPTIONS.entities = args.entities
+    RECORDER_OPTIONS.events = args.events
+    RECORDER_OPTIONS.attributes = args.attributes
+    RECORDER_OPTIONS.rate = args.rate
+    WEBSOCKET_OPTIONS.clients = args.clients
+    WEBSOCKET_OPTIONS.entities = args.entities
+    WEBSOCKET_OPTIONS.rate = args.state_rate
+    WEBSOCKET_OPTIONS.duration = args.duration
+    WEBSOCKET_OPTIONS.port = args.port
 
     bench = BENCHMARKS[args.name]
     print("Using event loop:", asyncio.get_event_loop_policy().loop_name)
@@ -45,10 +166,11 @@ def run(args):
 
 async def run_benchmark(bench):
     """Run a benchmark."""
-    hass = core.HomeAssistant("")
-    runtime = await bench(hass)
-    print(f"Benchmark {bench.__name__} done in {runtime}s")
-    await hass.async_stop()
+    with TemporaryDirectory() as config_dir:
+        hass = core.HomeAssistant(config_dir)
+        runtime = await bench(hass)
+        print(f"Benchmark {bench.__name__} done in {runtime}s")
+        await hass.async_stop()
 
 
 def benchmark[_CallableT: Callable](func: _CallableT) -> _CallableT:
@@ -308,3 +430,515 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@dataclass(slots=True)
+class _RunUntilDoneTask(RecorderTask):
+    """Run a recorder job that returns False until it has finished."""
+
+    job: Callable[[recorder.Recorder], bool]
+    done: asyncio.Event
+    loop: asyncio.AbstractEventLoop
+    exception: Exception | None = None
+
+    def run(self, instance: recorder.Recorder) -> None:
+        """Run the job until it is done."""
+        try:
+            while not self.job(instance):
+                pass
+        except Exception as err:
+            # Raised again in the event loop, the recorder still
+            # gets it to recover its session
+            self.exception = err
+            raise
+        finally:
+            self.loop.call_soon_threadsafe(self.done.set)
+
+
+class _RecorderMonitor:
+    """Collect commit latency and backlog depth of a recorder."""
+
+    def __init__(self, instance: recorder.Recorder) -> None:
+        """Wrap the commit of the recorder to measure it."""
+        self.instance = instance
+        self.commit_latencies: list[float] = []
+        self.max_backlog = 0
+        commit = instance._commit_event_session  # noqa: SLF001
+
+        def _timed_commit() -> None:
+            start = timer()
+            commit()
+            self.commit_latencies.append(timer() - start)
+
+        instance._commit_event_session = _timed_commit  # type: ignore[method-assign] # noqa: SLF001
+
+    @core.callback
+    def sample_backlog(self) -> None:
+        """Sample the backlog of the recorder."""
+        self.max_backlog = max(self.max_backlog, self.instance.backlog)
+
+    def report(self, count: int, runtime: float) -> None:
+        """Print the collected metrics."""
+        print(f"Recorded {count} events at {count / runtime:.0f} events/s")
+        if latencies := self.commit_latencies:
+            print(f"Commits: {len(latencies)}, latency {_format_latencies(latencies)}")
+        print(f"Max backlog: {self.max_backlog}")
+        _print_peak_rss()
+
+
+def _format_latencies(latencies: list[float]) -> str:
+    """Format the percentiles of a list of latencies."""
+    if len(latencies) == 1:
+        return f"{latencies[0] * 1000:.1f}ms"
+    percentiles = quantiles(latencies, n=100, method="inclusive")
+    return (
+        f"p50 {percentiles[49] * 1000:.1f}ms,"
+        f" p95 {percentiles[94] * 1000:.1f}ms,"
+        f" p99 {percentiles[98] * 1000:.1f}ms,"
+        f" max {max(latencies) * 1000:.1f}ms"
+    )
+
+
+def _print_peak_rss() -> None:
+    """Print the peak resident set size of the process."""
+    # ru_maxrss is in kilobytes on Linux
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"Peak RSS: {peak_rss / 1024:.1f} MiB")
+
+
+async def _async_setup_recorder(
+    hass: core.HomeAssistant, components: dict[str, dict[str, Any]] | None = None
+) -> recorder.Recorder:
+    """Set up the recorder and components that need it for a benchmark."""
+    loader.async_setup(hass)
+    hass.config.skip_pip = True
+    hass.config_entries = ConfigEntries(hass, {})
+    await async_load_base_functionality(hass)
+    # The auth store needs the registries loaded above
+    hass.auth = await auth_manager_from_config(hass, [], [])
+    async_initialize_recorder(hass)
+    config: dict[str, Any] = {recorder.CONF_COMMIT_INTERVAL: 1}
+    if RECORDER_OPTIONS.db_url:
+        config[recorder.CONF_DB_URL] = RECORDER_OPTIONS.db_url
+    assert await async_setup_component(hass, recorder.DOMAIN, {recorder.DOMAIN: config})
+    for domain, domain_config in (components or {}).items():
+        assert await async_setup_component(hass, domain, {domain: domain_config})
+    await hass.async_start()
+    instance = recorder.get_instance(hass)
+    assert await instance.async_db_ready
+    await instance.async_block_till_done()
+    return instance
+
+
+async def _async_run_in_recorder(
+    instance: recorder.Recorder, job: Callable[[recorder.Recorder], bool]
+) -> None:
+    """Run a job in the recorder thread and wait for it to finish."""
+    task = _RunUntilDoneTask(job, asyncio.Event(), instance.hass.loop)
+    instance.queue_task(task)
+    await task.done.wait()
+    if task.exception is not None:
+        raise task.exception
+
+
+async def _async_fire_at_rate(
+    fire: Callable[[int], None], monitor: _RecorderMonitor
+) -> None:
+    """Call fire for each event at the configured rate."""
+    events = RECORDER_OPTIONS.events
+    if not (rate := RECORDER_OPTIONS.rate):
+        for idx in range(events):
+            fire(idx)
+        monitor.sample_backlog()
+        return
+
+    # Fire the events in slices of a tenth of a second
+    per_slice = max(1, rate // 10)
+    for slice_start in range(0, events, per_slice):
+        slice_started = timer()
+        for idx in range(slice_start, min(slice_start + per_slice, events)):
+            fire(idx)
+        monitor.sample_backlog()
+        await asyncio.sleep(max(0, 0.1 - (timer() - slice_started)))
+
+
+async def _async_record_state_changes(
+    hass: core.HomeAssistant,
+    instance: recorder.Recorder,
+    monitor: _RecorderMonitor,
+    attributes: dict[str, str] | None = None,
+) -> float:
+    """Write state changes and wait until they have been recorded."""
+    entities = [f"sensor.benchmark_{idx}" for idx in range(RECORDER_OPTIONS.entities)]
+    if attributes is None:
+        attributes = {
+            f"attribute_{idx}": f"value_{idx}"
+            for idx in range(RECORDER_OPTIONS.attributes)
+        }
+    num_entities = len(entities)
+    async_set = hass.states.async_set
+
+    @core.callback
+    def _fire(idx: int) -> None:
+        async_set(entities[idx % num_entities], str(idx), attributes)
+
+    start = timer()
+    await _async_fire_at_rate(_fire, monitor)
+    await instance.async_block_till_done()
+    monitor.sample_backlog()
+    return timer() - start
+
+
+@benchmark
+async def recorder_state_changes(hass):
+    """Record state changes and report recorder throughput."""
+    instance = await _async_setup_recorder(hass)
+    monitor = _RecorderMonitor(instance)
+    runtime = await _async_record_state_changes(hass, instance, monitor)
+    monitor.report(RECORDER_OPTIONS.events, runtime)
+    return runtime
+
+
+@benchmark
+async def recorder_events(hass):
+    """Record custom events and report recorder throughput."""
+    instance = await _async_setup_recorder(hass)
+    monitor = _RecorderMonitor(instance)
+    event_types = [f"benchmark_event_{idx}" for idx in range(RECORDER_OPTIONS.entities)]
+    num_event_types = len(event_types)
+    num_keys = RECORDER_OPTIONS.attributes
+    async_fire = hass.bus.async_fire
+
+    @core.callback
+    def _fire(idx: int) -> None:
+        async_fire(
+            event_types[idx % num_event_types],
+            {f"key_{key}": idx for key in range(num_keys)},
+        )
+
+    start = timer()
+    await _async_fire_at_rate(_fire, monitor)
+    await instance.async_block_till_done()
+    monitor.sample_backlog()
+    runtime = timer() - start
+    monitor.report(RECORDER_OPTIONS.events, runtime)
+    return runtime
+
+
+@benchmark
+async def recorder_purge(hass):
+    """Purge all recorded state changes and report the purge time."""
+    instance = await _async_setup_recorder(hass)
+    monitor = _RecorderMonitor(instance)
+    await _async_record_state_changes(hass, instance, monitor)
+    purge_before = dt_util.utcnow() + timedelta(seconds=1)
+
+    start = timer()
+    await _async_run_in_recorder(
+        instance,
+        lambda instance: purge.purge_old_data(instance, purge_before, repack=False),
+    )
+    runtime = timer() - start
+    print(f"Purged {RECORDER_OPTIONS.events} state changes")
+    _print_peak_rss()
+    return runtime
+
+
+@benchmark
+async def recorder_compile_statistics(hass):
+    """Compile 5-minute statistics for measurement sensors."""
+    instance = await _async_setup_recorder(hass)
+    assert await async_setup_component(hass, "sensor", {})
+    await instance.async_block_till_done()
+    monitor = _RecorderMonitor(instance)
+    now = dt_util.utcnow()
+    period_start = now.replace(
+        minute=now.minute - now.minute % 5, second=0, microsecond=0
+    )
+    await _async_record_state_changes(
+        hass,
+        instance,
+        monitor,
+        {"state_class": "measurement", "unit_of_measurement": "W"},
+    )
+
+    start = timer()
+    await _async_run_in_recorder(
+        instance,
+        lambda instance: statistics.compile_statistics(
+            instance, period_start, fire_events=False
+        ),
+    )
+    runtime = timer() - start
+    print(f"Compiled statistics for {RECORDER_OPTIONS.entities} sensors")
+    _print_peak_rss()
+    return runtime
+
+
+# The message ids the websocket benchmark clients subscribe with
+_WS_SUBSCRIPTIONS = {
+    2: "subscribe_entities",
+    3: "subscribe_events",
+    4: "render_template",
+    5: "history/stream",
+}
+
+
+class _WebsocketClients:
+    """Authenticated websocket clients that measure state change latency.
+
+    The clients run in their own thread and event loop so their JSON
+    decoding does not delay the event loop of Home Assistant. Each state
+    written by the benchmark is unique, so the time it was written is
+    looked up when a client receives it.
+    """
+
+    def __init__(self, url: str, access_token: str, sent_at: dict[str, float]) -> None:
+        """Initialize the clients."""
+        self.url = url
+        self.access_token = access_token
+        self.sent_at = sent_at
+        self.latencies: dict[str, list[float]] = {
+            name: [] for name in _WS_SUBSCRIPTIONS.values()
+        }
+        self.messages = 0
+        self.disconnected = 0
+        self.ready = threading.Event()
+        self.stop = threading.Event()
+
+    def run(self) -> None:
+        """Run the clients until stop is set."""
+        try:
+            asyncio.run(self._async_run())
+        finally:
+            # Do not leave the benchmark waiting if connecting failed
+            self.ready.set()
+
+    async def _async_run(self) -> None:
+        """Connect the clients and read their messages."""
+        async with ClientSession() as session:
+            connections = await asyncio.gather(
+                *(
+                    self._async_connect(session)
+                    for _ in range(WEBSOCKET_OPTIONS.clients)
+                )
+            )
+            readers = [
+                asyncio.create_task(self._async_read(websocket))
+                for websocket in connections
+            ]
+            self.ready.set()
+            await asyncio.get_running_loop().run_in_executor(None, self.stop.wait)
+            for websocket in connections:
+                await websocket.close()
+            await asyncio.gather(*readers)
+
+    async def _async_connect(self, session: ClientSession) -> ClientWebSocketResponse:
+        """Open an authenticated connection with all subscriptions."""
+        websocket = await session.ws_connect(self.url)
+        await websocket.receive_json()
+        await websocket.send_json({"type": "auth", "access_token": self.access_token})
+        assert (await websocket.receive_json())["type"] == "auth_ok"
+        entity_id = "sensor.benchmark_0"
+        for message in (
+            {
+                "id": 1,
+                "type": "supported_features",
+                "features": {"coalesce_messages": 1},
+            },
+            {"id": 2, "type": "subscribe_entities"},
+            {"id": 3, "type": "subscribe_events", "event_type": EVENT_STATE_CHANGED},
+            {
+                "id": 4,
+                "type": "render_template",
+                "template": f"{{{{ states('{entity_id}') }}}}",
+            },
+            {
+                "id": 5,
+                "type": "history/stream",
+                "entity_ids": [entity_id],
+                "start_time": dt_util.utcnow().isoformat(),
+                "minimal_response": True,
+                "no_attributes": True,
+            },
+        ):
+            await websocket.send_json(message)
+        # Wait for the results so no subscription misses state changes
+        results = 0
+        while results < len(_WS_SUBSCRIPTIONS) + 1:
+            for message in self._async_decode(await websocket.receive()):
+                if message["type"] == "result":
+                    assert message["success"], message
+                    results += 1
+        return websocket
+
+    def _async_decode(self, msg: Any) -> list[dict[str, Any]]:
+        """Decode a frame which holds a message or a list of them."""
+        if msg.type is not WSMsgType.TEXT:
+            return []
+        messages = json_loads(msg.data)
+        return messages if isinstance(messages, list) else [messages]
+
+    async def _async_read(self, websocket: ClientWebSocketResponse) -> None:
+        """Read the messages of a connection until it is closed."""
+        async for msg in websocket:
+            received = timer()
+            for message in self._async_decode(msg):
+                self.messages += 1
+                if message["type"] != "event":
+                    continue
+                name = _WS_SUBSCRIPTIONS[message["id"]]
+                latencies = self.latencies[name]
+                for state in _received_states(name, message["event"]):
+                    if (sent := self.sent_at.get(state)) is not None:
+                        latencies.append(received - sent)
+        if not self.stop.is_set():
+            self.disconnected += 1
+
+
+def _received_states(name: str, event: dict[str, Any]) -> list[str]:
+    """Return the states in an event of a subscription."""
+    if name == "subscribe_entities":
+        return [
+            diff["+"]["s"]
+            for diff in event.get("c", {}).values()
+            if "s" in diff.get("+", {})
+        ] + [state["s"] for state in event.get("a", {}).values()]
+    if name == "subscribe_events":
+        if new_state := event["data"]["new_state"]:
+            return [new_state["state"]]
+        return []
+    if name == "render_template":
+        return [str(event.get("result"))]
+    return [
+        state["s"] for states in event.get("states", {}).values() for state in states
+    ]
+
+
+class _WebsocketMonitor:
+    """Collect the event loop lag and pending message queue depth."""
+
+    def __init__(self) -> None:
+        """Wrap sending a websocket message to measure the queue depth."""
+        self.loop_lags: list[float] = []
+        self.max_pending = 0
+        self._send_message = send_message = WebSocketHandler._send_message  # noqa: SLF001
+
+        def _measured_send_message(
+            handler: WebSocketHandler, message: str | bytes | dict[str, Any]
+        ) -> None:
+            send_message(handler, message)
+            if (queue := handler._message_queue) is not None:  # noqa: SLF001
+                self.max_pending = max(self.max_pending, len(queue))
+
+        WebSocketHandler._send_message = _measured_send_message  # type: ignore[method-assign] # noqa: SLF001
+
+    def close(self) -> None:
+        """Restore sending websocket messages."""
+        WebSocketHandler._send_message = self._send_message  # type: ignore[method-assign] # noqa: SLF001
+
+    async def async_sample_loop_lag(self) -> None:
+        """Measure how late the event loop wakes up a sleeping task."""
+        while True:
+            start = timer()
+            await asyncio.sleep(0.1)
+            self.loop_lags.append(timer() - start - 0.1)
+
+    def report(self, clients: _WebsocketClients, runtime: float) -> None:
+        """Print the collected metrics."""
+        print(
+            f"Received {clients.messages} messages on {WEBSOCKET_OPTIONS.clients}"
+            f" connections at {clients.messages / runtime:.0f} messages/s"
+        )
+        for name, latencies in clients.latencies.items():
+            if latencies:
+                print(
+                    f"{name}: {len(latencies)} states,"
+                    f" latency {_format_latencies(latencies)}"
+                )
+        if self.loop_lags:
+            print(f"Event loop lag: {_format_latencies(self.loop_lags)}")
+        print(
+            f"Max pending messages: {self.max_pending}"
+            f" (peak {PENDING_MSG_PEAK}, max {MAX_PENDING_MSG})"
+        )
+        print(f"Disconnected clients: {clients.disconnected}")
+        _print_peak_rss()
+
+
+async def _async_setup_websocket_api(hass: core.HomeAssistant) -> str:
+    """Serve the websocket API and return an admin access token."""
+    # The HTTP server is started when Home Assistant starts
+    await _async_setup_recorder(
+        hass,
+        {
+            "http": {
+                "server_host": ["127.0.0.1"],
+                "server_port": WEBSOCKET_OPTIONS.port,
+            },
+            "websocket_api": {},
+            "history": {},
+        },
+    )
+    await hass.async_block_till_done()
+    user = await hass.auth.async_create_system_user(
+        "Benchmark", group_ids=[GROUP_ID_ADMIN]
+    )
+    refresh_token = await hass.auth.async_create_refresh_token(user)
+    return hass.auth.async_create_access_token(refresh_token)
+
+
+@benchmark
+async def websocket_clients(hass):
+    """Stream state changes to many websocket clients and report their latency."""
+    access_token = await _async_setup_websocket_api(hass)
+    entities = [f"sensor.benchmark_{idx}" for idx in range(WEBSOCKET_OPTIONS.entities)]
+    num_entities = len(entities)
+    async_set = hass.states.async_set
+    for entity_id in entities:
+        async_set(entity_id, "initial")
+    await hass.async_block_till_done()
+
+    sent_at: dict[str, float] = {}
+    clients = _WebsocketClients(
+        f"http://127.0.0.1:{WEBSOCKET_OPTIONS.port}{URL}", access_token, sent_at
+    )
+    clients_done = hass.loop.run_in_executor(None, clients.run)
+    await hass.async_add_executor_job(clients.ready.wait)
+    if clients_done.done():
+        # Raise why the clients could not connect
+        clients_done.result()
+
+    monitor = _WebsocketMonitor()
+    lag_sampler = hass.async_create_background_task(
+        monitor.async_sample_loop_lag(), "benchmark loop lag sampler"
+    )
+    # Write the state changes in slices of a tenth of a second
+    per_slice = max(1, WEBSOCKET_OPTIONS.rate // 10)
+    slices = WEBSOCKET_OPTIONS.duration * 10
+    idx = 0
+    start = timer()
+    for slice_idx in range(slices):
+        slice_started = timer()
+        for _ in range(per_slice):
+            state = str(idx)
+            sent_at[state] = timer()
+            async_set(entities[idx % num_entities], state)
+            idx += 1
+        if slice_idx % 100 == 99:
+            print(
+                f"{(slice_idx + 1) // 10}s: {idx} state changes,"
+                f" {clients.messages} messages, max pending {monitor.max_pending}"
+            )
+            _print_peak_rss()
+        await asyncio.sleep(max(0, 0.1 - (timer() - slice_started)))
+    # Give the clients time to receive the last state changes
+    await asyncio.sleep(1)
+    runtime = timer() - start
+
+    lag_sampler.cancel()
+    monitor.close()
+    clients.stop.set()
+    await clients_done
+    monitor.report(clients, runtime)
+    return runtime
@@ -900,7 +900,8 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.second_group",
         "group.test_group",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    # One keyed listener per tracked entity
+    assert hass.bus.async_listeners()["state_changed"] == 4
 
     with patch(
         "homeassistant.config.load_yaml_config_file",
@@ -915,7 +916,7 @@ async def test_reloading_groups(hass: HomeAssistant) -> None:
         "group.all_tests",
         "group.hello",
     ]
-    assert hass.bus.async_listeners()["state_changed"] == 1
+    assert hass.bus.async_listeners()["state_changed"] == 3
 
 
 async def test_modify_group(hass: HomeAssistant) -> None:
@@ -0,0 +1,42 @@
+"""Test the Profiler diagnostics."""
+
+from homeassistant.components.profiler.const import DOMAIN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.template import Template, async_get_template_render_stats
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the loop, template and polling stats are included in the diagnostics."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.loop_stats.async_reset()
+    hass.loop_stats.async_start()
+    hass.bus.async_listen("test_loop_stats", callback(lambda event: None))
+    hass.bus.async_fire("test_loop_stats")
+    hass.loop_stats.async_stop()
+    async_get_template_render_stats(hass).async_reset()
+    Template("{{ 1 + 1 }}", hass).async_render_to_info()
+
+    diag = await get_diagnostics_for_config_entry(hass, hass_client, entry)
+    assert diag["loop_stats"]["events"]["test_loop_stats"]["count"] == 1
+    assert set(diag["loop_stats"]) == {
+        "active",
+        "buckets",
+        "loop_lag",
+        "jobs",
+        "events",
+    }
+    assert [stats["template"] for stats in diag["template_stats"]["templates"]] == [
+        "{{ 1 + 1 }}"
+    ]
+    assert set(diag["polling_stats"]) == {"groups", "platforms"}
+    assert diag["update_executor_stats"]["integrations"] == []
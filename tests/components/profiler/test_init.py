@@ -24,6 +24,7 @@ from homeassistant.components.profiler import (
     SERVICE_LRU_STATS,
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
+    SERVICE_SET_LOOP_STATS,
     SERVICE_START,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
@@ -446,3 +447,33 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_set_loop_stats(hass: HomeAssistant) -> None:
+    """Test starting and stopping the loop stats."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_SET_LOOP_STATS)
+    assert hass.loop_stats.active is False
+
+    await hass.services.async_call(DOMAIN, SERVICE_SET_LOOP_STATS, {}, blocking=True)
+    assert hass.loop_stats.active is True
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_LOOP_STATS, {CONF_ENABLED: False}, blocking=True
+    )
+    assert hass.loop_stats.active is False
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_SET_LOOP_STATS, {CONF_ENABLED: True}, blocking=True
+    )
+    assert hass.loop_stats.active is True
+
+    # Unloading the profiler stops the loop stats
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass.loop_stats.active is False
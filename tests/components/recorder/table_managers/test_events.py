@@ -0,0 +1,86 @@
+"""Test events table manager."""
+
+import pytest
+from sqlalchemy import event as sqlalchemy_event, func, select
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import CONF_COMMIT_INTERVAL, Recorder
+from homeassistant.components.recorder.db_schema import EventData, Events, EventTypes
+from homeassistant.components.recorder.table_managers.events import EventsManager
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import Event, HomeAssistant
+
+from ..common import async_wait_recording_done
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 5}])
+async def test_pending_events_are_inserted_on_commit(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test events kept pending until commit are all written."""
+    hass.bus.async_fire("test_event_one")
+    for idx in range(10):
+        hass.bus.async_fire("test_event_two", {"idx": idx % 2})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        rows = session.execute(
+            select(EventTypes.event_type, EventData.shared_data, func.count())
+            .select_from(Events)
+            .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .where(EventTypes.event_type.in_(("test_event_one", "test_event_two")))
+            .group_by(EventTypes.event_type, EventData.shared_data)
+            .order_by(EventTypes.event_type, EventData.shared_data)
+        ).all()
+    assert [tuple(row) for row in rows] == [
+        ("test_event_one", None, 1),
+        ("test_event_two", '{"idx":0}', 5),
+        ("test_event_two", '{"idx":1}', 5),
+    ]
+
+
+async def test_insert_pending_uses_executemany(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test pending events are inserted with a single executemany."""
+    instance = recorder.get_instance(hass)
+    executemany_inserts: list[bool] = []
+
+    def _before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        if statement.startswith("INSERT INTO events "):
+            executemany_inserts.append(executemany)
+
+    def _insert_events() -> None:
+        manager = EventsManager()
+        with session_scope(session=instance.get_session()) as session:
+            event_types = EventTypes(event_type="test_event")
+            session.add(event_types)
+            for _ in range(10):
+                dbevent = Events.from_event(Event("test_event"))
+                dbevent.event_type_rel = event_types
+                manager.add_pending(dbevent)
+            manager.insert_pending(session)
+        manager.post_commit_pending()
+
+    sqlalchemy_event.listen(
+        instance.engine, "before_cursor_execute", _before_cursor_execute
+    )
+    await instance.async_add_executor_job(_insert_events)
+    sqlalchemy_event.remove(
+        instance.engine, "before_cursor_execute", _before_cursor_execute
+    )
+    assert executemany_inserts == [True]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert (
+            session.execute(
+                select(func.count())
+                .select_from(Events)
+                .join(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+                .where(EventTypes.event_type == "test_event")
+            ).scalar()
+            == 10
+        )
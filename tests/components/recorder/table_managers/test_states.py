@@ -0,0 +1,79 @@
+"""Test states table manager."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import insert, select
+
+from homeassistant.components.recorder import CONF_COMMIT_INTERVAL, Recorder
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_recorder_block_till_done, async_wait_recording_done
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_COMMIT_INTERVAL: 5}])
+async def test_pending_states_are_inserted_on_commit(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test states of one commit are inserted with one executemany per round."""
+    await async_wait_recording_done(hass)
+
+    with patch(
+        "homeassistant.components.recorder.table_managers.states.insert",
+        wraps=insert,
+    ) as insert_mock:
+        for idx in range(2):
+            for entity_id in ("sensor.one", "sensor.two", "sensor.three"):
+                hass.states.async_set(entity_id, str(idx), {"idx": idx})
+        await async_recorder_block_till_done(hass)
+        await async_wait_recording_done(hass)
+    # The second state of each entity links to the first one
+    assert insert_mock.call_count == 2
+
+    with session_scope(hass=hass, read_only=True) as session:
+        rows = session.execute(
+            select(
+                StatesMeta.entity_id,
+                States.state,
+                States.state_id,
+                States.old_state_id,
+                StateAttributes.shared_attrs,
+            )
+            .select_from(States)
+            .join(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .join(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+            .order_by(States.state_id)
+        ).all()
+    state_ids: dict[str, int] = {}
+    for entity_id, state, state_id, old_state_id, shared_attrs in rows:
+        assert old_state_id == state_ids.get(entity_id)
+        assert shared_attrs == f'{{"idx":{state}}}'
+        state_ids[entity_id] = state_id
+    assert sorted((row[1], row[0]) for row in rows) == [
+        ("0", "sensor.one"),
+        ("0", "sensor.three"),
+        ("0", "sensor.two"),
+        ("1", "sensor.one"),
+        ("1", "sensor.three"),
+        ("1", "sensor.two"),
+    ]
+
+    # The committed state is linked by the next commit
+    hass.states.async_set("sensor.one", "2", {"idx": 2})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert (
+            session.execute(
+                select(States.old_state_id).where(States.state == "2")
+            ).scalar_one()
+            == state_ids["sensor.one"]
+        )
@@ -22,6 +22,7 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.history import legacy
+from homeassistant.components.recorder.history.hot_cache import HotHistoryCache
 from homeassistant.components.recorder.models import process_timestamp
 from homeassistant.components.recorder.models.legacy import (
     LegacyLazyState,
@@ -1272,3 +1273,104 @@ async def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty
 ) -> None:
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+async def test_get_significant_states_from_hot_history_cache(
+    hass: HomeAssistant,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    compressed_state_format: bool,
+    include_start_time_state: bool,
+) -> None:
+    """Test states from the hot history cache match the database."""
+    zero, four, states = record_states(hass)
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    entity_ids = list(states)
+
+    def _get_significant_states(start_time: datetime) -> str:
+        return json.dumps(
+            history.get_significant_states(
+                hass,
+                start_time,
+                four,
+                entity_ids,
+                include_start_time_state=include_start_time_state,
+                significant_changes_only=significant_changes_only,
+                minimal_response=minimal_response,
+                no_attributes=True,
+                compressed_state_format=compressed_state_format,
+            ),
+            cls=JSONEncoder,
+        )
+
+    start_times = (
+        zero,
+        zero + timedelta(seconds=1, microseconds=1),
+        zero + timedelta(seconds=2, milliseconds=500),
+    )
+    with session_scope(hass=hass, read_only=True) as session:
+        entity_id_to_metadata_id = instance.states_meta_manager.get_many(
+            entity_ids, session, False
+        )
+    uncached_metadata_ids, _ = instance.hot_history_cache.get_significant_states_rows(
+        entity_id_to_metadata_id,
+        start_times[2].timestamp(),
+        four.timestamp(),
+        significant_changes_only,
+        include_start_time_state,
+    )
+    assert uncached_metadata_ids == []
+
+    cached = [_get_significant_states(start_time) for start_time in start_times]
+    instance.hot_history_cache.clear()
+    assert cached == [_get_significant_states(start_time) for start_time in start_times]
+
+
+def test_hot_history_cache_eviction() -> None:
+    """Test the hot history cache stays within its window and row budget."""
+    cache = HotHistoryCache(timedelta(seconds=10), 8)
+    entity_id_to_metadata_id: dict[str, int | None] = {
+        "sensor.busy": 1,
+        "sensor.quiet": 2,
+    }
+
+    def _add(entity_id: str, state: str, timestamp: float) -> None:
+        cache.add(
+            entity_id,
+            States(state=state, last_updated_ts=timestamp, last_changed_ts=None),
+        )
+
+    def _cached_states(start_time_ts: float) -> tuple[list[int], list[str]]:
+        uncached, rows = cache.get_significant_states_rows(
+            entity_id_to_metadata_id, start_time_ts, None, True, True
+        )
+        return uncached, [row.state for row in rows]
+
+    _add("sensor.quiet", "on", 1)
+    for timestamp in range(2, 8):
+        _add("sensor.busy", str(timestamp), timestamp)
+    assert cache.rows == 7
+    assert _cached_states(4.5) == ([], ["4", "5", "6", "7", "on"])
+
+    # The newest state older than the window is kept as the start state
+    _add("sensor.busy", "15", 15)
+    assert cache.rows == 6
+    assert _cached_states(5.5) == ([], ["5", "6", "7", "15", "on"])
+    assert _cached_states(3.5) == ([1], ["on"])
+
+    # The largest entity is evicted first when over the budget
+    for timestamp in range(16, 22):
+        _add("sensor.busy", str(timestamp), timestamp)
+    assert cache.rows == 5
+    assert _cached_states(17.5) == ([1], ["on"])
+    assert _cached_states(20.5) == ([], ["20", "21", "on"])
+
+    cache.evict_before(2)
+    assert _cached_states(20.5) == ([2], ["20", "21"])
+    cache.evict_entities(lambda entity_id: entity_id == "sensor.busy")
+    assert cache.rows == 0
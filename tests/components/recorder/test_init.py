@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -33,6 +34,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -130,6 +132,7 @@ def _default_recorder(hass):
         auto_purge=True,
         auto_repack=True,
         keep_days=7,
+        purge_max_duration=2,
         commit_interval=1,
         uri="sqlite://",
         db_max_retries=10,
@@ -288,6 +291,40 @@ async def test_saving_state(hass: HomeAssistant, setup_recorder: None) -> None:
     assert state.as_dict() == _state_with_context(hass, entity_id).as_dict()
 
 
+async def test_saving_state_batch(hass: HomeAssistant, setup_recorder: None) -> None:
+    """Test saving a batch of states queued as one item."""
+    instance = get_instance(hass)
+    entity_ids = ["test.recorder_1", "test.recorder_2", "test.recorder_3"]
+
+    with patch.object(
+        instance,
+        "_guarded_process_one_task_or_event_or_recover",
+        wraps=instance._guarded_process_one_task_or_event_or_recover,
+    ) as process_mock:
+        # Let the recorder thread pick up the patched method
+        await async_wait_recording_done(hass)
+        hass.states.async_set_many(
+            (entity_id, "on", {"test_attr": 5}) for entity_id in entity_ids
+        )
+        await async_wait_recording_done(hass)
+
+    batches = [
+        call.args[0] for call in process_mock.mock_calls if type(call.args[0]) is list
+    ]
+    assert [[event.data["entity_id"] for event in batch] for batch in batches] == [
+        entity_ids
+    ]
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(
+            session.query(States.last_updated_ts, StatesMeta.entity_id).outerjoin(
+                StatesMeta, States.metadata_id == StatesMeta.metadata_id
+            )
+        )
+    assert sorted(entity_id for _, entity_id in db_states) == entity_ids
+    assert len({last_updated_ts for last_updated_ts, _ in db_states}) == 1
+
+
 @pytest.mark.parametrize(
     ("db_engine", "expected_attributes"),
     [
@@ -395,19 +432,15 @@ async def test_saving_state_with_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_on_state_insert(*args, **kwargs):
+        raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
         patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+            get_instance(hass).states_manager,
+            "insert_pending",
+            side_effect=_throw_on_state_insert,
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -438,19 +471,15 @@ async def test_saving_state_with_sqlalchemy_exception(
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in get_instance(hass).event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_on_state_insert(*args, **kwargs):
+        raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
 
     with (
         patch("time.sleep"),
         patch.object(
-            get_instance(hass).event_session,
-            "flush",
-            side_effect=_throw_if_state_in_session,
+            get_instance(hass).states_manager,
+            "insert_pending",
+            side_effect=_throw_on_state_insert,
         ),
     ):
         hass.states.async_set(entity_id, "fail", attributes)
@@ -1753,6 +1782,36 @@ async def test_database_corruption_while_running(
     hass.stop()
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_read_executor_uses_query_only_connections(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+) -> None:
+    """Test read executor jobs run on their own query only connections."""
+    hass.states.async_set("test.one", "on", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+
+    def _get_query_only() -> tuple[str, int, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            query_only = session.execute(text("PRAGMA query_only")).scalar()
+            state_count = session.query(States).count()
+        return threading.current_thread().name, query_only, state_count
+
+    thread_name, query_only, state_count = await instance.async_add_read_executor_job(
+        _get_query_only
+    )
+    assert thread_name.startswith(DB_READ_WORKER_PREFIX)
+    assert query_only == 1
+    assert state_count == 1
+
+    thread_name, query_only, _ = await instance.async_add_executor_job(_get_query_only)
+    assert not thread_name.startswith(DB_READ_WORKER_PREFIX)
+    assert query_only == 0
+
+
 async def test_entity_id_filter(
     hass: HomeAssistant,
     async_setup_recorder_instance: RecorderInstanceGenerator,
@@ -110,6 +110,76 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_big_database_bounded_duration(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a purge stops after max_duration and tracks its progress."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 12),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 12),
+    ):
+        finished = purge_old_data(
+            recorder_mock, purge_before, repack=False, max_duration=0
+        )
+        assert not finished
+
+        progress = recorder_mock.purge_progress
+        assert progress.purge_before == purge_before
+        # The rows to purge are estimated from the range of their state_ids,
+        # which also holds the newer states recorded in between
+        assert progress.rows_to_purge == 70
+        assert progress.rows_purged == 12
+        assert progress.rows_remaining == 58
+        assert progress.finished is None
+
+        with session_scope(hass=hass) as session:
+            # The oldest states are purged first
+            assert session.query(States).count() == 60
+            assert (
+                session.query(States).filter(States.state.like("autopurgeme_%")).count()
+                == 12
+            )
+
+        for _ in range(5):
+            if purge_old_data(
+                recorder_mock, purge_before, repack=False, max_duration=0
+            ):
+                break
+
+    assert recorder_mock.purge_progress is progress
+    assert progress.finished is not None
+    assert progress.rows_purged == 48
+    assert progress.rate > 0
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+
+
+async def test_purge_progress_finished_on_error(
+    hass: HomeAssistant, recorder_mock: Recorder
+) -> None:
+    """Test a failed purge does not stay in progress."""
+    await _add_test_states(hass)
+
+    with (
+        patch(
+            "homeassistant.components.recorder.purge._purge_states_and_attributes_ids",
+            side_effect=RuntimeError,
+        ),
+        pytest.raises(RuntimeError),
+    ):
+        purge_old_data(
+            recorder_mock, dt_util.utcnow() - timedelta(days=4), repack=False
+        )
+
+    assert recorder_mock.purge_progress.rows_purged == 0
+    assert recorder_mock.purge_progress.finished is not None
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
@@ -243,6 +313,28 @@ async def test_purge_old_states_encouters_database_corruption(
         assert states_after_purge.count() == 0
 
 
+@pytest.mark.parametrize("recorder_config", [{"purge_max_duration": 0.5}])
+@pytest.mark.parametrize(
+    ("service_data", "max_duration"),
+    [({}, 0.5), ({"max_duration": 10}, 10)],
+)
+@pytest.mark.usefixtures("recorder_mock")
+async def test_purge_service_max_duration(
+    hass: HomeAssistant, service_data: dict[str, float], max_duration: float
+) -> None:
+    """Test the max duration of the purge service is passed to the purge."""
+    with patch(
+        "homeassistant.components.recorder.purge.purge_old_data", return_value=True
+    ) as purge_old_data:
+        await hass.services.async_call(
+            RECORDER_DOMAIN, SERVICE_PURGE, service_data, blocking=True
+        )
+        await async_wait_purge_done(hass)
+
+    assert len(purge_old_data.mock_calls) == 1
+    assert purge_old_data.mock_calls[0].kwargs["max_duration"] == max_duration
+
+
 async def test_purge_old_states_encounters_temporary_mysql_error(
     hass: HomeAssistant,
     recorder_mock: Recorder,
@@ -701,7 +793,9 @@ async def test_purge_cutoff_date(hass: HomeAssistant, recorder_mock: Recorder) -
             == 1
         )
 
-    recorder_mock.queue_task(PurgeTask(cutoff, repack=False, apply_filter=False))
+    recorder_mock.queue_task(
+        PurgeTask(cutoff, repack=False, apply_filter=False, max_duration=2)
+    )
     await hass.async_block_till_done()
     await async_recorder_block_till_done(hass)
     await async_wait_purge_done(hass)
@@ -743,7 +837,7 @@ async def test_purge_cutoff_date(hass: HomeAssistant, recorder_mock: Recorder) -
 
     # Make sure we can purge everything
     recorder_mock.queue_task(
-        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False)
+        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False, max_duration=2)
     )
     await async_recorder_block_till_done(hass)
     await async_wait_purge_done(hass)
@@ -756,7 +850,7 @@ async def test_purge_cutoff_date(hass: HomeAssistant, recorder_mock: Recorder) -
 
     # Make sure we can purge everything when the db is already empty
     recorder_mock.queue_task(
-        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False)
+        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False, max_duration=2)
     )
     await async_recorder_block_till_done(hass)
     await async_wait_purge_done(hass)
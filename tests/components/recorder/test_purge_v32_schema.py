@@ -654,7 +654,9 @@ async def test_purge_cutoff_date(hass: HomeAssistant, recorder_mock: Recorder) -
         assert events.filter(Events.event_type == "PURGE").count() == rows - 1
         assert events.filter(Events.event_type == "KEEP").count() == 1
 
-    recorder_mock.queue_task(PurgeTask(cutoff, repack=False, apply_filter=False))
+    recorder_mock.queue_task(
+        PurgeTask(cutoff, repack=False, apply_filter=False, max_duration=2)
+    )
     await hass.async_block_till_done()
     await async_recorder_block_till_done(hass)
     await async_wait_purge_done(hass)
@@ -686,7 +688,7 @@ async def test_purge_cutoff_date(hass: HomeAssistant, recorder_mock: Recorder) -
 
     # Make sure we can purge everything
     recorder_mock.queue_task(
-        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False)
+        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False, max_duration=2)
     )
     await async_recorder_block_till_done(hass)
     await async_wait_purge_done(hass)
@@ -699,7 +701,7 @@ async def test_purge_cutoff_date(hass: HomeAssistant, recorder_mock: Recorder) -
 
     # Make sure we can purge everything when the db is already empty
     recorder_mock.queue_task(
-        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False)
+        PurgeTask(dt_util.utcnow(), repack=False, apply_filter=False, max_duration=2)
     )
     await async_recorder_block_till_done(hass)
     await async_wait_purge_done(hass)
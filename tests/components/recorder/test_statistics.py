@@ -9,7 +9,11 @@ from sqlalchemy import select
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history, statistics
-from homeassistant.components.recorder.db_schema import StatisticsShortTerm
+from homeassistant.components.recorder.db_schema import (
+    StatisticsDaily,
+    StatisticsMonthly,
+    StatisticsShortTerm,
+)
 from homeassistant.components.recorder.models import (
     datetime_to_timestamp_or_none,
     process_timestamp,
@@ -1844,6 +1848,176 @@ async def test_monthly_statistics_sum(
     assert stats == {}
 
 
+def _assert_statistics_approx(
+    stats: dict[str, list[dict[str, Any]]],
+    expected: dict[str, list[dict[str, Any]]],
+) -> None:
+    """Assert statistics match, allowing rounding differences."""
+    assert stats.keys() == expected.keys()
+    for statistic_id, rows in expected.items():
+        assert stats[statistic_id] == [pytest.approx(row) for row in rows]
+
+
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.freeze_time("2022-12-01 00:00:00+00:00")
+async def test_statistics_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+    timezone: str,
+) -> None:
+    """Test day, week and month statistics are read from the rollups."""
+    await hass.config.async_set_time_zone(timezone)
+    instance = recorder.get_instance(hass)
+    await async_wait_recording_done(hass)
+    assert instance.statistics_rollups_active is True
+
+    start = dt_util.as_utc(dt_util.parse_datetime("2022-09-28 00:00:00"))
+    mean_metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Outdoor temperature",
+        "source": "test",
+        "statistic_id": "test:outdoor_temperature",
+        "unit_of_measurement": "°C",
+    }
+    sum_metadata = {
+        "has_mean": False,
+        "has_sum": True,
+        "name": "Total imported energy",
+        "source": "test",
+        "statistic_id": "test:total_energy_import",
+        "unit_of_measurement": "kWh",
+    }
+    async_add_external_statistics(
+        hass,
+        mean_metadata,
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "mean": hour % 17 + 0.1,
+                "min": hour % 17 - 5,
+                "max": hour % 17 + 5,
+            }
+            for hour in range(24 * 40)
+            # Leave some gaps
+            if hour % 23
+        ],
+    )
+    async_add_external_statistics(
+        hass,
+        sum_metadata,
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "last_reset": None,
+                "state": hour % 11,
+                "sum": hour * 1.5,
+            }
+            for hour in range(24 * 40)
+        ],
+    )
+    await async_wait_recording_done(hass)
+    statistic_ids = {"test:outdoor_temperature", "test:total_energy_import"}
+
+    def _assert_rollups_match_hourly_statistics() -> None:
+        for period in ("day", "week", "month"):
+            with patch.object(
+                statistics,
+                "_reduce_statistics",
+                wraps=statistics._reduce_statistics,
+            ) as reduce_mock:
+                stats = statistics_during_period(
+                    hass, start, statistic_ids=statistic_ids, period=period
+                )
+            assert not reduce_mock.called
+            instance.statistics_rollups_active = False
+            try:
+                expected = statistics_during_period(
+                    hass, start, statistic_ids=statistic_ids, period=period
+                )
+            finally:
+                instance.statistics_rollups_active = True
+            assert expected.keys() == statistic_ids
+            _assert_statistics_approx(stats, expected)
+
+    _assert_rollups_match_hourly_statistics()
+
+    # Adjusting the sum updates the rollups
+    instance.async_adjust_statistics(
+        "test:total_energy_import", start + timedelta(days=10, hours=5), 100, "kWh"
+    )
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+
+    # The rollups no longer line up with the days after the time zone changed,
+    # the hourly statistics are reduced until the rollups have been rebuilt
+    await hass.config.async_set_time_zone("Pacific/Auckland")
+    with patch.object(
+        statistics, "_reduce_statistics", wraps=statistics._reduce_statistics
+    ) as reduce_mock:
+        statistics_during_period(hass, start, statistic_ids=statistic_ids, period="day")
+    assert reduce_mock.called
+    await async_wait_recording_done(hass)
+    _assert_rollups_match_hourly_statistics()
+
+    # Clearing the statistics removes the rollups
+    instance.async_clear_statistics(list(statistic_ids))
+    await async_wait_recording_done(hass)
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.query(StatisticsDaily).count() == 0
+        assert session.query(StatisticsMonthly).count() == 0
+
+
+@pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
+async def test_compile_hourly_statistics_updates_rollups(
+    hass: HomeAssistant,
+    setup_recorder: None,
+) -> None:
+    """Test compiling hourly statistics updates the daily and monthly rollups."""
+    instance = recorder.get_instance(hass)
+    await async_wait_recording_done(hass)
+    metadata = {
+        "has_mean": True,
+        "has_sum": False,
+        "name": "Outdoor temperature",
+        "source": "test",
+        "statistic_id": "test:outdoor_temperature",
+        "unit_of_measurement": "°C",
+    }
+    hour_1 = dt_util.utcnow()
+    hour_2 = hour_1 + timedelta(hours=1)
+
+    def _rollups() -> list[tuple]:
+        with session_scope(hass=hass, read_only=True) as session:
+            return [
+                (row.mean, row.mean_weight, row.min, row.max)
+                for table in (StatisticsDaily, StatisticsMonthly)
+                for row in session.query(table).order_by(table.start_ts)
+            ]
+
+    for hour, value in ((hour_1, 10), (hour_2, 20)):
+        instance.async_import_statistics(
+            metadata,
+            [
+                {
+                    "start": hour + timedelta(minutes=5 * idx),
+                    "mean": value,
+                    "min": value - idx,
+                    "max": value + idx,
+                }
+                for idx in range(12)
+            ],
+            StatisticsShortTerm,
+        )
+        do_adhoc_statistics(hass, start=hour + timedelta(minutes=55))
+        await async_wait_recording_done(hass)
+
+        if hour is hour_1:
+            assert _rollups() == [(10, 1, 10 - 11, 10 + 11)] * 2
+
+    assert _rollups() == [(15, 2, 10 - 11, 20 + 11)] * 2
+
+
 def test_cache_key_for_generate_statistics_during_period_stmt() -> None:
     """Test cache key for _generate_statistics_during_period_stmt."""
     stmt = _generate_statistics_during_period_stmt(
@@ -6,8 +6,10 @@ import pytest
 
 from homeassistant.components.recorder import Recorder, get_instance
 from homeassistant.components.recorder.const import SupportedDialect
+from homeassistant.components.recorder.purge import PurgeProgress
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from .common import async_wait_recording_done
 
@@ -38,6 +40,28 @@ async def test_recorder_system_health(
     }
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+async def test_recorder_system_health_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, recorder_db_url: str
+) -> None:
+    """Test recorder system health shows the progress of a running purge."""
+    assert await async_setup_component(hass, "system_health", {})
+    await async_wait_recording_done(hass)
+    instance = get_instance(hass)
+    progress = PurgeProgress(dt_util.utcnow(), rows_to_purge=1000, rows_purged=250)
+    instance.purge_progress = progress
+
+    info = await get_system_health_info(hass, "recorder")
+    assert info["purge_rows_remaining"] == 750
+    assert info["purge_rate"] == ANY
+
+    progress.finished = progress.started + 10
+    info = await get_system_health_info(hass, "recorder")
+    assert "purge_rows_remaining" not in info
+    assert "purge_rate" not in info
+
+
 @pytest.mark.parametrize(
     "db_engine", [SupportedDialect.MYSQL, SupportedDialect.POSTGRESQL]
 )
@@ -34,7 +34,12 @@ from homeassistant.components.recorder.statistics import (
     list_statistic_ids,
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
-from homeassistant.components.sensor import ATTR_OPTIONS, DOMAIN, SensorDeviceClass
+from homeassistant.components.sensor import (
+    ATTR_OPTIONS,
+    DOMAIN,
+    SensorDeviceClass,
+    recorder,
+)
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component
@@ -5172,3 +5177,52 @@ async def test_exclude_attributes(hass: HomeAssistant) -> None:
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+def test_batch_time_weighted_average_min_max() -> None:
+    """Test the batch calculation matches the per entity calculation."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    end = start + timedelta(minutes=5)
+
+    def _float_states(*points: tuple[float, timedelta]) -> list[tuple[float, State]]:
+        return [
+            (value, State("sensor.test", str(value), last_updated=start + offset))
+            for value, offset in points
+        ]
+
+    entities_float_states = [
+        # The first state is from before the period
+        (
+            "sensor.one",
+            _float_states(
+                (10, timedelta(minutes=-20)),
+                (15, timedelta(seconds=30)),
+                (-5, timedelta(minutes=4)),
+            ),
+        ),
+        # Only one state during the period
+        ("sensor.two", _float_states((3.5, timedelta(minutes=2)))),
+        # The only state change is at the end of the period
+        ("sensor.three", _float_states((7, timedelta(minutes=5)))),
+    ]
+
+    batch = recorder._batch_time_weighted_average_min_max(
+        entities_float_states, start, end
+    )
+    assert batch is not None
+    assert list(batch) == ["sensor.one", "sensor.two", "sensor.three"]
+    for entity_id, float_states in entities_float_states:
+        values = [fstate for fstate, _ in float_states]
+        assert batch[entity_id] == (
+            pytest.approx(recorder._time_weighted_average(float_states, start, end)),
+            min(values),
+            max(values),
+        )
+
+    with patch.dict("sys.modules", {"numpy": None}):
+        assert (
+            recorder._batch_time_weighted_average_min_max(
+                entities_float_states, start, end
+            )
+            is None
+        )
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -19,14 +20,19 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, template
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    async_track_state_change_event,
+    async_track_template_result,
+)
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +40,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -1198,6 +1205,135 @@ async def test_subscribe_unsubscribe_entities(
     }
 
 
+async def test_subscribe_entities_share_state_changed_listener(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscriptions share one listener and only get their entities."""
+    listeners_before = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+    await websocket_client.send_json(
+        {"id": 8, "type": "subscribe_entities", "entity_ids": ["light.one"]}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners_before + 1
+
+    hass.states.async_set("light.two", "on")
+    hass.states.async_set("light.one", "on")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert list(msg["event"]["a"]) == ["light.two"]
+    received = {}
+    for _ in range(2):
+        msg = await websocket_client.receive_json()
+        received[msg["id"]] = list(msg["event"]["a"])
+    assert received == {7: ["light.one"], 8: ["light.one"]}
+
+    for msg_id, subscription in ((9, 7), (10, 8)):
+        await websocket_client.send_json(
+            {"id": msg_id, "type": "unsubscribe_events", "subscription": subscription}
+        )
+        msg = await websocket_client.receive_json()
+        assert msg["success"]
+
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners_before
+
+
+async def test_subscribe_entities_permissions_change(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities follows changes of the permissions of the user."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"a": {}}
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass_admin_user.mock_policy({"entities": {"all": True}})
+    hass.states.async_set("light.other", "on")
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.other"]
+
+
+async def test_subscribe_entities_coalesce_window(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test subscribe entities only sends the latest states in a window."""
+    hass.states.async_set("sensor.power", "100")
+    hass.states.async_set("light.removed", "on")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert set(msg["event"]["a"]) == {"sensor.power", "light.removed"}
+
+    for power in ("101", "102", "103"):
+        hass.states.async_set("sensor.power", power, {"unit_of_measurement": "W"})
+    hass.states.async_remove("light.removed")
+    hass.states.async_set("light.new", "off")
+    hass.states.async_set("light.new", "on")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "sensor.power": {
+                "a": {"unit_of_measurement": "W"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "103",
+            },
+            "light.new": {"a": {}, "c": ANY, "lc": ANY, "s": "on"},
+        },
+        "r": ["light.removed"],
+    }
+
+    hass.states.async_set("sensor.power", "104")
+    await websocket_client.send_json(
+        {"id": 8, "type": "unsubscribe_events", "subscription": 7}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
+async def test_subscribe_entities_invalid_coalesce_window(
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test subscribe entities rejects a coalesce window that is too long."""
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "coalesce_window": 3600}
+    )
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
 async def test_subscribe_unsubscribe_entities_specific_entities(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
@@ -2515,6 +2651,89 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_loop_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test loop_stats command."""
+    hass.loop_stats.async_reset()
+    hass.loop_stats.async_start()
+    hass.bus.async_listen("test_loop_stats", callback(lambda event: None))
+    hass.bus.async_fire("test_loop_stats")
+    hass.loop_stats.async_stop()
+
+    await websocket_client.send_json({"id": 7, "type": "loop_stats", "reset": True})
+    msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["events"]["test_loop_stats"]["count"] == 1
+    assert msg["result"]["loop_lag"]["count"] == 0
+    assert "test_loop_stats" not in hass.loop_stats.events
+
+
+async def test_loop_stats_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test loop_stats command requires an admin."""
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "loop_stats"})
+    msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
+async def test_template_stats(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test template_stats command."""
+    render_stats = template.async_get_template_render_stats(hass)
+    render_stats.async_reset()
+    hass.states.async_set("sensor.test", "1")
+    unsub = async_track_template_result(
+        hass,
+        [TrackTemplate(template.Template("{{ states('sensor.test') }}", hass), None)],
+        lambda event, updates: None,
+    )
+    hass.states.async_set("sensor.test", "2")
+    await hass.async_block_till_done()
+
+    await websocket_client.send_json({"id": 7, "type": "template_stats", "reset": True})
+    msg = await websocket_client.receive_json()
+    unsub.async_remove()
+
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["budget"] == template.TEMPLATE_RENDER_TIME_BUDGET
+    assert [
+        (stats["template"], stats["renders"], stats["triggers"])
+        for stats in msg["result"]["templates"]
+    ] == [("{{ states('sensor.test') }}", 2, 1)]
+    assert not render_stats.templates
+
+
+async def test_template_stats_requires_admin(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test template_stats command requires an admin."""
+    hass_admin_user.groups = []
+
+    await websocket_client.send_json({"id": 7, "type": "template_stats"})
+    msg = await websocket_client.receive_json()
+
+    assert msg["id"] == 7
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -2641,3 +2641,40 @@ async def test_async_write_ha_state_thread_safety_always(
     ):
         await hass.async_add_executor_job(ent2.async_write_ha_state)
     assert not hass.states.get(ent2.entity_id)
+
+
+async def test_async_write_ha_state_reuses_attributes(hass: HomeAssistant) -> None:
+    """Test the attributes are reused when only the state changes."""
+    ent = entity.Entity()
+    ent.entity_id = "test.any"
+    ent.hass = hass
+    ent._attr_attribution = "Home Assistant"
+    ent._attr_extra_state_attributes = {"extra": 1}
+    ent._attr_state = "on"
+    ent.async_write_ha_state()
+    attributes = hass.states.get(ent.entity_id).attributes
+
+    ent._attr_state = "off"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == "off"
+    assert state.attributes is attributes
+
+    # Extra state attributes modified in place are written
+    ent._attr_extra_state_attributes["extra"] = 2
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes is not attributes
+    assert state.attributes == {ATTR_ATTRIBUTION: "Home Assistant", "extra": 2}
+    attributes = state.attributes
+
+    ent._attr_attribution = "Someone else"
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.attributes == {ATTR_ATTRIBUTION: "Someone else", "extra": 2}
+
+    ent._attr_available = False
+    ent.async_write_ha_state()
+    state = hass.states.get(ent.entity_id)
+    assert state.state == STATE_UNAVAILABLE
+    assert state.attributes == {ATTR_ATTRIBUTION: "Someone else"}
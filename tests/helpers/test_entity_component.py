@@ -25,7 +25,10 @@ from homeassistant.core import (
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import discovery
 from homeassistant.helpers.entity_component import EntityComponent, async_update_entity
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.entity_platform import (
+    AddEntitiesCallback,
+    async_get_polling_scheduler,
+)
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
@@ -138,14 +141,13 @@ async def test_set_scan_interval_via_config(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
-        component.setup(
-            {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
-        )
+    component.setup(
+        {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
+    )
+    await hass.async_block_till_done()
 
-        await hass.async_block_till_done()
-    assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    scheduler = async_get_polling_scheduler(hass)
+    assert [group["interval"] for group in scheduler.as_dict()["groups"]] == [30.0]
 
 
 async def test_set_entity_namespace_via_config(hass: HomeAssistant) -> None:
@@ -4,6 +4,8 @@ import asyncio
 from collections.abc import Iterable
 from datetime import timedelta
 import logging
+import threading
+import time
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
 
@@ -33,6 +35,7 @@ from homeassistant.helpers.entity_component import (
     EntityComponent,
 )
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
+from homeassistant.helpers.update_executor import async_get_update_executor
 import homeassistant.util.dt as dt_util
 
 from tests.common import (
@@ -118,7 +121,146 @@ async def test_polling_disabled_by_config_entry(hass: HomeAssistant) -> None:
     poll_ent = MockEntity(should_poll=True)
 
     await entity_platform.async_add_entities([poll_ent])
-    assert entity_platform._async_polling_timer is None
+    assert entity_platform._async_unsub_polling is None
+
+
+async def test_polling_spreads_platforms_with_the_same_interval(
+    hass: HomeAssistant,
+) -> None:
+    """Test platforms with the same scan interval are polled in different slots."""
+    platforms = [
+        MockEntityPlatform(
+            hass, platform_name=f"test_{idx}", scan_interval=timedelta(seconds=30)
+        )
+        for idx in range(3)
+    ]
+    entities = [MockEntity(should_poll=True) for _ in platforms]
+    for platform, entity in zip(platforms, entities, strict=True):
+        entity.async_update = AsyncMock()
+        await platform.async_add_entities([entity])
+
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    # The slot due within the next slot length is skipped, the platforms
+    # are added to the next least used slots
+    assert scheduler.as_dict()["groups"] == [
+        {"interval": 30.0, "slots": [0, 0, 1, 1, 1] + [0] * 25}
+    ]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1.2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [entity.async_update.call_count for entity in entities] == [0, 0, 0]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=2.2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [entity.async_update.call_count for entity in entities] == [1, 0, 0]
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=4.2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [entity.async_update.call_count for entity in entities] == [1, 1, 1]
+
+    # The next polls follow one scan interval later
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=34.2))
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert [entity.async_update.call_count for entity in entities] == [2, 2, 2]
+
+    stats = scheduler.as_dict()["platforms"]
+    assert {platform["platform"] for platform in stats} == {
+        "test_domain.test_0",
+        "test_domain.test_1",
+        "test_domain.test_2",
+    }
+    assert all(platform["polls"] == 2 for platform in stats)
+
+    for platform in platforms:
+        platform.async_unsub_polling()
+    assert scheduler.as_dict()["groups"] == []
+
+
+async def test_polling_first_poll_within_one_interval(hass: HomeAssistant) -> None:
+    """Test a platform added late in the interval is not polled a cycle later."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    await platform.async_add_entities([MockEntity(should_poll=True)])
+    group = entity_platform.async_get_polling_scheduler(hass)._groups[30.0]
+
+    late_platform = Mock()
+    with patch.object(hass.loop, "time", return_value=group.epoch + 20.5):
+        group.async_add(late_platform)
+
+    # Slot 21 is due within the next slot length, slot 22 is the first
+    # least used slot after it
+    assert group.slots[22] == {late_platform: 22}
+    assert group._timers[22].when() == pytest.approx(group.epoch + 22)
+
+    assert not group.async_remove(late_platform)
+    platform.async_unsub_polling()
+
+
+async def test_polling_skips_slots_missed_while_loop_was_blocked(
+    hass: HomeAssistant,
+) -> None:
+    """Test a slot is not polled again for each occurrence missed in a stall."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=1))
+    await platform.async_add_entities([MockEntity(should_poll=True)])
+
+    group = entity_platform.async_get_polling_scheduler(hass)._groups[1.0]
+    timer = group._timers[0]
+    assert timer is not None
+    slot_number = round(timer.when() - group.epoch)
+    timer.cancel()
+
+    # The loop was blocked for 5.3 seconds past the slot
+    with patch.object(hass.loop, "time", return_value=group.epoch + slot_number + 5.3):
+        group._async_poll(slot_number)
+    await hass.async_block_till_done()
+
+    next_timer = group._timers[0]
+    assert next_timer is not None
+    assert next_timer.when() == pytest.approx(group.epoch + slot_number + 6)
+    platform.async_unsub_polling()
+
+
+async def test_polling_sync_updates_use_update_executor(
+    hass: HomeAssistant,
+) -> None:
+    """Test polled entities with a sync update stay within the integration limit."""
+    mock_platform = MockPlatform()
+    mock_platform.PARALLEL_UPDATES = 0
+    platform = MockEntityPlatform(hass, platform=mock_platform)
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def update() -> None:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+
+    entities = [MockEntity(should_poll=True) for _ in range(3)]
+    for entity in entities:
+        entity.update = update
+    await platform.async_add_entities(entities)
+
+    executor = async_get_update_executor(hass)
+    # PARALLEL_UPDATES = 0 lets the integration use all workers
+    assert executor.as_dict()["integrations"] == []
+    assert executor._limits == {"test_platform": executor.max_workers}
+
+    executor.async_set_integration_limit("test_platform", 1)
+    await platform._async_update_entity_states()
+    assert max_running == 1
+
+    # The updates can only pass the barrier when they run at the same time
+    barrier = threading.Barrier(3, timeout=5)
+    for entity in entities:
+        entity.update = barrier.wait
+    executor.async_set_integration_limit("test_platform", 3)
+    await platform._async_update_entity_states()
+    assert not barrier.broken
+    assert executor.as_dict()["integrations"][0]["jobs"] == 6
 
 
 async def test_polling_updates_entities_with_exception(hass: HomeAssistant) -> None:
@@ -231,12 +373,11 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
-        await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
 
-        await hass.async_block_till_done()
-    assert mock_track.called
-    assert mock_track.call_args[0][0] == 30.0
+    scheduler = entity_platform.async_get_polling_scheduler(hass)
+    assert [group["interval"] for group in scheduler.as_dict()["groups"]] == [30.0]
 
 
 async def test_adding_entities_with_generator_and_thread_callback(
@@ -1015,7 +1156,7 @@ async def test_stop_shutdown_cancels_retry_setup_and_interval_listener(
     ent_platform.async_shutdown()
 
     assert len(mock_call_later.return_value.mock_calls) == 1
-    assert ent_platform._async_polling_timer is None
+    assert ent_platform._async_unsub_polling is None
     assert ent_platform._async_cancel_retry_setup is None
 
 
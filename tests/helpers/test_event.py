@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Callable
 import contextlib
 from datetime import date, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
 from astral import LocationInfo
@@ -50,7 +51,7 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import RenderInfo, Template, result_as_boolean
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -552,6 +553,35 @@ async def test_async_track_state_change_event_with_empty_list(
     unsub_single()
 
 
+async def test_async_track_state_change_event_keyed_listeners(
+    hass: HomeAssistant,
+) -> None:
+    """Test async_track_state_change_event adds one keyed listener per entity."""
+    listeners_before = hass.bus.async_listeners().get("state_changed", 0)
+    tracker = []
+
+    @ha.callback
+    def run_callback(event: Event[EventStateChangedData]) -> None:
+        tracker.append(event.data["entity_id"])
+
+    unsub_one = async_track_state_change_event(
+        hass, ["light.bowl", "switch.fan"], run_callback
+    )
+    unsub_two = async_track_state_change_event(hass, "light.bowl", run_callback)
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 2
+
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.fan", "on")
+    hass.states.async_set("switch.other", "on")
+    await hass.async_block_till_done()
+    assert tracker == ["light.bowl", "light.bowl", "switch.fan"]
+
+    unsub_one()
+    assert hass.bus.async_listeners()["state_changed"] == listeners_before + 1
+    unsub_two()
+    assert hass.bus.async_listeners().get("state_changed", 0) == listeners_before
+
+
 async def test_async_track_state_added_domain(hass: HomeAssistant) -> None:
     """Test async_track_state_added_domain."""
     single_entity_id_tracker = []
@@ -1959,6 +1989,77 @@ async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_skips_unrelated_attribute_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test a template is only re-rendered when something it read changed."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "effect": "a"})
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    template = Template(
+        "{{ states.light.kitchen.state }} {{ state_attr('light.kitchen', 'brightness') }}"
+        " {{ states.sensor.power.attributes }}",
+        hass,
+    )
+    specific_runs = []
+
+    @ha.callback
+    def specific_run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        specific_runs.append(updates.pop().result)
+
+    original_render_to_info = Template.async_render_to_info
+    renders: list[Template] = []
+
+    def _async_render_to_info(self: Template, *args: Any, **kwargs: Any) -> RenderInfo:
+        renders.append(self)
+        return original_render_to_info(self, *args, **kwargs)
+
+    with patch.object(Template, "async_render_to_info", _async_render_to_info):
+        async_track_template_result(
+            hass, [TrackTemplate(template, None)], specific_run_callback
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 1
+
+        hass.states.async_set("light.kitchen", "on", {"brightness": 100, "effect": "b"})
+        await hass.async_block_till_done()
+        assert len(renders) == 1
+
+        hass.states.async_set(
+            "light.kitchen", "on", {"brightness": 100, "effect": "b"}, force_update=True
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 1
+
+        hass.states.async_set("light.kitchen", "on", {"brightness": 200, "effect": "b"})
+        await hass.async_block_till_done()
+        assert len(renders) == 2
+
+        hass.states.async_set(
+            "light.kitchen", "off", {"brightness": 200, "effect": "b"}
+        )
+        await hass.async_block_till_done()
+        assert len(renders) == 3
+
+        # All attributes of sensor.power were read
+        hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "kW"})
+        await hass.async_block_till_done()
+        assert len(renders) == 4
+
+        hass.states.async_remove("light.kitchen")
+        await hass.async_block_till_done()
+        assert len(renders) == 5
+
+    assert specific_runs == [
+        "on 200 {'unit_of_measurement': 'W'}",
+        "off 200 {'unit_of_measurement': 'W'}",
+        "off 200 {'unit_of_measurement': 'kW'}",
+        "None {'unit_of_measurement': 'kW'}",
+    ]
+
+
 async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
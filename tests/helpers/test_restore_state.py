@@ -94,6 +94,56 @@ async def test_caching_data(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_stored_states_decoded_lazily(hass: HomeAssistant) -> None:
+    """Test stored states are only decoded when they are needed."""
+    now = dt_util.utcnow()
+    data = async_get(hass)
+    await hass.async_block_till_done()
+    await data.store.async_save(
+        [
+            StoredState(State("input_boolean.b0", "on"), None, now).as_dict(),
+            StoredState(State("input_boolean.b1", "off"), None, now).as_dict(),
+            StoredState(
+                State("input_boolean.b2", "on"), None, now - timedelta(days=8)
+            ).as_dict(),
+        ]
+    )
+    hass.data.pop(DATA_RESTORE_STATE)
+
+    with patch(
+        "homeassistant.helpers.restore_state.StoredState.from_dict",
+        wraps=StoredState.from_dict,
+    ) as from_dict_mock:
+        data = async_get(hass)
+        await data.async_load()
+        assert from_dict_mock.call_count == 0
+
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = "input_boolean.b1"
+        state = await entity.async_get_last_state()
+        assert state.state == "off"
+        assert from_dict_mock.call_count == 1
+        assert await entity.async_get_last_state() is state
+        assert from_dict_mock.call_count == 1
+
+        # States that were not restored are stored again without decoding
+        # them, expired states are dropped
+        with patch.object(data.store, "async_save") as mock_save:
+            await data.async_dump_states()
+        assert from_dict_mock.call_count == 1
+        saved = mock_save.call_args[0][0]
+        assert len(saved) == 2
+        assert saved[0]["state"] is state.json_fragment
+        assert saved[1] is data._stored_items["input_boolean.b0"]
+
+        assert {
+            stored_state.state.entity_id
+            for stored_state in data.async_get_stored_states()
+        } == {"input_boolean.b0", "input_boolean.b1"}
+        assert from_dict_mock.call_count == 2
+
+
 async def test_async_get_instance_backwards_compatibility(hass: HomeAssistant) -> None:
     """Test async_get_instance backwards compatibility."""
     await async_load(hass)
@@ -1347,6 +1347,35 @@ async def test_call_with_one_of_required_features(
     assert all(entity in actual for entity in expected)
 
 
+async def test_call_only_looks_up_referenced_entities(
+    hass: HomeAssistant, mock_entities
+) -> None:
+    """Test service calls do not iterate over all the registered entities."""
+
+    class NotIterableDict(dict):
+        def __iter__(self):
+            raise AssertionError("Registered entities should not be iterated")
+
+    test_service_mock = AsyncMock(return_value=None)
+    await service.entity_service_call(
+        hass,
+        NotIterableDict(mock_entities),
+        HassJob(test_service_mock),
+        ServiceCall(
+            "test_domain",
+            "test_service",
+            {"entity_id": ["light.kitchen", "light.bedroom", "light.missing"]},
+        ),
+    )
+
+    assert sorted(
+        call[0][0].entity_id for call in test_service_mock.call_args_list
+    ) == [
+        "light.bedroom",
+        "light.kitchen",
+    ]
+
+
 async def test_call_with_sync_func(hass: HomeAssistant, mock_entities) -> None:
     """Test invoking sync service calls."""
     test_service_mock = Mock(return_value=None)
@@ -4,6 +4,7 @@ import asyncio
 from datetime import timedelta
 import json
 import os
+import threading
 from typing import Any, NamedTuple
 from unittest.mock import Mock, patch
 
@@ -23,6 +24,7 @@ from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
 from homeassistant.util import dt as dt_util
 from homeassistant.util.color import RGBColor
+from homeassistant.util.json import load_json_object
 
 from tests.common import (
     async_fire_time_changed,
@@ -1180,3 +1182,171 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal_round_trip(tmpdir: py.path.local) -> None:
+    """Test saves are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data: dict[str, Any] = {
+            "items": [{"id": idx, "name": f"item {idx}"} for idx in range(50)],
+            "other": 1,
+            "removed": True,
+        }
+        await store.async_save(data)
+
+        def _read_files() -> tuple[str, str | None]:
+            with open(store.path, encoding="utf8") as fp:
+                snapshot = fp.read()
+            if not os.path.exists(store.journal_path):
+                return snapshot, None
+            with open(store.journal_path, encoding="utf8") as fp:
+                return snapshot, fp.read()
+
+        snapshot, journal = await hass.async_add_executor_job(_read_files)
+        assert journal is None
+
+        data["items"][5] = {"id": 5, "name": "renamed"}
+        await store.async_save(data)
+        data["items"].append({"id": 50, "name": "item 50"})
+        del data["items"][2]
+        del data["removed"]
+        data["other"] = 2
+        await store.async_save(data)
+        # Saving data without changes does not add a record
+        await store.async_save(data)
+
+        new_snapshot, journal = await hass.async_add_executor_job(_read_files)
+        assert new_snapshot == snapshot
+        assert len(journal.splitlines()) == 2
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+
+        # The journal is compacted into the storage file when it has
+        # too many records
+        with patch("homeassistant.helpers.storage.JOURNAL_MAX_RECORDS", 2):
+            data["other"] = 3
+            await store.async_save(data)
+        new_snapshot, journal = await hass.async_add_executor_job(_read_files)
+        assert journal is None
+        assert json.loads(new_snapshot)["data"] == data
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+
+        await store.async_remove()
+        assert await hass.async_add_executor_job(os.path.exists, store.path) is False
+        await hass.async_stop(force=True)
+
+
+async def test_journal_compacted_on_final_write(tmpdir: py.path.local) -> None:
+    """Test the journal is folded into the storage file on shutdown."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {"items": [{"id": idx} for idx in range(50)], "other": 1}
+        await store.async_save(data)
+        data["items"].append({"id": 50})
+        await store.async_save(data)
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # Without pending data the written data is compacted
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        snapshot = await hass.async_add_executor_job(load_json_object, store.path)
+        assert snapshot["data"] == data
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+
+        # Pending data is written in full
+        data["other"] = 2
+        hass.set_state(CoreState.stopping)
+        store.async_delay_save(lambda: data, 10)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        snapshot = await hass.async_add_executor_job(load_json_object, store.path)
+        assert snapshot["data"] == data
+        await hass.async_stop(force=True)
+
+
+async def test_journal_final_write_waits_for_running_write(
+    tmpdir: py.path.local,
+) -> None:
+    """Test the compaction on shutdown includes a write that was running."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {"items": [{"id": idx} for idx in range(50)], "other": 1}
+        await store.async_save(data)
+
+        started = threading.Event()
+        release = threading.Event()
+        append_journal = store._append_journal
+
+        def _slow_append_journal(*args: Any) -> bool:
+            started.set()
+            release.wait()
+            return append_journal(*args)
+
+        data["other"] = 2
+        with patch.object(store, "_append_journal", _slow_append_journal):
+            save_task = hass.async_create_task(store.async_save(data))
+            await hass.async_add_executor_job(started.wait)
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await asyncio.sleep(0)
+            release.set()
+            await save_task
+            await hass.async_block_till_done()
+
+        assert not await hass.async_add_executor_job(os.path.exists, store.journal_path)
+        snapshot = await hass.async_add_executor_job(load_json_object, store.path)
+        assert snapshot["data"] == data
+        await hass.async_stop(force=True)
+
+
+async def test_journal_ignores_stale_and_incomplete_records(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test records of another storage file and interrupted records are skipped."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        data = {"items": [{"id": idx} for idx in range(50)]}
+        await store.async_save(data)
+        data["items"].append({"id": 50})
+        await store.async_save(data)
+
+        def _add_records() -> None:
+            with open(store.journal_path, "rb") as fp:
+                journal = fp.read()
+            stale = json_bytes({"journal": "stale", "set": {"items": []}}) + b"\n"
+            with open(store.journal_path, "wb") as fp:
+                fp.write(stale + journal + b'{"journal": "')
+
+        await hass.async_add_executor_job(_add_records)
+        assert (
+            await storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True).async_load()
+            == data
+        )
+        assert "Ignoring incomplete journal record of storage-test" in caplog.text
+        await hass.async_stop(force=True)
+
+
+async def test_journal_requires_default_encoder(hass: HomeAssistant) -> None:
+    """Test a journal can not be combined with a custom encoder."""
+    with pytest.raises(ValueError):
+        storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, journal=True, encoder=json.JSONEncoder
+        )
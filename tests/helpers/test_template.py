@@ -21,6 +21,7 @@ from homeassistant import config_entries
 from homeassistant.components import group
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_STARTED,
     STATE_ON,
     STATE_UNAVAILABLE,
     UnitOfLength,
@@ -31,7 +32,7 @@ from homeassistant.const import (
     UnitOfTemperature,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import (
     area_registry as ar,
@@ -4597,6 +4598,50 @@ def test_nested_async_render_to_info_case(hass: HomeAssistant) -> None:
     assert info.rate_limit is None
 
 
+def test_async_render_to_info_collects_entity_attributes(
+    hass: HomeAssistant,
+) -> None:
+    """Test async_render_to_info records the attributes read of each entity."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.hallway", "on", {"brightness": 50})
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.energy", "5")
+    hass.states.async_set("switch.pump", "off")
+
+    info = render_to_info(
+        hass,
+        "{{ states.light.kitchen.state }} {{ is_state('switch.pump', 'off') }}"
+        " {{ state_attr('light.hallway', 'brightness') }}"
+        " {{ is_state_attr('light.hallway', 'color_mode', 'hs') }}"
+        " {{ states.sensor.power.attributes.unit_of_measurement }}"
+        " {{ state_attr('sensor.energy', 'unit_of_measurement') }}"
+        " {{ states.sensor.energy.last_changed is defined }}",
+    )
+    assert info.entity_attributes == {
+        "light.kitchen": frozenset(),
+        "switch.pump": frozenset(),
+        "light.hallway": {"brightness", "color_mode"},
+    }
+
+    # The id of the state is collected, not the one the template used
+    info = render_to_info(hass, "{{ state_attr('Light.Kitchen', 'brightness') }}")
+    assert info.entity_attributes == {"light.kitchen": {"brightness"}}
+    assert info.entities == {"light.kitchen"}
+
+    info = render_to_info(
+        hass, "{{ states.switch.pump.state }} {{ states.light | list | count }}"
+    )
+    assert info.entity_attributes == {"switch.pump": frozenset()}
+    info = render_to_info(
+        hass, "{{ states.switch.pump.state }} {{ states.switch | list | count }}"
+    )
+    assert info.entity_attributes == {}
+    info = render_to_info(
+        hass, "{{ states.switch.pump.state }} {{ states | list | count }}"
+    )
+    assert info.entity_attributes == {}
+
+
 def test_result_as_boolean(hass: HomeAssistant) -> None:
     """Test converting a template result to a boolean."""
 
@@ -6236,3 +6281,177 @@ async def test_template_thread_safety_checks(hass: HomeAssistant) -> None:
         await hass.async_add_executor_job(template_obj.async_render_to_info)
 
     assert template_obj.async_render_to_info().result() == 23
+
+
+async def test_template_code_cache(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the code compiled at startup is saved and used after a restart."""
+    hass.set_state(CoreState.starting)
+    await template.async_load_template_code_cache(hass)
+    hass.data.pop(template._ENVIRONMENT, None)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    # Templates compiled after startup are not saved
+    assert template.Template("{{ 1 + 3 }}", hass).async_render() == 4
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.TEMPLATE_CODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.TEMPLATE_CODE_STORAGE_KEY]["data"]
+    assert len(stored["code"]) == 1
+
+    # Simulate a restart with a template that is no longer used
+    stored["code"]["unused"] = next(iter(stored["code"].values()))
+    await template.async_load_template_code_cache(hass)
+    code_cache = hass.data[template._TEMPLATE_CODE_CACHE]
+    hass.data.pop(template._ENVIRONMENT, None)
+    with patch(
+        "jinja2.sandbox.ImmutableSandboxedEnvironment.compile",
+        side_effect=AssertionError("compiled"),
+    ):
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    # The code is dropped from memory once used
+    assert list(code_cache._stored) == ["unused"]
+
+    assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+    assert code_cache._stored == {}
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.TEMPLATE_CODE_SAVE_DELAY * 2),
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.TEMPLATE_CODE_STORAGE_KEY]["data"]
+    assert len(stored["code"]) == 2
+    assert "unused" not in stored["code"]
+    assert code_cache._used == {}
+
+
+async def test_template_code_cache_max_templates(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the number of templates saved is limited."""
+    hass.set_state(CoreState.starting)
+    await template.async_load_template_code_cache(hass)
+    hass.data.pop(template._ENVIRONMENT, None)
+    with patch.object(template, "TEMPLATE_CODE_MAX_TEMPLATES", 1):
+        assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+        assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=template.TEMPLATE_CODE_SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[template.TEMPLATE_CODE_STORAGE_KEY]["data"]
+    assert list(stored["code"]) == [
+        template.TemplateCodeCache.key("{{ 1 + 1 }}", False, False)
+    ]
+
+
+async def test_template_code_cache_discards_other_versions(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled template code of other versions or corrupt code is not used."""
+    hass.set_state(CoreState.starting)
+    key = template.TemplateCodeCache.key("{{ 1 + 1 }}", False, False)
+    hass_storage[template.TEMPLATE_CODE_STORAGE_KEY] = {
+        "version": template.TEMPLATE_CODE_STORAGE_VERSION,
+        "key": template.TEMPLATE_CODE_STORAGE_KEY,
+        "data": {"version": "1.0.0-3.0.0-0000", "code": {key: "bad"}},
+    }
+    await template.async_load_template_code_cache(hass)
+    assert hass.data[template._TEMPLATE_CODE_CACHE]._stored == {}
+    hass.data.pop(template._ENVIRONMENT, None)
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+    hass_storage[template.TEMPLATE_CODE_STORAGE_KEY]["data"]["version"] = (
+        template._template_code_version()
+    )
+    await template.async_load_template_code_cache(hass)
+    hass.data.pop(template._ENVIRONMENT, None)
+    assert template.Template("{{ 1 + 2 }}", hass).async_render() == 3
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+
+
+async def test_template_render_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test renders are timed and slow templates are flagged."""
+    render_stats = template.async_get_template_render_stats(hass)
+    render_stats.async_reset()
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+
+    with patch("homeassistant.helpers.template.perf_counter", side_effect=[1.0, 1.002]):
+        tpl.async_render_to_info()
+    stats = render_stats.templates["{{ 1 + 1 }}"]
+    assert stats.renders == 1
+    assert stats.last == pytest.approx(0.002)
+    assert stats.over_budget == 0
+    assert "longer than the budget" not in caplog.text
+
+    for _ in range(2):
+        with patch(
+            "homeassistant.helpers.template.perf_counter", side_effect=[2.0, 2.5]
+        ):
+            tpl.async_render_to_info()
+    assert stats.renders == 3
+    assert stats.total == pytest.approx(1.002)
+    assert stats.max == pytest.approx(0.5)
+    assert stats.over_budget == 2
+    assert caplog.text.count("longer than the budget") == 1
+
+    assert render_stats.as_dict()["templates"] == [
+        {
+            "template": "{{ 1 + 1 }}",
+            "renders": 3,
+            "triggers": 0,
+            "total": stats.total,
+            "last": stats.last,
+            "max": stats.max,
+            "over_budget": 2,
+        }
+    ]
+    render_stats.async_reset()
+    assert render_stats.as_dict()["templates"] == []
+
+
+async def test_template_render_stats_exclude_compile(hass: HomeAssistant) -> None:
+    """Test the template is compiled before the render is timed."""
+    render_stats = template.async_get_template_render_stats(hass)
+    render_stats.async_reset()
+    tpl = template.Template("{{ 1 + 2 }}", hass)
+    times = iter([1.0, 1.5])
+
+    def _perf_counter() -> float:
+        assert tpl._compiled is not None
+        return next(times)
+
+    with patch("homeassistant.helpers.template.perf_counter", _perf_counter):
+        assert tpl.async_render_to_info().result() == 3
+    assert render_stats.templates["{{ 1 + 2 }}"].total == pytest.approx(0.5)
+
+    # A template that fails to compile is not timed
+    tpl = template.Template("{{ 1 + }}", hass)
+    assert isinstance(tpl.async_render_to_info().exception, TemplateError)
+    assert "{{ 1 + }}" not in render_stats.templates
+
+
+async def test_template_render_stats_max_templates(hass: HomeAssistant) -> None:
+    """Test the render stats only keep the most recently rendered templates."""
+    with patch.object(template, "TEMPLATE_RENDER_STATS_MAX_TEMPLATES", 2):
+        render_stats = template.TemplateRenderStats()
+    for source in ("one", "two", "one", "three"):
+        render_stats.record_render(source, 0.001)
+    render_stats.record_trigger("four")
+
+    assert [stats["template"] for stats in render_stats.as_dict()["templates"]] == [
+        "three",
+        "four",
+    ]
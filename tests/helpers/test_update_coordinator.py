@@ -2,6 +2,7 @@
 
 from datetime import datetime, timedelta
 import logging
+from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 import urllib.error
 
@@ -120,6 +121,35 @@ async def test_async_refresh(
     assert updates == [2]
 
 
+async def test_listeners_write_states_in_batch(
+    hass: HomeAssistant,
+    crd_without_update_interval: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test the states written by the listeners are written as one batch."""
+    crd = crd_without_update_interval
+    batches = []
+
+    @callback
+    def batch_listener(events):
+        batches.append([event.data["entity_id"] for event in events])
+
+    hass.bus.async_listen_batch(batch_listener)
+
+    for entity_id in ("sensor.one", "sensor.two"):
+
+        def update_callback(entity_id: str = entity_id) -> None:
+            hass.states.async_set(entity_id, str(crd.data))
+
+        crd.async_add_listener(update_callback)
+
+    await crd.async_refresh()
+    assert batches == [["sensor.one", "sensor.two"]]
+    assert (
+        hass.states.get("sensor.one").last_updated
+        == hass.states.get("sensor.two").last_updated
+    )
+
+
 async def test_shutdown(
     hass: HomeAssistant,
     crd: update_coordinator.DataUpdateCoordinator[int],
@@ -765,6 +795,75 @@ async def test_always_callback_when_always_update_is_true(
     remove_callbacks()
 
 
+async def test_keyed_data_only_callbacks_listeners_of_changed_keys(
+    hass: HomeAssistant,
+) -> None:
+    """Test only the listeners of the changed keys are called back with keyed_data."""
+    mocked_data: dict[str, Any] | None = None
+    mocked_exception: Exception | None = None
+
+    async def _update_method() -> dict[str, Any]:
+        if mocked_exception is not None:
+            raise mocked_exception
+        assert mocked_data is not None
+        return mocked_data
+
+    crd = update_coordinator.DataUpdateCoordinator[dict[str, Any]](
+        hass,
+        _LOGGER,
+        name="test",
+        update_method=_update_method,
+        update_interval=DEFAULT_UPDATE_INTERVAL,
+        keyed_data=True,
+    )
+    callback_a = Mock()
+    callback_b = Mock()
+    callback_all = Mock()
+    remove_callbacks = [
+        crd.async_add_listener(callback_a, "a"),
+        crd.async_add_listener(callback_b, "b"),
+        crd.async_add_listener(callback_all),
+    ]
+    callbacks = (callback_a, callback_b, callback_all)
+
+    def _call_counts() -> list[int]:
+        counts = [update_callback.call_count for update_callback in callbacks]
+        for update_callback in callbacks:
+            update_callback.reset_mock()
+        return counts
+
+    mocked_data = {"a": {"state": 1}, "b": {"state": 1}}
+    await crd.async_refresh()
+    assert _call_counts() == [1, 1, 1]
+
+    mocked_data = {"a": {"state": 1}, "b": {"state": 1}}
+    await crd.async_refresh()
+    assert _call_counts() == [0, 0, 0]
+
+    mocked_data = {"a": {"state": 2}, "b": {"state": 1}}
+    await crd.async_refresh()
+    assert _call_counts() == [1, 0, 1]
+
+    mocked_data = {"a": {"state": 2}}
+    await crd.async_refresh()
+    assert _call_counts() == [0, 1, 1]
+
+    # Availability changes are sent to all listeners
+    mocked_exception = aiohttp.ClientError("Client Failure #1")
+    await crd.async_refresh()
+    assert _call_counts() == [1, 1, 1]
+
+    mocked_exception = None
+    await crd.async_refresh()
+    assert _call_counts() == [1, 1, 1]
+
+    crd.async_set_updated_data({"a": {"state": 2}, "b": {"state": 3}})
+    assert _call_counts() == [0, 1, 1]
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+
 async def test_timestamp_date_update_coordinator(hass: HomeAssistant) -> None:
     """Test last_update_success_time is set before calling listeners."""
     last_update_success_times: list[datetime | None] = []
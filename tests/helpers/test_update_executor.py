@@ -0,0 +1,166 @@
+"""Test the update executor."""
+
+import asyncio
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import update_executor
+from homeassistant.helpers.update_executor import (
+    UpdateExecutor,
+    async_get_update_executor,
+)
+
+
+async def test_integration_limit(hass: HomeAssistant) -> None:
+    """Test an integration over its limit does not hold up other integrations."""
+    executor = UpdateExecutor(hass, max_workers=4, integration_limit=2)
+    release = threading.Event()
+    tasks = [
+        hass.async_create_task(executor.async_run("slow", release.wait))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+
+    assert await executor.async_run("fast", lambda: "done") == "done"
+    stats = executor.as_dict()
+    assert stats["running"] == 2
+    assert stats["waiting"] == 1
+    slow = next(
+        integration
+        for integration in stats["integrations"]
+        if integration["integration"] == "slow"
+    )
+    assert slow["running"] == 2
+    assert slow["waiting"] == 1
+    assert slow["max_waiting"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    stats = executor.as_dict()
+    assert stats["running"] == 0
+    assert stats["waiting"] == 0
+    assert {
+        integration["integration"]: integration["jobs"]
+        for integration in stats["integrations"]
+    } == {"slow": 3, "fast": 1}
+
+    executor.async_reset()
+    assert executor.as_dict()["integrations"] == []
+
+
+async def test_waiting_updates_served_round_robin(hass: HomeAssistant) -> None:
+    """Test the integrations with waiting updates take turns."""
+    executor = UpdateExecutor(hass, max_workers=1)
+    release = threading.Event()
+    order: list[str] = []
+
+    def _update(name: str) -> None:
+        if name == "a1":
+            release.wait()
+        order.append(name)
+
+    tasks = [
+        hass.async_create_task(
+            executor.async_run(name[0], lambda name=name: _update(name))
+        )
+        for name in ("a1", "a2", "a3", "b1", "b2")
+    ]
+    await asyncio.sleep(0)
+    assert executor.as_dict()["waiting"] == 4
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["a1", "a2", "b1", "a3", "b2"]
+
+
+async def test_set_integration_limit(hass: HomeAssistant) -> None:
+    """Test raising the limit of an integration starts its waiting updates."""
+    executor = UpdateExecutor(hass, max_workers=4, integration_limit=1)
+    release = threading.Event()
+    tasks = [
+        hass.async_create_task(executor.async_run("test", release.wait))
+        for _ in range(2)
+    ]
+    await asyncio.sleep(0)
+    assert executor.as_dict()["waiting"] == 1
+
+    executor.async_set_integration_limit("test", 2)
+    assert executor.as_dict()["waiting"] == 0
+    assert executor.as_dict()["running"] == 2
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+
+async def test_set_parallel_updates(hass: HomeAssistant) -> None:
+    """Test the parallel updates of a platform only raise the integration limit."""
+    executor = UpdateExecutor(hass, max_workers=8, integration_limit=2)
+
+    def _limits() -> dict[str, int]:
+        for integration in ("one", "two", "zero"):
+            executor.stats.setdefault(integration, update_executor.UpdateJobStats())
+        return {
+            integration["integration"]: integration["limit"]
+            for integration in executor.as_dict()["integrations"]
+        }
+
+    executor.async_set_parallel_updates("one", 1)
+    executor.async_set_parallel_updates("two", 3)
+    executor.async_set_parallel_updates("zero", 0)
+    assert _limits() == {"one": 2, "two": 3, "zero": 8}
+
+    executor.async_set_parallel_updates("two", 1)
+    assert _limits() == {"one": 2, "two": 3, "zero": 8}
+
+
+async def test_cancel_waiting_update(hass: HomeAssistant) -> None:
+    """Test a cancelled update gives up its place in the queue."""
+    executor = UpdateExecutor(hass, max_workers=1)
+    release = threading.Event()
+    running = hass.async_create_task(executor.async_run("test", release.wait))
+    waiting = hass.async_create_task(executor.async_run("test", lambda: None))
+    await asyncio.sleep(0)
+    assert executor.as_dict()["waiting"] == 1
+
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    assert executor.as_dict()["waiting"] == 0
+
+    release.set()
+    await running
+    assert executor.as_dict()["running"] == 0
+    assert await executor.async_run("test", lambda: "done") == "done"
+
+
+async def test_slow_queue_warning(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test a warning is logged when an update waited long for a worker."""
+    executor = UpdateExecutor(hass, max_workers=1)
+    release = threading.Event()
+    running = hass.async_create_task(executor.async_run("test", release.wait))
+    await asyncio.sleep(0)
+
+    with patch.object(update_executor, "SLOW_QUEUE_WARNING", 0):
+        waiting = hass.async_create_task(executor.async_run("test", lambda: None))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(running, waiting)
+
+    assert "Update of test waited" in caplog.text
+    assert "for an executor worker" in caplog.text
+
+
+async def test_get_update_executor(hass: HomeAssistant) -> None:
+    """Test the update executor is shared and runs updates in its own workers."""
+    executor = async_get_update_executor(hass)
+    assert executor is async_get_update_executor(hass)
+
+    assert (
+        await executor.async_run("test", threading.get_ident) != threading.get_ident()
+    )
+    assert executor.as_dict()["integrations"][0]["integration"] == "test"
@@ -62,8 +62,9 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
-from homeassistant.util.async_ import create_eager_task
+from homeassistant.util.async_ import create_eager_task, get_scheduled_timer_handles
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -359,6 +360,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass.loop_stats.active = False
     calls = []
 
     def job():
@@ -372,6 +374,7 @@ async def test_async_run_eager_hass_job_calls_callback() -> None:
 async def test_async_run_eager_hass_job_calls_coro_function() -> None:
     """Test running coros from async_run_hass_job with eager_start."""
     hass = MagicMock()
+    hass.loop_stats.active = False
 
     async def job():
         pass
@@ -383,6 +386,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass.loop_stats.active = False
     calls = []
 
     def job():
@@ -396,6 +400,7 @@ async def test_async_run_hass_job_calls_callback() -> None:
 async def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
     hass = MagicMock()
+    hass.loop_stats.active = False
     calls = []
 
     def job():
@@ -1169,6 +1174,81 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for events by key."""
+    calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.kitchen", "light.bed"], listener
+    )
+    unsub_device = hass.bus.async_listen_keyed("test", "device_id", "abc", listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bed"})
+    hass.bus.async_fire("test", {"device_id": "abc"})
+    await hass.async_block_till_done()
+    assert [event.data for event in calls] == [
+        {"entity_id": "light.kitchen"},
+        {"entity_id": "light.bed"},
+        {"device_id": "abc"},
+    ]
+
+    unsub()
+    unsub_device()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    # Should do nothing now
+    unsub()
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", "light.bed", listener)
+
+
+async def test_eventbus_batch_listener(hass: HomeAssistant) -> None:
+    """Test we can listen for all events in lists."""
+    batches = []
+    old_count = hass.bus.async_listeners().get(MATCH_ALL, 0)
+
+    @ha.callback
+    def listener(events):
+        """Mock batch listener."""
+        batches.append([event.data for event in events])
+
+    unsub = hass.bus.async_listen_batch(listener)
+    assert hass.bus.async_listeners()[MATCH_ALL] == old_count + 1
+
+    hass.bus.async_fire("test", {"value": 1})
+    hass.bus.async_fire_internal(EVENT_STATE_REPORTED, {"entity_id": "light.bed"})
+    hass.bus.async_fire_batch_internal("test", [({"value": 2}, ha.Context())] * 2, 0)
+    await hass.async_block_till_done()
+    assert batches == [[{"value": 1}], [{"value": 2}, {"value": 2}]]
+
+    unsub()
+    assert hass.bus.async_listeners().get(MATCH_ALL, 0) == old_count
+    hass.bus.async_fire("test", {"value": 3})
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch(lambda events: None)
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1492,6 +1572,39 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_all_json(hass: HomeAssistant) -> None:
+    """Test the joined JSON of all states is kept until a state changes."""
+    hass.states.async_set("light.bowl", "on", {})
+    hass.states.async_set("switch.ac", "off", {})
+
+    all_json = hass.states.async_all_json()
+    assert json_loads(b"[" + all_json + b"]") == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert hass.states.async_all_json() is all_json
+    compressed_json = hass.states.async_all_json(compressed=True)
+    assert json_loads(b"{" + compressed_json + b"}") == {
+        state.entity_id: state.as_compressed_state for state in hass.states.async_all()
+    }
+    assert hass.states.async_all_json(compressed=True) is compressed_json
+
+    # Reporting the same state does not change the JSON
+    hass.states.async_set("light.bowl", "on", {})
+    assert hass.states.async_all_json() is all_json
+
+    hass.states.async_set("light.bowl", "off", {})
+    all_json = hass.states.async_all_json()
+    assert json_loads(b"[" + all_json + b"]") == [
+        state.as_dict() for state in hass.states.async_all()
+    ]
+    assert hass.states.async_all_json(compressed=True) is not compressed_json
+
+    hass.states.async_remove("switch.ac")
+    assert json_loads(b"[" + hass.states.async_all_json() + b"]") == [
+        hass.states.get("light.bowl").as_dict()
+    ]
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
@@ -1544,6 +1657,61 @@ async def test_statemachine_force_update(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test setting multiple states in one batch."""
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.old", "1")
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported = []
+    batches = []
+
+    @ha.callback
+    def reported_listener(event):
+        """Mock state reported listener."""
+        reported.append(event)
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batches.append(events)
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED, reported_listener, ha.callback(lambda data: True)
+    )
+    hass.bus.async_listen_batch(batch_listener)
+
+    with hass.states.async_batch():
+        hass.states.async_set_many(
+            [
+                ("sensor.power", "10", {"unit_of_measurement": "W"}),
+                ("Sensor.Energy", 5, {"unit_of_measurement": "kWh"}),
+                ("sensor.voltage", "230", None),
+            ]
+        )
+        hass.states.async_remove("sensor.old")
+        # Events are fired when the batch is done
+        assert events == []
+        assert hass.states.get("sensor.energy").state == "5"
+    await hass.async_block_till_done()
+
+    # sensor.power did not change so only a state_reported event is fired
+    assert [event.data["entity_id"] for event in events] == [
+        "sensor.energy",
+        "sensor.voltage",
+        "sensor.old",
+    ]
+    assert [event.data["entity_id"] for event in reported] == ["sensor.power"]
+    assert len({event.context.id for event in events + reported}) == 1
+    assert len({event.time_fired_timestamp for event in events + reported}) == 1
+    assert batches == [events]
+
+    energy = hass.states.get("sensor.energy")
+    assert energy.attributes == {"unit_of_measurement": "kWh"}
+    assert energy.last_updated == hass.states.get("sensor.voltage").last_updated
+    assert energy.last_updated == hass.states.get("sensor.power").last_reported
+    assert hass.states.get("sensor.voltage").attributes == {}
+
+
 async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> None:
     """Test async_set avoids recreating ReadOnly dicts when possible."""
     attrs = {"some_attr": "attr_value"}
@@ -3576,3 +3744,101 @@ async def test_async_set_updates_last_reported(hass: HomeAssistant) -> None:
         assert state.last_reported_timestamp != last_reported_timestamp
         last_reported = state.last_reported
         last_reported_timestamp = state.last_reported_timestamp
+
+
+async def test_loop_stats_track_jobs_and_events(hass: HomeAssistant) -> None:
+    """Test the loop stats track the jobs and events run in the loop."""
+    hass.loop_stats.async_reset()
+
+    @ha.callback
+    def listener(event: ha.Event) -> None:
+        """Mock listener."""
+
+    hass.bus.async_listen("test_loop_stats", listener)
+    # Nothing is tracked until the loop stats are started
+    hass.bus.async_fire("test_loop_stats")
+    assert not hass.loop_stats.active
+    assert hass.loop_stats.jobs == {}
+    assert hass.loop_stats.events == {}
+
+    hass.loop_stats.async_start()
+    hass.bus.async_fire("test_loop_stats")
+    hass.bus.async_fire("test_loop_stats")
+    hass.bus.async_fire("test_loop_stats_no_listeners")
+    hass.loop_stats.async_stop()
+    hass.bus.async_fire("test_loop_stats")
+
+    job_name = "tests.test_core.test_loop_stats_track_jobs_and_events.<locals>.listener"
+    assert hass.loop_stats.jobs[job_name].count == 2
+    assert hass.loop_stats.events["test_loop_stats"].count == 2
+    assert "test_loop_stats_no_listeners" not in hass.loop_stats.events
+
+    stats = hass.loop_stats.as_dict()
+    assert stats["active"] is False
+    assert stats["buckets"] == ha.LOOP_STATS_BUCKETS
+    assert stats["jobs"][job_name]["count"] == 2
+    assert sum(stats["events"]["test_loop_stats"]["buckets"].values()) == 2
+
+    hass.loop_stats.async_reset()
+    assert hass.loop_stats.as_dict()["jobs"] == {}
+    assert hass.loop_stats.as_dict()["events"] == {}
+
+
+async def test_loop_stats_job_stats_name() -> None:
+    """Test the name jobs are tracked as in the loop stats."""
+
+    def job() -> None:
+        """Mock job."""
+
+    class CallableJob:
+        def __call__(self) -> None:
+            """Mock job."""
+
+    assert ha.HassJob(job).stats_name == (
+        "tests.test_core.test_loop_stats_job_stats_name.<locals>.job"
+    )
+    assert ha.HassJob(functools.partial(job)).stats_name == (
+        "tests.test_core.test_loop_stats_job_stats_name.<locals>.job"
+    )
+    assert ha.HassJob(CallableJob()).stats_name == (
+        "tests.test_core.test_loop_stats_job_stats_name.<locals>.CallableJob"
+    )
+
+
+async def test_latency_histogram() -> None:
+    """Test the latency histogram buckets durations."""
+    histogram = ha.LatencyHistogram()
+    for duration in (0.00005, 0.0001, 0.005, 0.5, 2):
+        histogram.record(duration)
+
+    assert histogram.as_dict() == {
+        "count": 5,
+        "total": pytest.approx(2.50515),
+        "max": 2,
+        "buckets": {
+            "0.0001": 2,
+            "0.001": 0,
+            "0.01": 1,
+            "0.1": 0,
+            "1.0": 1,
+            "inf": 1,
+        },
+    }
+
+
+async def test_loop_stats_sample_loop_lag(hass: HomeAssistant) -> None:
+    """Test the loop lag is sampled until the loop stats are stopped."""
+    hass.loop_stats.async_reset()
+    with patch("homeassistant.core.LOOP_LAG_SAMPLE_INTERVAL", 0):
+        hass.loop_stats.async_start()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    hass.loop_stats.async_stop()
+
+    assert hass.loop_stats.loop_lag.count >= 1
+    assert not [
+        handle
+        for handle in get_scheduled_timer_handles(hass.loop)
+        if not handle.cancelled()
+        and getattr(handle._callback, "__self__", None) is hass.loop_stats
+    ]